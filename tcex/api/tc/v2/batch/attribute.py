@@ -1,13 +1,17 @@
 """ThreatConnect Batch Import Module"""
 # standard library
 import json
+import sys
 from typing import Callable, Optional
 
+# first-party
+from tcex.api.tc.v2.batch.batch_size import json_size
+
 
 class Attribute:
     """ThreatConnect Batch Attribute Object"""
 
-    __slots__ = ['_attribute_data', '_valid']
+    __slots__ = ['_displayed', '_source', '_type', '_value']
 
     def __init__(
         self,
@@ -27,65 +31,75 @@ class Attribute:
             formatter: A callable that take a single attribute
                 value and return a single formatted value.
         """
-        self._attribute_data = {'type': attr_type}
-        if displayed:
-            self._attribute_data['displayed'] = displayed
+        # attribute types are repeated on most entities of a batch job
+        self._type = sys.intern(attr_type) if isinstance(attr_type, str) else attr_type
+        self._displayed = displayed or None
 
         # format the value
         if formatter is not None:
             attr_value = formatter(attr_value)
-        self._attribute_data['value'] = attr_value
+        self._value = attr_value
 
         # add source if provided
-        if source is not None:
-            self._attribute_data['source'] = source
-
-        # is attr_value not null or ''
-        self._valid = True
-
-        # check for None and '' value only.
-        if attr_value in [None, '']:
-            self._valid = False
+        self._source = source
 
     @property
     def data(self) -> dict:
         """Return Attribute data."""
-        return self._attribute_data
+        attribute_data = {'type': self._type}
+        if self._displayed is not None:
+            attribute_data['displayed'] = self._displayed
+        attribute_data['value'] = self._value
+        if self._source is not None:
+            attribute_data['source'] = self._source
+        return attribute_data
+
+    @property
+    def data_size(self) -> int:
+        """Return the estimated size in bytes of the Attribute JSON data."""
+        # {"type": "", "value": ""}
+        size = 22 + json_size(self._type) + json_size(self._value)
+        if self._displayed is not None:
+            size += 17
+        if self._source is not None:
+            size += 12 + json_size(self._source)
+        return size
 
     @property
     def displayed(self) -> bool:
         """Return Attribute displayed."""
-        return self._attribute_data.get('displayed')
+        return self._displayed
 
     @displayed.setter
     def displayed(self, displayed: bool):
         """Set Attribute displayed."""
-        self._attribute_data['displayed'] = displayed
+        self._displayed = displayed
 
     @property
     def source(self) -> str:
         """Return Attribute source."""
-        return self._attribute_data.get('source')
+        return self._source
 
     @source.setter
     def source(self, source: str):
         """Set Attribute source."""
-        self._attribute_data['source'] = source
+        self._source = source
 
     @property
     def type(self) -> str:
         """Return attribute value."""
-        return self._attribute_data.get('type')
+        return self._type
 
     @property
     def valid(self) -> bool:
         """Return valid value."""
-        return self._valid
+        # check for None and '' value only.
+        return self._value not in [None, '']
 
     @property
     def value(self) -> str:
         """Return attribute value."""
-        return self._attribute_data.get('value')
+        return self._value
 
     def __str__(self) -> str:
         """Return string representation of object."""
@@ -1,26 +1,28 @@
 """ThreatConnect Batch Import Module."""
 # standard library
 import gzip
+import io
 import json
 import os
-import sys
+import shutil
 import threading
 import time
 import traceback
-from collections import deque
-from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple, Union
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import IO, TYPE_CHECKING, Any, Callable, Iterable, List, Optional, Union
 
 # third-party
 from requests import Response, Session
 
 # first-party
+from tcex.api.tc.v2.batch.batch_serializer import BatchSerializer
+from tcex.api.tc.v2.batch.batch_size import BatchSize
 from tcex.api.tc.v2.batch.batch_submit import BatchSubmit
 from tcex.api.tc.v2.batch.batch_writer import BatchWriter
 from tcex.exit.error_codes import handle_error
 
 if TYPE_CHECKING:
     # first-party
-    from tcex.api.tc.v2.batch.batch_writer import GroupType, IndicatorType
     from tcex.input import Input
 
 
@@ -77,10 +79,17 @@ class Batch(BatchWriter, BatchSubmit):
         # properties
         self._batch_max_chunk = 5_000
         self._batch_max_size = 75_000_000  # max size in bytes
+        self._file_futures = []
         self._file_merge_mode = None
-        self._file_threads = []
+        self._file_pool = None
+        self._file_upload_lock = threading.Lock()
+        self._file_upload_status = {'failed': 0, 'skipped': 0, 'uploaded': 0}
+        self.file_upload_retries = 3  # number of retries for a failed file upload
+        self.file_upload_workers = 4  # max number of concurrent file uploads
         self._hash_collision_mode = None
         self._submit_thread = None
+        # number of times to resubmit groups/indicators that failed with a transient error
+        self.retry_failed = 0
 
         # global overrides on batch/file errors
         self._halt_on_batch_error = None
@@ -95,8 +104,7 @@ class Batch(BatchWriter, BatchSubmit):
 
         # default properties
         self._batch_data_count = None
-        self._poll_interval = None
-        self._poll_interval_times = []
+        self._poll_scheduler = None
         self._poll_timeout = 3600
 
         # batch debug/replay variables
@@ -108,68 +116,17 @@ class Batch(BatchWriter, BatchSubmit):
         self.debug_path_files = os.path.join(self.debug_path, 'batch_files')
         self.debug_path_xids = os.path.join(self.debug_path, 'xids-saved')
 
-    def _group(
-        self, group_data: Union[dict, 'GroupType'], store: Optional[bool] = True
-    ) -> Union[dict, 'GroupType']:
-        """Return previously stored group or new group.
+    def _batch_size_max(self):
+        """Handle the max batch size being reached.
 
-        Args:
-            group_data: An Group dict or instance of GroupType.
-            store: If True the group data will be stored in instance list.
-
-        Returns:
-            (dict|GroupType): The new Group dict/GroupType or the previously stored dict/GroupType.
-        """
-        if store is False:
-            return group_data
-
-        if isinstance(group_data, dict):
-            # get xid from dict
-            xid = group_data.get('xid')
-        else:
-            # get xid from GroupType
-            xid = group_data.xid
-
-        if self.groups.get(xid) is not None:
-            # return existing group from memory
-            group_data = self.groups.get(xid)
-        elif self.groups_shelf.get(xid) is not None:
-            # return existing group from shelf
-            group_data = self.groups_shelf.get(xid)
-        else:
-            # store new group
-            self.groups[xid] = group_data
-        return group_data
-
-    def _indicator(
-        self, indicator_data: Union[dict, 'IndicatorType'], store: Optional[bool] = True
-    ) -> Union[dict, 'IndicatorType']:
-        """Return previously stored indicator or new indicator.
-
-        Args:
-            indicator_data: An Indicator dict or instance of IndicatorType.
-            store: If True the indicator data will be stored in instance list.
+        Batch data is held in memory until submitted, so only a warning is logged.
         """
-        if store is False:
-            return indicator_data
-
-        if isinstance(indicator_data, dict):
-            # get xid from dict
-            xid = indicator_data.get('xid')
-        else:
-            # get xid from IndicatorType
-            xid = indicator_data.xid
-
-        if self.indicators.get(xid) is not None:
-            # return existing indicator from memory
-            indicator_data = self.indicators.get(xid)
-        elif self.indicators_shelf.get(xid) is not None:
-            # return existing indicator from shelf
-            indicator_data = self.indicators_shelf.get(xid)
-        else:
-            # store new indicators
-            self.indicators[xid] = indicator_data
-        return indicator_data
+        self.log.warning(
+            '''feature=batch, event=batch-size-max, '''
+            f'''size={self._batch_size.value:,}, max-size={self._batch_max_size:,}'''
+        )
+        # reset batch size so the warning is logged once per max batch size
+        self._batch_size = BatchSize()
 
     def close(self):
         """Cleanup batch job."""
@@ -177,9 +134,21 @@ class Batch(BatchWriter, BatchSubmit):
         if hasattr(self._submit_thread, 'is_alive'):
             self._submit_thread.join()
 
-        # allow file threads to complete before wrapping up job
-        for t in self._file_threads:
-            t.join()
+        # allow file uploads to complete before wrapping up job
+        for f in self._file_futures:
+            if f.exception() is not None:
+                self.log.warning(
+                    f'feature=batch, event=file-upload-error, err="""{f.exception()}"""'
+                )
+        if self._file_pool is not None:
+            self._file_pool.shutdown(wait=True)
+            self._file_pool = None
+        if self._file_futures:
+            self.log.info(
+                f'feature=batch, event=file-upload-summary, '
+                f'{", ".join(f"{k}={v}" for k, v in self.file_upload_status.items())}'
+            )
+        self._file_futures = []
 
         self.groups_shelf.close()
         self.indicators_shelf.close()
@@ -187,193 +156,9 @@ class Batch(BatchWriter, BatchSubmit):
             # delete saved files
             if os.path.isfile(self.group_shelf_fqfn):
                 os.remove(self.group_shelf_fqfn)
-            if os.path.isfile(self.group_shelf_fqfn):
+            if os.path.isfile(self.indicator_shelf_fqfn):
                 os.remove(self.indicator_shelf_fqfn)
 
-    @property
-    def data(self) -> dict:
-        """Return the batch indicator/group and file data to be sent to the ThreatConnect API.
-
-        **Processing Order:**
-        * Process groups in memory up to max batch size.
-        * Process groups in shelf to max batch size.
-        * Process indicators in memory up to max batch size.
-        * Process indicators in shelf up to max batch size.
-
-        This method will remove the group/indicator from memory and/or shelf.
-
-        Returns:
-            dict: A dictionary of group, indicators, and/or file data.
-        """
-        data = {'file': {}, 'group': [], 'indicator': []}
-        tracker = {'count': 0, 'bytes': 0}
-
-        # process group from memory, returning if max values have been reached
-        if self.data_groups(data, self.groups, tracker) is True:
-            return data
-
-        # process group from shelf file, returning if max values have been reached
-        if self.data_groups(data, self.groups_shelf, tracker) is True:
-            return data
-
-        # process indicator from memory, returning if max values have been reached
-        if self.data_indicators(data, self.indicators, tracker) is True:
-            return data
-
-        # process indicator from shelf file, returning if max values have been reached
-        if self.data_indicators(data, self.indicators_shelf, tracker) is True:
-            return data
-
-        return data
-
-    def data_group_association(self, data: dict, tracker: dict, xid: str):
-        """Return group dict array following all associations.
-
-        The *data* dict is passed by reference to make it easier to update both the group data
-        and file data inline versus passing the data all the way back up to the calling methods.
-
-        Args:
-            data: The data dict to update with group and file data.
-            tracker: A dict containing total count of all entities collected and
-                the total size in bytes of all entities collected.
-            xid: The xid of the group to retrieve associations.
-        """
-        xids = deque()
-        xids.append(xid)
-
-        while xids:
-            xid = xids.popleft()  # remove current xid
-            group_data = None
-
-            if xid in self.groups:
-                group_data = self.groups.get(xid)
-                del self.groups[xid]
-            elif xid in self.groups_shelf:
-                group_data = self.groups_shelf.get(xid)
-                del self.groups_shelf[xid]
-
-            if group_data:
-                file_data, group_data = self.data_group_type(group_data)
-                data['group'].append(group_data)
-                if file_data:
-                    data['file'][xid] = file_data
-
-                # update entity trackers
-                tracker['count'] += 1
-                tracker['bytes'] += sys.getsizeof(json.dumps(group_data))
-
-                # extend xids with any groups associated with the same GroupType
-                xids.extend(group_data.get('associatedGroupXid', []))
-
-    @staticmethod
-    def data_group_type(group_data: Union[dict, 'GroupType']) -> Tuple[dict, dict]:
-        """Return dict representation of group data and file data.
-
-        Args:
-            group_data: The group data dict or GroupType.
-
-        Returns:
-            Tuple[dict, dict]: A tuple containing file_data and group_data.
-        """
-        file_data = {}
-        if isinstance(group_data, dict):
-            # process file content
-            file_content = group_data.pop('fileContent', None)
-            if file_content is not None:
-                file_data = {
-                    'fileContent': file_content,
-                    'fileName': group_data.get('fileName'),
-                    'type': group_data.get('type'),
-                }
-        else:
-            # get the file data from the GroupType and return dict format of GroupType
-            if group_data.data.get('type') in ['Document', 'Report']:
-                file_data = group_data.file_data
-            group_data = group_data.data
-
-        return file_data, group_data
-
-    def data_groups(self, data: dict, groups: list, tracker: dict) -> bool:
-        """Process Group data.
-
-        Args:
-            data: The data dict to update with group and file data.
-            groups: The list of groups to process.
-            tracker: A dict containing total count of all entities collected and
-                the total size in bytes of all entities collected.
-
-        Returns:
-            bool: True if max values have been hit, else False.
-        """
-        # convert groups.keys() to a list to prevent dictionary change error caused by
-        # the data_group_association function deleting items from the GroupType.
-
-        # process the group
-        for xid in list(groups.keys()):
-            # get association from group data
-            self.data_group_association(data, tracker, xid)
-
-            if tracker.get('count') % 2_500 == 0:
-                # log count/size at a sane level
-                self.log.info(
-                    '''feature=batch, action=data-groups, '''
-                    f'''count={tracker.get('count'):,}, bytes={tracker.get('bytes'):,}'''
-                )
-
-            if (
-                tracker.get('count') >= self._batch_max_chunk
-                or tracker.get('bytes') >= self._batch_max_size
-            ):
-                # stop processing xid once max limit are reached
-                self.log.info(
-                    '''feature=batch, event=max-value-reached, '''
-                    f'''count={tracker.get('count'):,}, bytes={tracker.get('bytes'):,}'''
-                )
-                return True
-        return False
-
-    def data_indicators(self, data: dict, indicators: list, tracker: dict) -> bool:
-        """Process Indicator data.
-
-        Args:
-            data: The data dict to update with group and file data.
-            indicators: The list of indicators to process.
-            tracker: A dict containing total count of all entities collected and
-                the total size in bytes of all entities collected.
-
-        Returns:
-            bool: True if max values have been hit, else False.
-        """
-        # process the indicators
-        for xid, indicator_data in list(indicators.items()):
-            if not isinstance(indicator_data, dict):
-                indicator_data = indicator_data.data
-            data['indicator'].append(indicator_data)
-            del indicators[xid]
-
-            # update entity trackers
-            tracker['count'] += 1
-            tracker['bytes'] += sys.getsizeof(json.dumps(indicator_data))
-
-            if tracker.get('count') % 2_500 == 0:
-                # log count/size at a sane level
-                self.log.info(
-                    '''feature=batch, action=data-indicators, '''
-                    f'''count={tracker.get('count'):,}, bytes={tracker.get('bytes'):,}'''
-                )
-
-            if (
-                tracker.get('count') >= self._batch_max_chunk
-                or tracker.get('bytes') >= self._batch_max_size
-            ):
-                # stop processing xid once max limit are reached
-                self.log.info(
-                    '''feature=batch, event=max-value-reached, '''
-                    f'''count={tracker.get('count'):,}, bytes={tracker.get('bytes'):,}'''
-                )
-                return True
-        return False
-
     @property
     def debug(self):
         """Return debug setting"""
@@ -396,6 +181,27 @@ class Batch(BatchWriter, BatchSubmit):
                 self._debug = True
         return self._debug
 
+    def _file_upload_status_update(self, key: str):
+        """Increment the aggregate file upload status count for the provided key."""
+        with self._file_upload_lock:
+            self._file_upload_status[key] += 1
+
+    @property
+    def file_pool(self) -> ThreadPoolExecutor:
+        """Return the shared file upload pool."""
+        with self._file_upload_lock:
+            if self._file_pool is None:
+                self._file_pool = ThreadPoolExecutor(
+                    max_workers=self.file_upload_workers, thread_name_prefix='submit-files'
+                )
+        return self._file_pool
+
+    @property
+    def file_upload_status(self) -> dict:
+        """Return the aggregate count of uploaded, failed, and skipped files."""
+        with self._file_upload_lock:
+            return dict(self._file_upload_status)
+
     @property
     def halt_on_file_error(self) -> bool:
         """Return halt on file post error value."""
@@ -407,6 +213,30 @@ class Batch(BatchWriter, BatchSubmit):
         if isinstance(value, bool):
             self._halt_on_file_error = value
 
+    @staticmethod
+    def _file_content_write(fh: IO[bytes], content: Union[bytes, str, IO, Iterable[bytes]]):
+        """Write the file content for a Document or Report to a binary file object.
+
+        Strings are encoded as utf-8, file objects and iterables are streamed in chunks.
+
+        Args:
+            fh: The binary file object to write to.
+            content: The file content (bytes, str, file object, or iterable of bytes).
+        """
+        if isinstance(content, bytes):
+            fh.write(content)
+            return
+        if isinstance(content, str):
+            fh.write(content.encode('utf-8'))
+            return
+        if hasattr(content, 'read'):
+            if not isinstance(content, io.TextIOBase):
+                shutil.copyfileobj(content, fh)
+                return
+            content = iter(lambda c=content: c.read(65_536), '')
+        for chunk in content:
+            fh.write(chunk if isinstance(chunk, bytes) else chunk.encode('utf-8'))
+
     def process_all(self, process_files: Optional[bool] = True):
         """Process Batch request to ThreatConnect API.
 
@@ -414,7 +244,7 @@ class Batch(BatchWriter, BatchSubmit):
             process_files: Send any document or report attachments to the API.
         """
         while True:
-            content = self.data
+            content = self.data_serialized()
             file_data = content.pop('file', {})
             if not content.get('group') and not content.get('indicator'):
                 break
@@ -431,9 +261,11 @@ class Batch(BatchWriter, BatchSubmit):
                 '''feature=batch, event=process-all, type=indicator, '''
                 f'''count={len(content.get('indicator')):,}'''
             )
+            content.close()
 
-        if process_files:
-            self.process_files(file_data)
+            if process_files:
+                # each chunk carries the file data for the groups it contains
+                self.process_files(file_data)
 
     def process_files(self, file_data: dict):
         """Process Files for Documents and Reports to ThreatConnect API.
@@ -478,8 +310,13 @@ class Batch(BatchWriter, BatchSubmit):
                 continue
 
             # write the file to disk
-            with open(fqfn, 'wb') as fh:
-                fh.write(content)
+            try:
+                with open(fqfn, 'wb') as fh:
+                    self._file_content_write(fh, content)
+            finally:
+                if hasattr(content, 'close') and content is not content_data.get('fileContent'):
+                    # close file objects created by the file content callback
+                    content.close()
 
     @property
     def saved_groups(self) -> bool:
@@ -559,15 +396,17 @@ class Batch(BatchWriter, BatchSubmit):
             dict: The Batch Status from the ThreatConnect API.
         """
         # get file, group, and indicator data
-        content = self.data
+        content = self.data_serialized()
 
         # pop any file content to pass to submit_files
         file_data = content.pop('file', {})
+        count = len(content.get('group')) + len(content.get('indicator'))
         batch_data = (
             self.submit_create_and_upload(content=content, halt_on_error=halt_on_error)
             .get('data', {})
             .get('batchStatus', {})
         )
+        content.close()
         batch_id = batch_data.get('id')
         if batch_id is not None:
             self.log.info(f'feature=batch, event=submit, batch-id={batch_id}')
@@ -575,7 +414,7 @@ class Batch(BatchWriter, BatchSubmit):
             if poll:
                 # poll for status
                 batch_data = (
-                    self.poll(batch_id=batch_id, halt_on_error=halt_on_error)
+                    self.poll(batch_id=batch_id, halt_on_error=halt_on_error, count=count)
                     .get('data', {})
                     .get('batchStatus')
                 )
@@ -591,16 +430,7 @@ class Batch(BatchWriter, BatchSubmit):
 
         if process_files:
             # submit file data after batch job is complete
-            self._file_threads.append(
-                self.submit_thread(
-                    name='submit-files',
-                    target=self.submit_files,
-                    args=(
-                        file_data,
-                        halt_on_error,
-                    ),
-                )
-            )
+            self.submit_files_async(file_data, halt_on_error)
         return batch_data
 
     def submit_all(
@@ -624,6 +454,9 @@ class Batch(BatchWriter, BatchSubmit):
         Each of these methods can also be called on their own for greater control of the submit
         process.
 
+        If retry_failed is set, groups and indicators that failed with a transient error are
+        resubmitted up to retry_failed times (only if poll is True).
+
         Args:
             poll: If True poll batch for status.
             errors: If True retrieve any batch errors (only if poll is True).
@@ -634,79 +467,129 @@ class Batch(BatchWriter, BatchSubmit):
             dict: The Batch Status from the ThreatConnect API.
         """
         batch_data_array = []
-        file_data = {}
         while True:
-            batch_data = {}
-            batch_id = None
-
             # get file, group, and indicator data
-            content = self.data
+            content = self.data_serialized(track_entities=self.retry_failed > 0)
 
             # break loop when end of data is reached
             if not content.get('group') and not content.get('indicator'):
+                content.close()
                 break
 
-            if self.action.lower() == 'delete':
-                # no need to process files on a delete batch job
-                process_files = False
+            batch_data_array.append(
+                self.submit_content(content, poll, errors, process_files, halt_on_error)
+            )
 
-                # while waiting of FR for delete support in createAndUpload submit delete request
-                # the old way (submit job + submit data), still using V2.
-                if len(content) > 0:  # pylint: disable=len-as-condition
-                    batch_id = self.submit_job(halt_on_error)
-                    if batch_id is not None:
-                        batch_data = self.submit_data(
-                            batch_id=batch_id, content=content, halt_on_error=halt_on_error
-                        )
-                else:
-                    batch_data = {}
-            else:
-                # pop any file content to pass to submit_files
-                file_data = content.pop('file', {})
-                batch_data = (
-                    self.submit_create_and_upload(content=content, halt_on_error=halt_on_error)
-                    .get('data', {})
-                    .get('batchStatus', {})
-                )
-                batch_id = batch_data.get('id')
+        return batch_data_array
 
-            if batch_id is not None:
-                self.log.info(f'feature=batch, event=status, batch-id={batch_id}')
-                # job hit queue
-                if poll:
-                    # poll for status
-                    batch_data = (
-                        self.poll(batch_id, halt_on_error=halt_on_error)
-                        .get('data', {})
-                        .get('batchStatus')
-                    )
-                    if errors:
-                        # retrieve errors
-                        error_count = batch_data.get('errorCount', 0)
-                        error_groups = batch_data.get('errorGroupCount', 0)
-                        error_indicators = batch_data.get('errorIndicatorCount', 0)
-                        if error_count > 0 or error_groups > 0 or error_indicators > 0:
-                            batch_data['errors'] = self.errors(batch_id)
-                else:
-                    # can't process files if status is unknown (polling must be enabled)
-                    process_files = False
+    def submit_all_pipelined(
+        self,
+        max_in_flight: Optional[int] = 3,
+        poll: Optional[bool] = True,
+        errors: Optional[bool] = True,
+        process_files: Optional[bool] = True,
+        halt_on_error: Optional[bool] = True,
+    ) -> list:
+        """Submit Batch request to ThreatConnect API with multiple batch jobs in flight.
 
-            if process_files:
-                # submit file data after batch job is complete
-                self._file_threads.append(
-                    self.submit_thread(
-                        name='submit-files',
-                        target=self.submit_files,
-                        args=(
-                            file_data,
-                            halt_on_error,
-                        ),
+        This method works like submit_all, but the upload, poll, and error retrieval for each
+        batch chunk are run on a bounded pool of worker threads. The next chunk is serialized
+        while previous chunks are uploaded and polled. No more than *max_in_flight* chunks are
+        serialized or submitted at any time.
+
+        A chunk that has entities associated with groups created by a previous chunk is held
+        back until that chunk has completed, so the groups exist when the associations are
+        processed (when *poll* is False a chunk is complete once it is submitted).
+
+        Submission of new chunks stops on the first exception or on a batch error that matches
+        a critical failure (e.g., indicator limit reached). Any data not yet submitted will
+        remain in the batch.
+
+        Args:
+            max_in_flight: The max number of batch jobs submitted concurrently.
+            poll: If True poll batch for status.
+            errors: If True retrieve any batch errors (only if poll is True).
+            process_files: If true send any document or report attachments to the API.
+            halt_on_error: If True any exception will raise an error.
+
+        Returns.
+            list: The Batch Status from the ThreatConnect API for each chunk in submission order.
+        """
+        max_in_flight = max(int(max_in_flight), 1)
+
+        def critical_error(futures: list) -> Optional[str]:
+            """Return the first exception or critical failure of any completed batch job."""
+            for future in futures:
+                if not future.done():
+                    continue
+                if future.exception() is not None:
+                    return str(future.exception())
+                failure = self.critical_failure(future.result().get('errors'))
+                if failure is not None:
+                    return failure
+            return None
+
+        def submit_content(depends: set, content: BatchSerializer) -> dict:
+            """Submit the chunk once the chunks that create its associated groups complete."""
+            if depends:
+                wait(depends)
+            return self.submit_content(content, poll, errors, process_files, halt_on_error)
+
+        futures = []
+        failure = None
+        # the batch job of the chunk that created each group
+        group_futures = {}
+        with ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix='submit-batch'
+        ) as executor:
+            while True:
+                # block until a worker is free so that serialized chunks do not pile up
+                in_flight = [f for f in futures if not f.done()]
+                if len(in_flight) >= max_in_flight:
+                    wait(in_flight, return_when=FIRST_COMPLETED)
+
+                # stop submitting new chunks on any failure
+                failure = critical_error(futures)
+                if failure is not None:
+                    self.log.warning(
+                        f'feature=batch, event=pipeline-halted, in-flight={len(in_flight)}, '
+                        f'error="""{failure}"""'
                     )
+                    break
+
+                # get file, group, and indicator data
+                content = self.data_serialized(track_entities=self.retry_failed > 0)
+
+                # break loop when end of data is reached
+                if not content.get('group') and not content.get('indicator'):
+                    content.close()
+                    break
+
+                self.log.info(
+                    f'feature=batch, event=pipeline-submit, chunk={len(futures) + 1}, '
+                    f'in-flight={len(in_flight) + 1}'
                 )
-            batch_data_array.append(batch_data)
+                # earlier chunks always start first, so waiting on them can not deadlock the pool
+                depends = {
+                    group_futures[xid] for xid in content.association_xids if xid in group_futures
+                }
+                if depends:
+                    self.log.debug(
+                        f'feature=batch, event=pipeline-hold, chunk={len(futures) + 1}, '
+                        f'depends={len(depends)}'
+                    )
+                future = executor.submit(submit_content, depends, content)
+                futures.append(future)
+                for xid in content.group_xids:
+                    group_futures[xid] = future
 
-            # write errors for debugging
-            self.write_error_json(batch_data.get('errors'))
+        # results are returned in submission order, re-raising the first exception
+        batch_data_array = [f.result() for f in futures]
+
+        # critical failures are raised even if the job that hit them did not raise
+        failure = failure or critical_error(futures)
+        if failure is not None:
+            handle_error(code=10500, message_values=[failure], raise_error=halt_on_error)
 
         return batch_data_array
 
@@ -741,7 +624,7 @@ class Batch(BatchWriter, BatchSubmit):
             # process content
             pass
         else:
-            content = self.data
+            content = self.data_serialized()
         file_data = content.pop('file', {})
 
         # return False when end of data is reached
@@ -761,11 +644,14 @@ class Batch(BatchWriter, BatchSubmit):
             )
 
         # submit the data and collect the response
+        count = len(content.get('group', [])) + len(content.get('indicator', []))
         batch_data: dict = (
             self.submit_create_and_upload(content=content, halt_on_error=halt_on_error)
             .get('data', {})
             .get('batchStatus', {})
         )
+        if isinstance(content, BatchSerializer):
+            content.close()
         self.log.trace(f'feature=batch, event=submit-callback, batch-data={batch_data}')
 
         # launch batch polling in a thread
@@ -773,6 +659,7 @@ class Batch(BatchWriter, BatchSubmit):
             name='submit-poll',
             target=self.submit_callback_thread,
             args=(batch_data, callback, file_data),
+            kwargs={'count': count},
         )
 
         return True
@@ -783,6 +670,7 @@ class Batch(BatchWriter, BatchSubmit):
         callback: Callable[..., Any],
         file_data: dict,
         halt_on_error: Optional[bool] = True,
+        count: Optional[int] = None,
     ):
         """Submit data in a thread."""
         batch_id = batch_data.get('id')
@@ -793,7 +681,9 @@ class Batch(BatchWriter, BatchSubmit):
 
             # poll for status
             batch_status = (
-                self.poll(batch_id, halt_on_error=halt_on_error).get('data', {}).get('batchStatus')
+                self.poll(batch_id, halt_on_error=halt_on_error, count=count)
+                .get('data', {})
+                .get('batchStatus')
             )
 
             # retrieve errors
@@ -805,20 +695,11 @@ class Batch(BatchWriter, BatchSubmit):
         else:
             batch_status = batch_data
 
-        # launch file upload in a thread *after* batch status is returned. while only one batch
-        # submission thread is allowed, there is no limit on file upload threads. the upload
-        # status returned by file upload will be ignored when running in a thread.
+        # queue file upload *after* batch status is returned. uploads for all batch submissions
+        # share the bounded file upload pool. the upload status returned by file upload will be
+        # ignored when running in the pool.
         if file_data:
-            self._file_threads.append(
-                self.submit_thread(
-                    name='submit-files',
-                    target=self.submit_files,
-                    args=(
-                        file_data,
-                        halt_on_error,
-                    ),
-                )
-            )
+            self.submit_files_async(file_data, halt_on_error)
 
         # send batch_status to callback
         if callable(callback):
@@ -828,11 +709,116 @@ class Batch(BatchWriter, BatchSubmit):
             except Exception as e:
                 self.log.warning(f'feature=batch, event=callback-error, err="""{e}"""')
 
-    def submit_create_and_upload(self, content: dict, halt_on_error: Optional[bool] = True) -> dict:
+    def submit_content(
+        self,
+        content: 'BatchSerializer',
+        poll: Optional[bool] = True,
+        errors: Optional[bool] = True,
+        process_files: Optional[bool] = True,
+        halt_on_error: Optional[bool] = True,
+        retry: Optional[int] = None,
+    ) -> dict:
+        """Submit a single batch chunk to ThreatConnect API.
+
+        When retry is enabled and the content was serialized with entity tracking, the groups and
+        indicators that failed with a transient error are resubmitted in a follow-up batch job.
+        The status of the follow-up batch job is added to the returned status as "retry".
+
+        Args:
+            content: The serialized group, indicator, and file data for the batch chunk.
+            poll: If True poll batch for status.
+            errors: If True retrieve any batch errors (only if poll is True).
+            process_files: If true send any document or report attachments to the API.
+            halt_on_error: If True any exception will raise an error.
+            retry: The number of times to resubmit failed entities, defaults to retry_failed.
+
+        Returns.
+            dict: The Batch Status from the ThreatConnect API.
+        """
+        if retry is None:
+            retry = self.retry_failed
+        # failed entities can only be resubmitted if they were indexed on serialization
+        retry = retry if content.track_entities else 0
+
+        batch_data = {}
+        batch_id = None
+        count = len(content.get('group')) + len(content.get('indicator'))
+        file_data = {}
+
+        if self.action.lower() == 'delete':
+            # no need to process files on a delete batch job
+            process_files = False
+
+            # while waiting of FR for delete support in createAndUpload submit delete request
+            # the old way (submit job + submit data), still using V2.
+            batch_id = self.submit_job(halt_on_error)
+            if batch_id is not None:
+                batch_data = self.submit_data(
+                    batch_id=batch_id, content=content, halt_on_error=halt_on_error
+                )
+        else:
+            # pop any file content to pass to submit_files
+            file_data = content.pop('file', {})
+            batch_data = (
+                self.submit_create_and_upload(content=content, halt_on_error=halt_on_error)
+                .get('data', {})
+                .get('batchStatus', {})
+            )
+            batch_id = batch_data.get('id')
+        if retry == 0:
+            content.close()
+
+        if batch_id is not None:
+            self.log.info(f'feature=batch, event=status, batch-id={batch_id}')
+            # job hit queue
+            if poll:
+                # poll for status
+                batch_data = (
+                    self.poll(batch_id, halt_on_error=halt_on_error, count=count)
+                    .get('data', {})
+                    .get('batchStatus')
+                )
+                if errors:
+                    # retrieve errors
+                    error_count = batch_data.get('errorCount', 0)
+                    error_groups = batch_data.get('errorGroupCount', 0)
+                    error_indicators = batch_data.get('errorIndicatorCount', 0)
+                    if error_count > 0 or error_groups > 0 or error_indicators > 0:
+                        batch_data['errors'] = self.errors(batch_id)
+                if retry > 0 and (
+                    batch_data.get('errorCount', 0) > 0
+                    or batch_data.get('errorGroupCount', 0) > 0
+                    or batch_data.get('errorIndicatorCount', 0) > 0
+                ):
+                    batch_data['retry'] = self.submit_retry(
+                        content, batch_data, file_data, errors, process_files, halt_on_error, retry
+                    )
+            else:
+                # can't process files if status is unknown (polling must be enabled)
+                process_files = False
+
+        if process_files:
+            # submit file data after batch job is complete
+            self.submit_files_async(file_data, halt_on_error)
+
+        if retry > 0:
+            content.close()
+
+        # write errors for debugging
+        self.write_error_json(batch_data.get('errors'))
+
+        return batch_data
+
+    def submit_create_and_upload(
+        self, content: Union[dict, BatchSerializer], halt_on_error: Optional[bool] = True
+    ) -> dict:
         """Submit Batch request to ThreatConnect API.
 
+        When content is a BatchSerializer the multipart body is streamed from a spooled temporary
+        file instead of being built in memory.
+
         Args:
-            content: The dict of groups and indicator data.
+            content: The dict of groups and indicator data or a BatchSerializer.
             halt_on_error: If True the process should halt if any errors are encountered.
 
         Returns.
@@ -856,9 +842,19 @@ class Batch(BatchWriter, BatchSubmit):
         )
 
         try:
-            files = (('config', json.dumps(self.settings)), ('content', json.dumps(content)))
             params = {'includeAdditional': 'true'}
-            r = self.session_tc.post('/v2/batch/createAndUpload', files=files, params=params)
+            if isinstance(content, BatchSerializer):
+                body, content_type = content.multipart_body(self.settings)
+                with body:
+                    r = self.session_tc.post(
+                        '/v2/batch/createAndUpload',
+                        data=body,
+                        headers={'Content-Type': content_type},
+                        params=params,
+                    )
+            else:
+                files = (('config', json.dumps(self.settings)), ('content', json.dumps(content)))
+                r = self.session_tc.post('/v2/batch/createAndUpload', files=files, params=params)
             if not r.ok or 'application/json' not in r.headers.get('content-type', ''):
                 handle_error(
                     code=10510,
@@ -871,7 +867,150 @@ class Batch(BatchWriter, BatchSubmit):
 
         return {}
 
-    def submit_files(self, file_data: dict, halt_on_error: Optional[bool] = True) -> dict:
+    def submit_file(
+        self, xid: str, content_data: dict, halt_on_error: Optional[bool] = True
+    ) -> dict:
+        """Upload the file for a single Document or Report to ThreatConnect API.
+
+        Failed uploads (connection errors, 429, and 5xx responses) are retried up to
+        file_upload_retries times if the file content can be read again.
+
+        Args:
+            xid: The xid of the Document or Report.
+            content_data: The file data (fileContent, fileName, and type) for the group.
+            halt_on_error: If True any exception will raise an error.
+
+        Returns:
+            dict: The upload status for the xid.
+        """
+        api_branch = 'documents'
+        if content_data.get('type') == 'Report':
+            api_branch = 'reports'
+
+        # Post File
+        url = f'/v2/groups/{api_branch}/{xid}/upload'
+        headers = {'Content-Type': 'application/octet-stream'}
+        params = {'owner': self._owner, 'updateIfExists': 'true'}
+
+        # content provided as an iterator or non-seekable stream can only be read once
+        file_content = content_data.get('fileContent')
+        replayable = (
+            isinstance(file_content, (bytes, str))
+            or callable(file_content)
+            or getattr(file_content, 'seekable', lambda: False)()
+        )
+
+        attempt = 0
+        method = 'POST'
+        r = None
+        while True:
+            content = self.submit_file_body(xid, content_data, api_branch)
+            if content is None:
+                self.log.warning(f'feature=batch-submit-files, xid={xid}, event=content-null')
+                self._file_upload_status_update('failed')
+                return {'uploaded': False, 'xid': xid}
+
+            try:
+                r = self.submit_file_content(method, url, content, headers, params, False)
+            finally:
+                if hasattr(content, 'close') and content is not content_data.get('fileContent'):
+                    # close file objects created by the file content callback or debug writer
+                    content.close()
+
+            if r is not None and r.status_code == 401 and method == 'POST':
+                if not replayable:
+                    self.log.warning(
+                        f'feature=batch, event=401-from-post, action=fail-upload, xid={xid}, '
+                        'reason=content-not-replayable'
+                    )
+                    break
+
+                # use PUT method if file already exists
+                self.log.info('feature=batch, event=401-from-post, action=switch-to-put')
+                method = 'PUT'
+                continue
+
+            if r is not None and r.status_code != 429 and r.status_code < 500:
+                break
+
+            if attempt >= self.file_upload_retries or not replayable:
+                break
+
+            attempt += 1
+            self.log.warning(
+                f'feature=batch, event=file-upload-retry, xid={xid}, attempt={attempt}, '
+                f'status={getattr(r, "status_code", None)}'
+            )
+            time.sleep(min(2 ** (attempt - 1), 30))
+
+        status = r is not None and r.ok
+        if r is None:
+            handle_error(code=580, message_values=[url], raise_error=halt_on_error)
+        elif not r.ok:
+            handle_error(
+                code=585,
+                message_values=[r.status_code, r.text],
+                raise_error=halt_on_error,
+            )
+        elif self.debug and self.enable_saved_file and xid not in self.saved_xids:
+            # save xid "if" successfully uploaded and not already saved
+            with self._file_upload_lock:
+                self.saved_xids = xid
+
+        self._file_upload_status_update('uploaded' if status else 'failed')
+        self.log.info(
+            f'feature=batch, event=file-upload, status={getattr(r, "status_code", None)}, '
+            f'xid={xid}'
+        )
+        return {'uploaded': status, 'xid': xid}
+
+    def submit_file_body(
+        self, xid: str, content_data: dict, api_branch: str
+    ) -> Optional[Union[bytes, str, IO[bytes], Iterable[bytes]]]:
+        """Return the body for a file upload.
+
+        The file content can be bytes, a string, a file object, an iterable of bytes, or a
+        callable that is passed the xid and returns any of those types. File objects and
+        iterables are streamed to the API instead of being read into memory.
+
+        Args:
+            xid: The xid of the Document or Report.
+            content_data: The file data (fileContent, fileName, and type) for the group.
+            api_branch: The API branch (documents or reports).
+        """
+        # process the file content
+        content = content_data.get('fileContent')
+        if callable(content):
+            try:
+                content_callable_name = getattr(content, '__name__', repr(content))
+                self.log.trace(
+                    f'feature=batch-submit-files, method={content_callable_name}, xid={xid}'
+                )
+                content = content(xid)
+            except Exception as e:
+                self.log.warning(f'feature=batch, event=file-download-exception, err="""{e}"""')
+                content = None
+        elif getattr(content, 'seekable', lambda: False)():
+            # rewind file object on retry
+            content.seek(0)
+
+        if content is not None and self.debug and content_data.get('fileName'):
+            # special code for debugging App using batchV2.
+            fqfn = os.path.join(
+                self.debug_path_files,
+                f'''{api_branch}--{xid}--{content_data.get('fileName').replace('/', ':')}''',
+            )
+            if os.path.isdir(os.path.dirname(fqfn)):
+                with open(fqfn, 'wb') as fh:
+                    self._file_content_write(fh, content)
+                if isinstance(content, (bytes, str)):
+                    return content
+
+                # the content has been streamed to the debug file, upload from the debug file
+                return open(fqfn, 'rb')  # pylint: disable=consider-using-with
+        return content
+
+    def submit_files(self, file_data: dict, halt_on_error: Optional[bool] = True) -> list:
         """Submit Files for Documents and Reports to ThreatConnect API.
 
         Critical Errors
@@ -883,91 +1022,59 @@ class Batch(BatchWriter, BatchSubmit):
             file_data: The file data to be submitted.
 
         Returns:
-            dict: The upload status for each xid.
+            list: The upload status for each xid.
+        """
+        upload_status = [f.result() for f in self.submit_files_async(file_data, halt_on_error)]
+        self.log.info(
+            f'feature=batch, event=file-upload-complete, count={len(upload_status)}, '
+            f'uploaded={sum(1 for s in upload_status if s.get("uploaded"))}'
+        )
+        return upload_status
+
+    def submit_files_async(
+        self, file_data: dict, halt_on_error: Optional[bool] = True
+    ) -> List[Future]:
+        """Queue Files for Documents and Reports to be uploaded by the file upload pool.
+
+        The files are uploaded by at most file_upload_workers threads shared by all batch jobs.
+        Any pending uploads are completed when the batch is closed.
+
+        Args:
+            halt_on_error: If True any exception will raise an error.
+            file_data: The file data to be submitted.
+
+        Returns:
+            List[Future]: A future for each queued file, the result is the upload status.
         """
         # check global setting for override
         if self.halt_on_file_error is not None:
             halt_on_error = self.halt_on_file_error
 
-        upload_status = []
+        futures = []
         self.log.info(f'feature=batch, action=submit-files, count={len(file_data)}')
         for xid, content_data in list(file_data.items()):
             del file_data[xid]  # win or loose remove the entry
-            status = True
 
             # used for debug/testing to prevent upload of previously uploaded file
             if self.debug and xid in self.saved_xids:
                 self.log.debug(
                     f'feature=batch-submit-files, action=skip-previously-saved-file, xid={xid}'
                 )
+                self._file_upload_status_update('skipped')
                 continue
 
-            # process the file content
-            content = content_data.get('fileContent')
-            if callable(content):
-                try:
-                    content_callable_name = getattr(content, '__name__', repr(content))
-                    self.log.trace(
-                        f'feature=batch-submit-files, method={content_callable_name}, xid={xid}'
-                    )
-                    content = content_data.get('fileContent')(xid)
-                except Exception as e:
-                    self.log.warning(f'feature=batch, event=file-download-exception, err="""{e}"""')
-
-            if content is None:
-                upload_status.append({'uploaded': False, 'xid': xid})
-                self.log.warning(f'feature=batch-submit-files, xid={xid}, event=content-null')
-                continue
-
-            api_branch = 'documents'
-            if content_data.get('type') == 'Report':
-                api_branch = 'reports'
-
-            if self.debug and content_data.get('fileName'):
-                # special code for debugging App using batchV2.
-                fqfn = os.path.join(
-                    self.debug_path_files,
-                    f'''{api_branch}--{xid}--{content_data.get('fileName').replace('/', ':')}''',
-                )
-                if os.path.isdir(os.path.dirname(fqfn)):
-                    with open(fqfn, 'wb') as fh:
-                        if not isinstance(content, bytes):
-                            content = content.encode()
-                        fh.write(content)
-
-            # Post File
-            url = f'/v2/groups/{api_branch}/{xid}/upload'
-            headers = {'Content-Type': 'application/octet-stream'}
-            params = {'owner': self._owner, 'updateIfExists': 'true'}
-            r = self.submit_file_content('POST', url, content, headers, params, halt_on_error)
-            if r.status_code == 401:
-                # use PUT method if file already exists
-                self.log.info('feature=batch, event=401-from-post, action=switch-to-put')
-                r = self.submit_file_content('PUT', url, content, headers, params, halt_on_error)
-            if not r.ok:
-                status = False
-                handle_error(
-                    code=585,
-                    message_values=[r.status_code, r.text],
-                    raise_error=halt_on_error,
-                )
-            elif self.debug and self.enable_saved_file and xid not in self.saved_xids:
-                # save xid "if" successfully uploaded and not already saved
-                self.saved_xids = xid
-
-            self.log.info(
-                f'feature=batch, event=file-upload, status={r.status_code}, '
-                f'xid={xid}, remaining={len(file_data)}'
+            futures.append(
+                self.file_pool.submit(self.submit_file, xid, content_data, halt_on_error)
             )
-            upload_status.append({'uploaded': status, 'xid': xid})
 
-        return upload_status
+        self._file_futures.extend(futures)
+        return futures
 
     def submit_file_content(
         self,
         method: str,
         url: str,
-        data: Union[bytes, str],
+        data: Union[bytes, str, IO[bytes], Iterable[bytes]],
         headers: dict,
         params: dict,
         halt_on_error: Optional[bool] = True,
@@ -1026,6 +1133,79 @@ class Batch(BatchWriter, BatchSubmit):
         self.log.debug(f'feature=batch, event=submit-job, status={data}')
         return data.get('data', {}).get('batchId')
 
+    def submit_retry(
+        self,
+        content: BatchSerializer,
+        batch_data: dict,
+        file_data: dict,
+        errors: bool,
+        process_files: bool,
+        halt_on_error: bool,
+        retry: int,
+    ) -> Optional[dict]:
+        """Resubmit the groups and indicators of a batch chunk that failed with a transient error.
+
+        Errors are mapped back to the submitted entities using the xid index of the content. An
+        entity with any permanent error is not resubmitted.
+
+        Args:
+            content: The serialized group, indicator, and file data of the batch chunk.
+            batch_data: The batch status of the batch chunk.
+            file_data: The file data of the batch chunk.
+            errors: If True retrieve any batch errors of the follow-up batch job.
+            process_files: If true send any document or report attachments to the API.
+            halt_on_error: If True any exception will raise an error.
+            retry: The number of times to resubmit failed entities.
+
+        Returns:
+            Optional[dict]: The Batch Status of the follow-up batch job or None if there were no
+                entities to resubmit.
+        """
+        batch_errors = batch_data.get('errors')
+        if batch_errors is None:
+            # errors were not retrieved, stream them instead of loading them into memory
+            batch_errors = self.errors_stream(batch_data.get('id'))
+
+        permanent = set()
+        transient = set()
+        xids = content.entity_xids
+        try:
+            for error in batch_errors:
+                xid = self.error_xid(error, xids)
+                if xid is None:
+                    continue
+                if self.error_transient(error):
+                    transient.add(xid)
+                else:
+                    permanent.add(xid)
+        except Exception as e:
+            # without the errors the failed entities are unknown, nothing is resubmitted
+            handle_error(code=560, message_values=[e], raise_error=halt_on_error)
+            return None
+        transient -= permanent
+
+        self.log.info(
+            f'''feature=batch, event=retry-failed, batch-id={batch_data.get('id')}, '''
+            f'''transient={len(transient)}, permanent={len(permanent)}, retry={retry}'''
+        )
+        if not transient:
+            return None
+
+        retry_content = BatchSerializer(
+            max_size=content.max_size, temp_path=content.temp_path, track_entities=retry > 1
+        )
+        for xid in xids:
+            if xid not in transient:
+                continue
+            key, entity = content.entity(xid)
+            retry_content[key].append(entity)
+            if xid in file_data:
+                retry_content['file'][xid] = file_data[xid]
+
+        return self.submit_content(
+            retry_content, True, errors, process_files, halt_on_error, retry=retry - 1
+        )
+
     def submit_thread(
         self,
         name: str,
@@ -1066,14 +1246,18 @@ class Batch(BatchWriter, BatchSubmit):
             with gzip.open(error_json_file, mode='wt', encoding='utf-8') as fh:
                 json.dump(errors, fh)
 
-    def write_batch_json(self, content: dict):
+    def write_batch_json(self, content: Union[dict, BatchSerializer]):
         """Write batch json data to a file."""
         if self.debug and content:
             # get timestamp as a string without decimal place and consistent length
             timestamp = str(int(time.time() * 10000000))
             batch_json_file = os.path.join(self.debug_path_batch, f'batch-{timestamp}.json.gz')
-            with gzip.open(batch_json_file, mode='wt', encoding='utf-8') as fh:
-                json.dump(content, fh)
+            if isinstance(content, BatchSerializer):
+                with gzip.open(batch_json_file, mode='wb') as fh:
+                    content.write(fh)
+            else:
+                with gzip.open(batch_json_file, mode='wt', encoding='utf-8') as fh:
+                    json.dump(content, fh)
 
     @property
     def group_len(self) -> int:
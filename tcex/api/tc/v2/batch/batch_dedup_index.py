@@ -0,0 +1,207 @@
+"""ThreatConnect Batch Import Module"""
+# standard library
+import logging
+from typing import TYPE_CHECKING, Optional, Tuple, Union
+
+# first-party
+from tcex.api.tc.utils.threat_intel_utils import ThreatIntelUtils
+
+if TYPE_CHECKING:
+    # first-party
+    from tcex.api.tc.v2.batch.batch_writer import GroupType, IndicatorType
+
+# get tcex logger
+logger = logging.getLogger('tcex')
+
+
+class BatchDedupIndex:
+    """Index of Batch groups and indicators keyed on type and normalized summary.
+
+    Indicators are keyed on their summary split into values the same way as the Indicator batch
+    classes build it, with whitespace stripped and hashes/hostnames lowercased. Groups are keyed
+    on their name with whitespace collapsed, Documents and Reports are never merged as different
+    files can be uploaded with the same name. An entity added with a key already in the index is
+    merged into the first entity and its xid is recorded as an alias, so that associations to
+    the duplicate xid can be rewritten to the xid of the entity that is submitted.
+    """
+
+    # indicator types where ThreatConnect ignores the case of the summary
+    _case_insensitive_types = ('EmailAddress', 'File', 'Host')
+
+    # group types with an attached file that are not merged
+    _file_group_types = ('Document', 'Report')
+
+    # fields that are part of the key and only differ in normalization
+    _key_fields = ('name', 'summary', 'type', 'xid')
+
+    def __init__(self):
+        """Initialize Class Properties."""
+        self._keys = {}
+        self.aliases = {}
+        self.log = logger
+
+    @staticmethod
+    def _association_add(entity: Union['GroupType', 'IndicatorType'], key: str, item: dict):
+        """Add a single association, attribute, file occurrence, label, or tag to an entity."""
+        if key == 'attribute':
+            entity.attribute(
+                item.get('type'),
+                item.get('value'),
+                item.get('displayed', False),
+                item.get('source'),
+            )
+        elif key == 'fileOccurrence':
+            entity.occurrence(item.get('fileName'), item.get('path'), item.get('date'))
+        elif key == 'securityLabel':
+            entity.security_label(item.get('name'), item.get('description'), item.get('color'))
+        elif key == 'tag':
+            entity.tag(item.get('name'))
+        elif key == 'associatedGroups':
+            entity.association(item.get('groupXid'))
+        elif key == 'associatedGroupXid':
+            entity.association(item)
+
+    @property
+    def _merge_keys(self) -> dict:
+        """Return the list fields that are merged mapped to the identity of a single item."""
+        return {
+            'associatedGroupXid': lambda i: i,
+            'associatedGroups': lambda i: i.get('groupXid'),
+            'attribute': lambda i: (i.get('type'), i.get('value')),
+            'fileOccurrence': lambda i: (i.get('fileName'), i.get('path'), i.get('date')),
+            'securityLabel': lambda i: i.get('name'),
+            'tag': lambda i: i.get('name'),
+        }
+
+    def discard(self, key: Optional[Tuple[str, str]], xid: str):
+        """Remove the key from the index once the entity has been collected for submission.
+
+        Args:
+            key: The key returned by group_key or indicator_key.
+            xid: The xid of the collected entity.
+        """
+        if self._keys.get(key) == xid:
+            del self._keys[key]
+
+    def group_key(self, group_data: Union[dict, 'GroupType']) -> Optional[Tuple[str, str]]:
+        """Return the dedup key for a group, None for groups that are never merged.
+
+        Args:
+            group_data: A Group dict or instance of GroupType.
+        """
+        if isinstance(group_data, dict):
+            group_type = group_data.get('type')
+            name = group_data.get('name') or ''
+        else:
+            group_type = group_data.type
+            name = group_data.name or ''
+        if group_type in self._file_group_types:
+            return None
+        return group_type, ' '.join(name.split())
+
+    def indicator_key(self, indicator_data: Union[dict, 'IndicatorType']) -> Tuple[str, str]:
+        """Return the dedup key for an indicator.
+
+        Args:
+            indicator_data: An Indicator dict or instance of IndicatorType.
+        """
+        if isinstance(indicator_data, dict):
+            indicator_type = indicator_data.get('type')
+            summary = indicator_data.get('summary') or ''
+        else:
+            indicator_type = indicator_data.type
+            summary = indicator_data.summary or ''
+
+        values = [v.strip() for v in ThreatIntelUtils.expand_indicators(summary) if v and v.strip()]
+        summary = ' : '.join(values)
+        if indicator_type in self._case_insensitive_types:
+            summary = summary.lower()
+        return indicator_type, summary
+
+    def merge(
+        self,
+        entity: Union[dict, 'GroupType', 'IndicatorType'],
+        duplicate: Union[dict, 'GroupType', 'IndicatorType'],
+    ) -> Union[dict, 'GroupType', 'IndicatorType']:
+        """Merge the duplicate entity into the entity.
+
+        Attributes, associations, file occurrences, security labels, and tags are merged, any
+        other field is only set on the entity if not already defined.
+
+        Args:
+            entity: The previously stored entity.
+            duplicate: The duplicate entity.
+
+        Returns:
+            (dict|GroupType|IndicatorType): The updated entity.
+        """
+        entity_data = entity if isinstance(entity, dict) else entity.data
+        if not isinstance(duplicate, dict):
+            duplicate = duplicate.data
+
+        for key, value in duplicate.items():
+            if key == 'xid' or value is None:
+                continue
+
+            identity = self._merge_keys.get(key)
+            if identity is None:
+                if entity_data.get(key) is None:
+                    if isinstance(entity, dict):
+                        entity[key] = value
+                    else:
+                        entity.add_key_value(key, value)
+                elif entity_data.get(key) != value and key not in self._key_fields:
+                    self.log.warning(
+                        '''feature=batch, event=dedup-value-discarded, '''
+                        f'''xid={entity_data.get('xid')}, duplicate-xid={duplicate.get('xid')}, '''
+                        f'''field={key}'''
+                    )
+                continue
+
+            existing = {identity(i) for i in entity_data.get(key, [])}
+            for item in value:
+                if identity(item) in existing:
+                    continue
+                existing.add(identity(item))
+                if isinstance(entity, dict):
+                    entity.setdefault(key, []).append(item)
+                else:
+                    self._association_add(entity, key, item)
+        return entity
+
+    def resolve(self, data: dict) -> dict:
+        """Rewrite group associations to duplicate xids with the xid of the merged group.
+
+        Args:
+            data: The dict representation of a group or indicator.
+
+        Returns:
+            dict: The updated data.
+        """
+        if not self.aliases:
+            return data
+
+        if data.get('associatedGroupXid'):
+            xids = [self.aliases.get(x, x) for x in data['associatedGroupXid']]
+            data['associatedGroupXid'] = list(dict.fromkeys(xids))
+        if data.get('associatedGroups'):
+            associations = {}
+            for association in data['associatedGroups']:
+                xid = self.aliases.get(association.get('groupXid'), association.get('groupXid'))
+                associations.setdefault(xid, dict(association, groupXid=xid))
+            data['associatedGroups'] = list(associations.values())
+        return data
+
+    def xid(self, key: Optional[Tuple[str, str]], xid: Optional[str]) -> Optional[str]:
+        """Return the xid of the first entity added for the key, registering new keys.
+
+        Args:
+            key: The key returned by group_key or indicator_key, None if not merged.
+            xid: The xid of the entity being added.
+        """
+        if key is None:
+            return xid
+        indexed_xid = self._keys.setdefault(key, xid)
+        if indexed_xid != xid:
+            self.aliases[xid] = indexed_xid
+        return indexed_xid
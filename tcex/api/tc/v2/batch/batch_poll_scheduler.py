@@ -0,0 +1,231 @@
+"""ThreatConnect Batch Import Module"""
+# standard library
+import logging
+import math
+import threading
+import time
+from typing import Optional
+
+# third-party
+from requests import Session
+
+# first-party
+from tcex.exit.error_codes import handle_error
+from tcex.sessions.thread_sessions import ThreadSessions
+
+# get tcex logger
+logger = logging.getLogger('tcex')
+
+
+class BatchPollScheduler:
+    """Poll the status of all outstanding batch jobs on a single timer.
+
+    Each batch job is registered with the number of entities it contains. The scheduler learns
+    the server throughput (entities per second) from completed jobs and uses it to predict when
+    each outstanding job will complete, taking into account the entities of jobs submitted ahead
+    of it. A job is first polled at its predicted completion time and afterwards with a capped
+    back off. The timer thread polls using its own copy of the session.
+
+    Args:
+        session_tc: The ThreatConnect API session.
+        min_interval: The minimum number of seconds between polls of a single job.
+        max_interval: The maximum number of seconds between polls of a single job.
+    """
+
+    def __init__(
+        self,
+        session_tc: Session,
+        min_interval: Optional[float] = 1.0,
+        max_interval: Optional[float] = 20.0,
+    ):
+        """Initialize Class Properties."""
+        self.max_interval = max_interval
+        self.min_interval = min_interval
+
+        # properties
+        self._condition = threading.Condition()
+        self._jobs = {}
+        self._last_completed = None
+        self._sessions = ThreadSessions(session_tc)
+        self._thread = None
+        self.log = logger
+        self.poll_count = 0  # total number of status requests sent
+        self.throughput = None  # learned entities per second
+
+    def _learn(self, job: dict, completed: float):
+        """Update the learned throughput using a completed job."""
+        # the server starts on a job once the previous job completes
+        started = job['submitted']
+        if self._last_completed is not None:
+            started = max(started, self._last_completed)
+        self._last_completed = completed
+
+        elapsed = max(completed - started, 0.001)
+        sample = job['count'] / elapsed
+        if job['poll_count'] == 1:
+            # the job completed some time before the first poll, so the sample is a lower bound
+            sample *= 1.25
+
+        # exponentially weighted average favoring the most recent jobs
+        if self.throughput is None:
+            self.throughput = sample
+        else:
+            self.throughput = self.throughput * 0.5 + sample * 0.5
+        self.log.debug(
+            f'feature=batch, event=poll-throughput, entities-per-second={self.throughput:.1f}'
+        )
+
+    def _poll_job(self, job: dict):
+        """Retrieve the status for a single job, completing the job on success or error."""
+        with self._condition:
+            job['poll_count'] += 1
+            self.poll_count += 1
+        self.log.info(
+            f'''feature=batch, event=progress, batch-id={job['batch_id']}, '''
+            f'''poll-time={time.monotonic() - job['submitted']:.0f}'''
+        )
+
+        error = None
+        data = job['data']
+        try:
+            r = self.session_tc.get(
+                f'''/v2/batch/{job['batch_id']}''', params={'includeAdditional': 'true'}
+            )
+            if not r.ok or 'application/json' not in r.headers.get('content-type', ''):
+                error = (545, [r.status_code, r.text])
+            else:
+                data = r.json()
+                if data.get('status') != 'Success':
+                    error = (545, [r.status_code, r.text])
+        except Exception as e:
+            error = (540, [e])
+
+        completed = data.get('data', {}).get('batchStatus', {}).get('status') == 'Completed'
+        with self._condition:
+            job['data'] = data
+            if error is not None or completed:
+                job['done'] = True
+                job['error'] = error
+                self._jobs.pop(job['batch_id'], None)
+                if completed:
+                    self._learn(job, time.monotonic())
+                self._condition.notify_all()
+            else:
+                # back off on retry with a max interval
+                interval = job['retry_seconds'] + int(job['poll_count'] * job['back_off'])
+                job['next_poll'] = time.monotonic() + min(interval, self.max_interval)
+
+    def _predict(self, job: dict) -> float:
+        """Return the number of seconds from now until the job is expected to complete."""
+        if self.throughput is None or not job['count']:
+            if job['count']:
+                # no history, estimate based off the number of entries in the batch data
+                return max(math.ceil(job['count'] / 300), 5)
+            # if not able to calculate default to 15 seconds
+            return 15
+
+        # include entities of outstanding jobs submitted ahead of this job
+        entities = job['count'] + sum(
+            j['count'] or 0 for j in self._jobs.values() if j['submitted'] < job['submitted']
+        )
+        return max(entities / self.throughput, self.min_interval)
+
+    def _run(self):
+        """Poll all jobs that are due, sleeping until the next job is due."""
+        try:
+            while True:
+                with self._condition:
+                    if not self._jobs:
+                        return
+
+                    now = time.monotonic()
+                    due = [j for j in self._jobs.values() if j['next_poll'] <= now]
+                    if not due:
+                        next_poll = min(j['next_poll'] for j in self._jobs.values())
+                        self._condition.wait(next_poll - now)
+                        continue
+
+                for job in due:
+                    self._poll_job(job)
+        except Exception as ex:
+            self.log.error(f'feature=batch, event=poll-scheduler-failed, error="""{ex}"""')
+            with self._condition:
+                # fail all outstanding jobs instead of blocking them until the poll timeout
+                for job in self._jobs.values():
+                    job['done'] = True
+                    job['error'] = (540, [ex])
+                self._jobs.clear()
+        finally:
+            with self._condition:
+                # a new thread is started by the next poll
+                if self._thread is threading.current_thread():
+                    self._thread = None
+                self._condition.notify_all()
+
+    def poll(
+        self,
+        batch_id: int,
+        count: Optional[int] = None,
+        timeout: Optional[int] = 3600,
+        halt_on_error: Optional[bool] = True,
+        retry_seconds: Optional[int] = 5,
+        back_off: Optional[float] = 2.5,
+    ) -> dict:
+        """Register a batch job and block until it is complete.
+
+        Args:
+            batch_id: The ID returned from the ThreatConnect API for the batch job.
+            count: The number of groups and indicators in the batch job.
+            timeout: The number of seconds before the poll should timeout.
+            halt_on_error: If True any exception will raise an error.
+            retry_seconds: The base number of seconds used for retries when job is not completed.
+            back_off: A multiplier to use for backing off on each poll attempt.
+
+        Returns:
+            dict: The batch status returned from the ThreatConnect API.
+        """
+        with self._condition:
+            job = {
+                'back_off': back_off,
+                'batch_id': batch_id,
+                'count': count,
+                'data': {},
+                'done': False,
+                'error': None,
+                'poll_count': 0,
+                'retry_seconds': retry_seconds,
+                'submitted': time.monotonic(),
+            }
+            job['next_poll'] = job['submitted'] + self._predict(job)
+            self._jobs[batch_id] = job
+
+            # start the timer thread if not already running and wake it to reschedule
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    name='batch-poll-scheduler', target=self._run, daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+            deadline = job['submitted'] + timeout
+            while not job['done']:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    # time out poll to prevent App running indefinitely
+                    self._jobs.pop(batch_id, None)
+                    handle_error(code=550, message_values=[timeout], raise_error=True)
+                self._condition.wait(remaining)
+
+        if job['error'] is not None:
+            code, message_values = job['error']
+            handle_error(code=code, message_values=message_values, raise_error=halt_on_error)
+        else:
+            self.log.debug(
+                f'''feature=batch, poll-count={job['poll_count']}, status={job['data']}'''
+            )
+        return job['data']
+
+    @property
+    def session_tc(self) -> Session:
+        """Return the ThreatConnect API session of the current thread."""
+        return self._sessions.current
@@ -0,0 +1,233 @@
+"""ThreatConnect Batch Import Module"""
+# standard library
+import json
+import os
+import tempfile
+import uuid
+from collections import ChainMap
+from typing import IO, Iterator, Optional, Tuple
+
+
+class BatchEntitySpool:
+    """Spooled JSON array of Batch entities (groups or indicators).
+
+    Each entity is serialized as it is appended, so the entity dict can be released immediately
+    instead of being held until the full batch is serialized. When tracking is enabled the offset
+    and length of each serialized entity is indexed by xid so the entity can be read back.
+
+    The xid of each entity and the xids of the groups each entity is associated with are
+    always recorded, so the dependencies between batch chunks can be determined.
+
+    Args:
+        max_size: The number of bytes to hold in memory before spooling to disk.
+        temp_path: The directory to use for the temporary file.
+        track_entities: If True, index the offset of each entity by xid.
+    """
+
+    __slots__ = ['_count', '_fh', 'associations', 'index', 'xids']
+
+    def __init__(
+        self, max_size: int, temp_path: Optional[str] = None, track_entities: Optional[bool] = False
+    ):
+        """Initialize Class Properties."""
+        self._count = 0
+        self._fh = tempfile.SpooledTemporaryFile(  # pylint: disable=consider-using-with
+            max_size=max_size, mode='w+b', dir=temp_path
+        )
+        self.index = {} if track_entities else None
+        # the xids of the appended entities and the groups they are associated with
+        self.associations = set()
+        self.xids = set()
+
+    def append(self, entity: dict) -> int:
+        """Serialize and append an entity to the spool.
+
+        Args:
+            entity: The group or indicator data.
+
+        Returns:
+            int: The size in bytes of the serialized entity.
+        """
+        # the file may have been read since the last append
+        self._fh.seek(0, os.SEEK_END)
+        if self._count > 0:
+            self._fh.write(b', ')
+        entity_bytes = json.dumps(entity).encode('utf-8')
+        if self.index is not None:
+            self.index[entity.get('xid')] = (self._fh.tell(), len(entity_bytes))
+        self._fh.write(entity_bytes)
+        self._count += 1
+        self.xids.add(entity.get('xid'))
+        self.associations.update(entity.get('associatedGroupXid') or [])
+        self.associations.update(a.get('groupXid') for a in entity.get('associatedGroups') or [])
+        return len(entity_bytes)
+
+    def close(self):
+        """Close the spool, removing any temporary file."""
+        self._fh.close()
+
+    def entity(self, xid: str) -> Optional[dict]:
+        """Return a previously appended entity (only available when tracking is enabled).
+
+        Args:
+            xid: The xid of the group or indicator.
+        """
+        offset, length = (self.index or {}).get(xid, (None, None))
+        if offset is None:
+            return None
+        self._fh.seek(offset)
+        return json.loads(self._fh.read(length))
+
+    def iter_bytes(self, chunk_size: Optional[int] = 65_536) -> Iterator[bytes]:
+        """Yield the serialized entities (without enclosing brackets) in chunks.
+
+        Args:
+            chunk_size: The number of bytes per chunk.
+        """
+        self._fh.seek(0)
+        while True:
+            chunk = self._fh.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    def __len__(self) -> int:
+        """Return the number of entities in the spool."""
+        return self._count
+
+
+class BatchSerializer(dict):
+    """Streaming serializer for a single Batch chunk.
+
+    The instance has the same keys as the dict returned by BatchWriter.data, but the group and
+    indicator values are spools that serialize each entity as it is appended. The full JSON
+    document is only ever materialized as a stream of bytes.
+
+    Args:
+        max_size: The number of bytes to hold in memory before spooling to disk.
+        temp_path: The directory to use for temporary files.
+        track_entities: If True, index the serialized entities by xid so they can be read back.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = 5_000_000,
+        temp_path: Optional[str] = None,
+        track_entities: Optional[bool] = False,
+    ):
+        """Initialize Class Properties."""
+        super().__init__(
+            file={},
+            group=BatchEntitySpool(max_size, temp_path, track_entities),
+            indicator=BatchEntitySpool(max_size, temp_path, track_entities),
+        )
+        self.max_size = max_size
+        self.temp_path = temp_path
+        self.track_entities = track_entities
+
+    @property
+    def association_xids(self) -> set:
+        """Return the xids of the groups associated with an entity, but not part of this chunk."""
+        associations = set()
+        for key in ['group', 'indicator']:
+            spool = self.get(key)
+            if spool is not None:
+                associations.update(spool.associations)
+        return associations - self.group_xids
+
+    def close(self):
+        """Close the group and indicator spools."""
+        for key in ['group', 'indicator']:
+            spool = self.get(key)
+            if spool is not None:
+                spool.close()
+
+    def entity(self, xid: str) -> Tuple[Optional[str], Optional[dict]]:
+        """Return the key (group or indicator) and data of a previously appended entity.
+
+        Args:
+            xid: The xid of the group or indicator.
+        """
+        for key in ['group', 'indicator']:
+            spool = self.get(key)
+            if spool is not None and spool.index is not None and xid in spool.index:
+                return key, spool.entity(xid)
+        return None, None
+
+    @property
+    def entity_xids(self) -> ChainMap:
+        """Return a mapping of the xids of all appended groups and indicators."""
+        return ChainMap(*[self.get(k).index or {} for k in ['group', 'indicator'] if self.get(k)])
+
+    @property
+    def group_xids(self) -> set:
+        """Return the xids of the groups in this chunk."""
+        spool = self.get('group')
+        return set() if spool is None else set(spool.xids)
+
+    def iter_bytes(self, chunk_size: Optional[int] = 65_536) -> Iterator[bytes]:
+        """Yield the Batch JSON document in chunks.
+
+        Args:
+            chunk_size: The number of bytes per chunk.
+        """
+        sep = b'{'
+        for key in ['group', 'indicator']:
+            spool = self.get(key)
+            if spool is None:
+                continue
+            yield sep + f'"{key}": ['.encode('utf-8')
+            yield from spool.iter_bytes(chunk_size)
+            yield b']'
+            sep = b', '
+        yield b'{}' if sep == b'{' else b'}'
+
+    def json_body(self) -> IO[bytes]:
+        """Return a file object containing the Batch JSON document, positioned at the start."""
+        fh = tempfile.SpooledTemporaryFile(  # pylint: disable=consider-using-with
+            max_size=self.max_size, mode='w+b', dir=self.temp_path
+        )
+        self.write(fh)
+        fh.seek(0)
+        return fh
+
+    def multipart_body(self, config: dict) -> Tuple[IO[bytes], str]:
+        """Return a multipart/form-data body for the createAndUpload endpoint.
+
+        The body matches the format created by requests for the files parameter
+        (e.g., files=(('config', ...), ('content', ...))) without holding it in memory.
+
+        Args:
+            config: The batch job settings.
+
+        Returns:
+            Tuple[IO[bytes], str]: The body file object and the Content-Type header value.
+        """
+        boundary = uuid.uuid4().hex
+        fh = tempfile.SpooledTemporaryFile(  # pylint: disable=consider-using-with
+            max_size=self.max_size, mode='w+b', dir=self.temp_path
+        )
+        for name in ['config', 'content']:
+            fh.write(
+                (
+                    f'--{boundary}\r\n'
+                    f'Content-Disposition: form-data; name="{name}"; filename="{name}"\r\n\r\n'
+                ).encode('utf-8')
+            )
+            if name == 'config':
+                fh.write(json.dumps(config).encode('utf-8'))
+            else:
+                self.write(fh)
+            fh.write(b'\r\n')
+        fh.write(f'--{boundary}--\r\n'.encode('utf-8'))
+        fh.seek(0)
+        return fh, f'multipart/form-data; boundary={boundary}'
+
+    def write(self, fh: IO[bytes]):
+        """Write the Batch JSON document to the provided binary file object.
+
+        Args:
+            fh: The binary file object (e.g., gzip or temporary file) to write to.
+        """
+        for chunk in self.iter_bytes():
+            fh.write(chunk)
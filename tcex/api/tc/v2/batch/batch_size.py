@@ -0,0 +1,52 @@
+"""ThreatConnect Batch Import Module"""
+# standard library
+from typing import Any
+
+
+def json_size(value: Any) -> int:
+    """Return the estimated size in bytes of the JSON encoded value.
+
+    The estimate is used to track the size of the batch data without serializing it. Escaped and
+    non-ascii characters are counted as a single byte.
+
+    Args:
+        value: The dict, list, or scalar value.
+    """
+    value_class = value.__class__
+    if value_class is str:
+        return len(value) + 2
+    if value_class is dict:
+        size = 2
+        for key, item in value.items():
+            # quoted key, colon, and separator
+            size += len(key) + 6
+            size += len(item) + 2 if item.__class__ is str else json_size(item)
+        return size
+    if value_class is list or value_class is tuple:
+        size = 2
+        for item in value:
+            size += (len(item) + 2 if item.__class__ is str else json_size(item)) + 2
+        return size
+    if value is None or value_class is bool:
+        return 5
+    return len(str(value))
+
+
+class BatchSize:
+    """The estimated size in bytes of the groups and indicators stored in memory by a batch.
+
+    Stored Group and Indicator objects hold a reference to the counter and add the size of any
+    later change (e.g., an added attribute or tag), so the total stays current without
+    serializing the data. A pickled counter (e.g., an entity written to the shelf) is restored
+    as a new counter, so changes to entities loaded from the shelf are not counted.
+    """
+
+    __slots__ = ['value']
+
+    def __init__(self):
+        """Initialize Class Properties."""
+        self.value = 0
+
+    def __reduce__(self) -> tuple:
+        """Return a new counter when unpickled."""
+        return (BatchSize, ())
@@ -0,0 +1,126 @@
+"""ThreatConnect Batch Import Module"""
+# standard library
+import os
+import pickle  # nosec
+import struct
+from collections.abc import MutableMapping
+from typing import Any, Iterator, Optional
+
+
+class BatchSpillStore(MutableMapping):
+    """Append-only, xid indexed overflow storage for Batch groups and indicators.
+
+    Records are appended to a single log file as a fixed size header (record type and length)
+    followed by the key and the pickled value. An in-memory index maps each xid to the offset
+    of its latest record. Deletes append a tombstone record and remove the xid from the index,
+    so no existing data is ever rewritten.
+
+    Iteration follows insertion order, which allows the stored data to be drained sequentially.
+    The log file is only created on the first write and is truncated once all records have been
+    deleted. An existing log file is replayed to rebuild the index.
+
+    Args:
+        filename: The fully qualified filename for the log file.
+    """
+
+    # record header: record type (1 byte), key length (2 bytes), value length (4 bytes)
+    _header = struct.Struct('>BHI')
+    _record_put = 0
+    _record_delete = 1
+
+    def __init__(self, filename: str):
+        """Initialize Class Properties."""
+        self.filename = filename
+
+        # properties
+        self._fh = None
+        self._index = {}
+        self._size = 0
+
+        if os.path.isfile(self.filename) and os.path.getsize(self.filename) > 0:
+            self._replay()
+
+    def _append(self, record_type: int, key: bytes, value: Optional[bytes] = b'') -> int:
+        """Append a record to the log file returning the offset of the value."""
+        fh = self.fh
+        fh.seek(self._size)
+        fh.write(self._header.pack(record_type, len(key), len(value)))
+        fh.write(key)
+        fh.write(value)
+
+        offset = self._size + self._header.size + len(key)
+        self._size = offset + len(value)
+        return offset
+
+    def _replay(self):
+        """Rebuild the index from an existing log file."""
+        fh = self.fh
+        fh.seek(0)
+        offset = 0
+        while True:
+            header = fh.read(self._header.size)
+            if len(header) < self._header.size:
+                break
+            record_type, key_length, value_length = self._header.unpack(header)
+            key = fh.read(key_length).decode('utf-8')
+            offset += self._header.size + key_length
+            fh.seek(value_length, os.SEEK_CUR)
+
+            if record_type == self._record_delete:
+                self._index.pop(key, None)
+            else:
+                # keep original insertion position for updated keys
+                self._index[key] = (offset, value_length)
+            offset += value_length
+        self._size = offset
+
+    def close(self):
+        """Close the log file."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    @property
+    def fh(self):
+        """Return the log file handle, creating the log file on first use."""
+        if self._fh is None:
+            mode = 'r+b' if os.path.isfile(self.filename) else 'w+b'
+            self._fh = open(self.filename, mode)  # pylint: disable=consider-using-with
+        return self._fh
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if the key is in the index."""
+        return key in self._index
+
+    def __delitem__(self, key: str):
+        """Delete a record by appending a tombstone."""
+        del self._index[key]
+
+        if not self._index:
+            # all records have been drained, reclaim the disk space
+            self.fh.truncate(0)
+            self._size = 0
+        else:
+            self._append(self._record_delete, key.encode('utf-8'))
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value for the provided key."""
+        offset, length = self._index[key]
+        fh = self.fh
+        fh.seek(offset)
+        return pickle.loads(fh.read(length))  # nosec
+
+    def __iter__(self) -> Iterator[str]:
+        """Return an iterator of keys in insertion order."""
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        """Return the number of records in the index."""
+        return len(self._index)
+
+    def __setitem__(self, key: str, value: Any):
+        """Append a record for the provided key and value."""
+        # serialize value before writing the record so a failed pickle leaves the log unchanged
+        value = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        offset = self._append(self._record_put, key.encode('utf-8'), value)
+        self._index[key] = (offset, len(value))
@@ -1,19 +1,22 @@
 """ThreatConnect Batch Import Module."""
 # standard library
+import codecs
 import gzip
 import json
 import logging
-import math
 import re
-import time
-from typing import Dict, List, Optional
+import threading
+from typing import Container, Dict, Iterator, List, Optional, Union
 
 # third-party
 from requests import Session
 
 # first-party
+from tcex.api.tc.v2.batch.batch_poll_scheduler import BatchPollScheduler
+from tcex.api.tc.v2.batch.batch_serializer import BatchSerializer
 from tcex.exit.error_codes import handle_error
 from tcex.input.input import Input
+from tcex.sessions.thread_sessions import ThreadSessions
 
 # get tcex logger
 logger = logging.getLogger('tcex')
@@ -68,10 +71,51 @@ class BatchSubmit:
 
         # default properties
         self._batch_data_count = None
-        self._poll_interval = None
-        self._poll_interval_times = []
+        self._poll_scheduler = None
+        self._poll_scheduler_lock = threading.Lock()
         self._poll_timeout = 3600
 
+    @staticmethod
+    def _json_array_stream(chunks: Iterator[bytes]) -> Iterator[dict]:
+        """Yield each item of a JSON array from chunks of bytes."""
+        buffer = ''
+        decoder = json.JSONDecoder()
+        offset = 0  # the position of the first unread character in the buffer
+        separator = re.compile(r'[\s,]*')
+        started = False
+        utf8 = codecs.getincrementaldecoder('utf-8')()
+        whitespace = re.compile(r'\s*')
+        for chunk in chunks:
+            # drop the decoded items from the buffer once per chunk
+            buffer = buffer[offset:] + utf8.decode(chunk)
+            offset = 0
+            while True:
+                if not started:
+                    offset = whitespace.match(buffer, offset).end()
+                    if offset == len(buffer):
+                        break
+                    if buffer[offset] != '[':
+                        raise ValueError(
+                            f'Expected a JSON array, received "{buffer[offset:offset + 100]}".'
+                        )
+                    offset += 1
+                    started = True
+                    continue
+
+                offset = separator.match(buffer, offset).end()
+                if offset == len(buffer) or buffer[offset] == ']':
+                    break
+
+                try:
+                    item, offset = decoder.raw_decode(buffer, offset)
+                except ValueError:
+                    # item is incomplete, read next chunk
+                    break
+                yield item
+
+        if not started or buffer[offset:].strip() != ']':
+            raise ValueError('Incomplete JSON array.')
+
     @property
     def _critical_failures(self) -> List[str]:  # pragma: no cover
         """Return Batch critical failure messages."""
@@ -80,6 +124,23 @@ class BatchSubmit:
             'would exceed the number of allowed indicators',
         ]
 
+    @property
+    def _transient_error_codes(self) -> List[str]:
+        """Return Batch error codes that are likely to succeed on resubmission."""
+        return [
+            '0x1004',  # Internal Error
+            '0x1007',  # Item Not Found Error (e.g., associated group not yet created)
+            '0x1009',  # Association Error
+            '0x100B',  # File IO Error
+            '0x2001',  # Indicator Partial Loss Error
+            '0x2002',  # Group Partial Loss Error
+        ]
+
+    @property
+    def _transient_error_pattern(self) -> str:
+        """Return pattern for Batch error messages without an error code that are transient."""
+        return r'deadlock|lock wait|timed? ?out|temporarily|try again|unavailable'
+
     @property
     def action(self) -> str:
         """Return batch action."""
@@ -136,6 +197,22 @@ class BatchSubmit:
         self.log.debug(f'feature=batch, event=submit-job, status={data}')
         return data.get('data', {}).get('batchId')
 
+    def critical_failure(self, errors: Optional[list]) -> Optional[str]:
+        """Return the error reason of the first critical batch error.
+
+        Args:
+            errors: A list of batch errors.
+
+        Returns:
+            Optional[str]: The error reason or None if no critical error was found.
+        """
+        for error in errors or []:
+            error_reason = error.get('errorReason') or ''
+            for error_msg in self._critical_failures:
+                if re.findall(error_msg, error_reason):
+                    return error_reason
+        return None
+
     @property
     def error_codes(self) -> Dict[str, str]:
         """Return static list of Batch error codes and short description"""
@@ -178,27 +255,82 @@ class BatchSubmit:
         """
         errors = []
         try:
-            self.log.debug(f'feature=batch, event=retrieve-errors, batch-id={batch_id}')
-            r = self.session_tc.get(f'/v2/batch/{batch_id}/errors')
-            # API does not return correct content type
-            if r.ok:
-                errors = json.loads(r.text)
+            errors = list(self.errors_stream(batch_id))
             # temporarily process errors to find "critical" errors.
             # FR in core to return error codes.
-            for error in errors:
-                error_reason = error.get('errorReason')
-                for error_msg in self._critical_failures:
-                    if re.findall(error_msg, error_reason):
-                        handle_error(
-                            code=10500,
-                            message_values=[error_reason],
-                            raise_error=halt_on_error,
-                        )
+            error_reason = self.critical_failure(errors)
+            if error_reason is not None:
+                handle_error(
+                    code=10500,
+                    message_values=[error_reason],
+                    raise_error=halt_on_error,
+                )
         except Exception as e:
             handle_error(code=560, message_values=[e], raise_error=halt_on_error)
 
         return errors
 
+    def errors_stream(self, batch_id: int) -> Iterator[dict]:
+        """Yield Batch errors as they are read from the ThreatConnect API response.
+
+        The response is decoded incrementally, so only a single error is held in memory
+        regardless of the number of errors for the batch job.
+
+        Args:
+            batch_id: The ID returned from the ThreatConnect API for the current batch job.
+
+        Yields:
+            dict: A single batch error.
+        """
+        self.log.debug(f'feature=batch, event=retrieve-errors, batch-id={batch_id}')
+        r = self.session_tc.get(f'/v2/batch/{batch_id}/errors', stream=True)
+        try:
+            # API does not return correct content type
+            if r.ok:
+                yield from self._json_array_stream(r.iter_content(chunk_size=65_536))
+        finally:
+            r.close()
+
+    def error_transient(self, error: dict) -> bool:
+        """Return True if the batch error is likely to succeed when the entity is resubmitted.
+
+        Args:
+            error: A single batch error.
+        """
+        error_text = ' '.join(
+            str(error.get(k) or '') for k in ['errorCode', 'errorReason', 'errorMessage']
+        )
+        if self.critical_failure([{'errorReason': error_text}]) is not None:
+            return False
+
+        error_code = re.search(r'0x[0-9a-fA-F]{4}', error_text)
+        if error_code is not None:
+            return error_code.group(0).upper().replace('0X', '0x') in self._transient_error_codes
+        return re.search(self._transient_error_pattern, error_text, re.IGNORECASE) is not None
+
+    @staticmethod
+    def error_xid(error: dict, xids: Container[str]) -> Optional[str]:
+        """Return the xid of the submitted group or indicator the batch error is for.
+
+        Args:
+            error: A single batch error.
+            xids: The xids of the groups and indicators submitted in the batch job.
+        """
+        error_source = error.get('errorSource') or ''
+        try:
+            # the error source can contain the JSON of the entity
+            xid = json.loads(error_source).get('xid')
+            if xid in xids:
+                return xid
+        except (AttributeError, TypeError, ValueError):
+            pass
+
+        for token in f'''{error_source} {error.get('errorReason') or ''}'''.split():
+            token = token.strip('\'"()[]{},;.')
+            if token in xids:
+                return token
+        return None
+
     def file_merge_mode(self, value: str):
         """Set the file merge mode for the entire batch job.
 
@@ -255,6 +387,7 @@ class BatchSubmit:
         back_off: Optional[float] = None,
         timeout: Optional[int] = None,
         halt_on_error: Optional[bool] = True,
+        count: Optional[int] = None,
     ) -> dict:
         """Poll Batch status to ThreatConnect API.
 
@@ -273,6 +406,9 @@ class BatchSubmit:
                 }
             }
 
+        The poll is handled by a scheduler shared by all batch jobs of this instance, which polls
+        each outstanding job at its predicted completion time.
+
         Args:
             batch_id: The ID returned from the ThreatConnect API for the current batch job.
             retry_seconds: The base number of seconds used for retries when job is not completed.
@@ -280,6 +416,7 @@ class BatchSubmit:
                 each poll attempt when job has not completed.
             timeout: The number of seconds before the poll should timeout.
             halt_on_error: If True any exception will raise an error.
+            count: The number of groups and indicators in the batch job.
 
         Returns:
             dict: The batch status returned from the ThreatConnect API.
@@ -288,90 +425,30 @@ class BatchSubmit:
         if self.halt_on_poll_error is not None:
             halt_on_error = self.halt_on_poll_error
 
-        # initial poll interval
-        if self._poll_interval is None and self._batch_data_count is not None:
-            # calculate poll_interval base off the number of entries in the batch data
-            # with a minimum value of 5 seconds.
-            self._poll_interval = max(math.ceil(self._batch_data_count / 300), 5)
-        elif self._poll_interval is None:
-            # if not able to calculate poll_interval default to 15 seconds
-            self._poll_interval = 15
-
-        # poll retry back_off factor
-        poll_interval_back_off = float(2.5 if back_off is None else back_off)
-
-        # poll retry seconds
-        poll_retry_seconds = int(5 if retry_seconds is None else retry_seconds)
-
         # poll timeout
         if timeout is None:
             timeout = self.poll_timeout
         else:
             timeout = int(timeout)
-        params = {'includeAdditional': 'true'}
 
-        poll_count = 0
-        poll_time_total = 0
-        data = {}
-        while True:
-            poll_count += 1
-            poll_time_total += self._poll_interval
-            time.sleep(self._poll_interval)
-            self.log.info(f'feature=batch, event=progress, poll-time={poll_time_total}')
-            try:
-                # retrieve job status
-                r = self.session_tc.get(f'/v2/batch/{batch_id}', params=params)
-                if not r.ok or 'application/json' not in r.headers.get('content-type', ''):
-                    handle_error(
-                        code=545,
-                        message_values=[r.status_code, r.text],
-                        raise_error=halt_on_error,
-                    )
-                    return data
-                data = r.json()
-                if data.get('status') != 'Success':
-                    handle_error(
-                        code=545,
-                        message_values=[r.status_code, r.text],
-                        raise_error=halt_on_error,
-                    )
-            except Exception as e:
-                handle_error(code=540, message_values=[e], raise_error=halt_on_error)
-
-            if data.get('data', {}).get('batchStatus', {}).get('status') == 'Completed':
-                # store last 5 poll times to use in calculating average poll time
-                modifier = poll_time_total * 0.7
-                self._poll_interval_times = self._poll_interval_times[-4:] + [modifier]
-
-                weights = [1]
-                poll_interval_time_weighted_sum = 0
-                for poll_interval_time in self._poll_interval_times:
-                    poll_interval_time_weighted_sum += poll_interval_time * weights[-1]
-                    # weights will be [1, 1.5, 2.25, 3.375, 5.0625] for all 5 poll times depending
-                    # on how many poll times are available.
-                    weights.append(weights[-1] * 1.5)
-
-                # pop off the last weight so its not added in to the sum
-                weights.pop()
-
-                # calculate the weighted average of the last 5 poll times
-                self._poll_interval = math.floor(poll_interval_time_weighted_sum / sum(weights))
-
-                if poll_count == 1:
-                    # if completed on first poll, reduce poll interval.
-                    self._poll_interval = self._poll_interval * 0.85
-
-                self.log.debug(f'feature=batch, poll-time={poll_time_total}, status={data}')
-                return data
-
-            # update poll_interval for retry with max poll time of 20 seconds
-            self._poll_interval = min(
-                poll_retry_seconds + int(poll_count * poll_interval_back_off), 20
-            )
+        return self.poll_scheduler.poll(
+            batch_id=batch_id,
+            count=count if count is not None else self._batch_data_count,
+            timeout=timeout,
+            halt_on_error=halt_on_error,
+            retry_seconds=int(5 if retry_seconds is None else retry_seconds),
+            back_off=float(2.5 if back_off is None else back_off),
+        )
 
-            # time out poll to prevent App running indefinitely
-            if poll_time_total >= timeout:
-                handle_error(code=550, message_values=[timeout], raise_error=True)
+    @property
+    def poll_scheduler(self) -> BatchPollScheduler:
+        """Return the poll scheduler shared by all batch jobs."""
+        if self._poll_scheduler is None:
+            # pipelined submit workers poll concurrently and must share a single scheduler
+            with self._poll_scheduler_lock:
+                if self._poll_scheduler is None:
+                    self._poll_scheduler = BatchPollScheduler(self._sessions.session)
+        return self._poll_scheduler
 
     @property
     def poll_timeout(self) -> int:
@@ -393,6 +470,19 @@ class BatchSubmit:
         """Set batch security label write type."""
         self._security_label_write_type = write_type
 
+    @property
+    def session_tc(self) -> Session:
+        """Return the ThreatConnect API session of the current thread.
+
+        Worker threads (e.g., file uploads and pipelined submits) each use their own session.
+        """
+        return self._sessions.current
+
+    @session_tc.setter
+    def session_tc(self, session: Session):
+        """Set the ThreatConnect API session."""
+        self._sessions = ThreadSessions(session)
+
     @property
     def settings(self) -> Dict[str, str]:
         """Return batch job settings."""
@@ -455,13 +545,16 @@ class BatchSubmit:
         return {}
 
     def submit_data(
-        self, batch_id: int, content: dict, halt_on_error: Optional[bool] = True
+        self,
+        batch_id: int,
+        content: Union[dict, BatchSerializer],
+        halt_on_error: Optional[bool] = True,
     ) -> dict:
         """Submit Batch request to ThreatConnect API.
 
         Args:
             batch_id: The batch id of the current job.
-            content: The dict of groups and indicator data.
+            content: The dict of groups and indicator data or a BatchSerializer.
             halt_on_error (Optional[bool] = True): If True the process
                 should halt if any errors are encountered.
 
@@ -484,7 +577,11 @@ class BatchSubmit:
         # binary string of formatted json.
         headers = {'Content-Type': 'application/octet-stream'}
         try:
-            r = self.session_tc.post(f'/v2/batch/{batch_id}', headers=headers, json=content)
+            if isinstance(content, BatchSerializer):
+                with content.json_body() as body:
+                    r = self.session_tc.post(f'/v2/batch/{batch_id}', headers=headers, data=body)
+            else:
+                r = self.session_tc.post(f'/v2/batch/{batch_id}', headers=headers, json=content)
             if not r.ok or 'application/json' not in r.headers.get('content-type', ''):
                 handle_error(
                     code=10525,
@@ -6,15 +6,17 @@ import json
 import logging
 import os
 import re
-import shelve  # nosec
-import sys
 import time
 import uuid
 from collections import deque
-from typing import TYPE_CHECKING, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Callable, Optional, Tuple, Union
 
 # first-party
 from tcex.api.tc.utils.threat_intel_utils import ThreatIntelUtils
+from tcex.api.tc.v2.batch.batch_dedup_index import BatchDedupIndex
+from tcex.api.tc.v2.batch.batch_serializer import BatchEntitySpool, BatchSerializer
+from tcex.api.tc.v2.batch.batch_size import BatchSize, json_size
+from tcex.api.tc.v2.batch.batch_spill_store import BatchSpillStore
 from tcex.api.tc.v2.batch.group import (
     Adversary,
     AttackPattern,
@@ -107,6 +109,7 @@ class BatchWriter:
         inputs: The App inputs.
         session_tc: The ThreatConnect API session.
         output_dir: The directory to write the batch JSON data.
+        dedup (bool, kwargs): If True, duplicate groups/indicators are merged into a single entity.
     """
 
     def __init__(self, inputs: 'Input', session_tc: 'Session', output_dir: str, **kwargs):
@@ -121,8 +124,9 @@ class BatchWriter:
         # properties
         self._batch_files = []
         self._batch_max_chunk = 100_000
-        self._batch_size = 0  # track current batch size
+        self._batch_size = BatchSize()  # track current batch size
         self._batch_max_size = 75_000_000  # max size in bytes
+        self._dedup_index = BatchDedupIndex() if kwargs.get('dedup') is True else None
         self.log = logger
         self.tic = ThreatIntelUtils(self.session_tc)
         self.utils = Utils()
@@ -205,6 +209,10 @@ class BatchWriter:
         method = locals()[f'method_{value_count}']
         setattr(self, method_name, method)
 
+    def _batch_size_max(self):
+        """Handle the max batch size being reached by writing all batch data to disk."""
+        self.dump()
+
     def _group(
         self, group_data: Union[dict, 'GroupType'], store: Optional[bool] = True
     ) -> Union[dict, 'GroupType']:
@@ -217,33 +225,9 @@ class BatchWriter:
         if store is False:
             return group_data
 
-        if isinstance(group_data, dict):
-            # get xid from dict
-            xid = group_data.get('xid')
-        else:
-            # get xid from GroupType
-            xid = group_data.xid
-
-        if self.groups.get(xid) is not None:
-            # return existing group from memory
-            group_data = self.groups.get(xid)
-        elif self.groups_shelf.get(xid) is not None:
-            # return existing group from shelf
-            group_data = self.groups_shelf.get(xid)
-        else:
-            # store new group
-            self.groups[xid] = group_data
-
-            # track total batch job data size as TI gets added
-            if isinstance(group_data, dict):
-                self._batch_size += sys.getsizeof(json.dumps(group_data))
-            else:
-                self._batch_size += sys.getsizeof(json.dumps(group_data.data))
-
-            # max size hit, dump TI to disk
-            if self._batch_size > self._batch_max_size:
-                self.dump()
-        return group_data
+        # use the xid of the first group added with the same type and name
+        dedup_key = None if self._dedup_index is None else self._dedup_index.group_key
+        return self._store(group_data, self.groups, self._groups_shelf, dedup_key)
 
     def _indicator(
         self, indicator_data: Union[dict, 'IndicatorType'], store: Optional[bool] = True
@@ -257,33 +241,26 @@ class BatchWriter:
         if store is False:
             return indicator_data
 
-        if isinstance(indicator_data, dict):
-            # get xid from dict
-            xid = indicator_data.get('xid')
-        else:
-            # get xid from IndicatorType
-            xid = indicator_data.xid
-
-        if self.indicators.get(xid) is not None:
-            # return existing indicator from memory
-            indicator_data = self.indicators.get(xid)
-        elif self.indicators_shelf.get(xid) is not None:
-            # return existing indicator from shelf
-            indicator_data = self.indicators_shelf.get(xid)
-        else:
-            # store new indicators
-            self.indicators[xid] = indicator_data
+        # use the xid of the first indicator added with the same type and summary
+        dedup_key = None if self._dedup_index is None else self._dedup_index.indicator_key
+        return self._store(indicator_data, self.indicators, self._indicators_shelf, dedup_key)
 
-            # track total batch job data size as TI gets added
-            if isinstance(indicator_data, dict):
-                self._batch_size += sys.getsizeof(json.dumps(indicator_data))
-            else:
-                self._batch_size += sys.getsizeof(json.dumps(indicator_data.data))
+    @staticmethod
+    def _data_append(entities: Union[list, BatchEntitySpool], entity: dict) -> int:
+        """Append the group/indicator to the batch chunk data.
 
-            # max size hit, dump TI to disk
-            if self._batch_size > self._batch_max_size:
-                self.dump()
-        return indicator_data
+        Args:
+            entities: The list or spool of groups/indicators.
+            entity: The group or indicator data.
+
+        Returns:
+            int: The size in bytes of the serialized entity.
+        """
+        if isinstance(entities, list):
+            entities.append(entity)
+            return len(json.dumps(entity).encode('utf-8'))
+        # the spool serializes the entity as it is appended
+        return entities.append(entity)
 
     @staticmethod
     def _indicator_values(indicator: str) -> list:
@@ -318,6 +295,82 @@ class BatchWriter:
 
         return indicator_list
 
+    def _stored(
+        self,
+        entity: Union[dict, 'GroupType', 'IndicatorType'],
+        xid: str,
+        entities: dict,
+        entities_shelf: Optional[BatchSpillStore],
+    ) -> Optional[Union[dict, 'GroupType', 'IndicatorType']]:
+        """Return previously stored group/indicator, merging the new entity if dedup is enabled.
+
+        Args:
+            entity: The new Group/Indicator dict or instance of GroupType/IndicatorType.
+            xid: The xid the entity is stored under.
+            entities: The in memory groups/indicators.
+            entities_shelf: The shelf (spill store) groups/indicators, None if not yet created.
+        """
+        stored_data = entities.get(xid)
+        if stored_data is not None:
+            if self._dedup_index is not None and stored_data is not entity:
+                if isinstance(stored_data, dict):
+                    # GroupType/IndicatorType objects track the size of merged data
+                    size = json_size(stored_data)
+                    self._dedup_index.merge(stored_data, entity)
+                    self._batch_size.value += json_size(stored_data) - size
+                else:
+                    self._dedup_index.merge(stored_data, entity)
+        elif entities_shelf and xid in entities_shelf:
+            # the shelf is only searched once it holds data
+            stored_data = entities_shelf[xid]
+            if self._dedup_index is not None:
+                # write the merged entity back to the shelf
+                entities_shelf[xid] = self._dedup_index.merge(stored_data, entity)
+        else:
+            stored_data = None
+        return stored_data
+
+    def _store(
+        self,
+        entity: Union[dict, 'GroupType', 'IndicatorType'],
+        entities: dict,
+        entities_shelf: Optional[BatchSpillStore],
+        dedup_key: Optional[Callable[[Union[dict, 'GroupType', 'IndicatorType']], tuple]],
+    ) -> Union[dict, 'GroupType', 'IndicatorType']:
+        """Return previously stored group/indicator or store the new group/indicator.
+
+        Stored GroupType/IndicatorType objects add the size of any later change (e.g., an added
+        tag) to the batch size, so the batch size is tracked without serializing the data.
+
+        Args:
+            entity: The new Group/Indicator dict or instance of GroupType/IndicatorType.
+            entities: The in memory groups/indicators.
+            entities_shelf: The shelf (spill store) groups/indicators, None if not yet created.
+            dedup_key: The dedup index key method for the entity, None if dedup is disabled.
+        """
+        xid = entity.get('xid') if isinstance(entity, dict) else entity.xid
+        if dedup_key is not None:
+            xid = self._dedup_index.xid(dedup_key(entity), xid)
+
+        stored_data = self._stored(entity, xid, entities, entities_shelf)
+        if stored_data is not None:
+            # return existing group/indicator from memory or shelf
+            entity = stored_data
+        else:
+            # store new group/indicator
+            entities[xid] = entity
+
+            # track total batch job data size as TI gets added
+            if isinstance(entity, dict):
+                self._batch_size.value += json_size(entity)
+            else:
+                self._batch_size.value += entity.data_size
+                entity._batch_size = self._batch_size  # pylint: disable=protected-access
+
+        if self._batch_size.value > self._batch_max_size:
+            self._batch_size_max()
+        return entity
+
     def add_group(self, group_data: dict, **kwargs) -> Union[dict, 'GroupType']:
         """Add a group to Batch Job.
 
@@ -528,14 +581,17 @@ class BatchWriter:
         # cleanup shelf files
         try:
             self.groups_shelf.close()
-            os.unlink(self.group_shelf_fqfn)
+            if os.path.isfile(self.group_shelf_fqfn):
+                # the shelf file is only created once data has been saved
+                os.unlink(self.group_shelf_fqfn)
         except Exception as ex:
             self.log.warning(f'action=batch-close, filename={self.group_shelf_fqfn} exception={ex}')
 
         # cleanup shelf files
         try:
             self.indicators_shelf.close()
-            os.unlink(self.indicator_shelf_fqfn)
+            if os.path.isfile(self.indicator_shelf_fqfn):
+                os.unlink(self.indicator_shelf_fqfn)
         except Exception as ex:
             self.log.warning(
                 f'action=batch-close, filename={self.indicator_shelf_fqfn} exception={ex}'
@@ -572,8 +628,18 @@ class BatchWriter:
         Returns:
             dict: A dictionary of group, indicators, and/or file data.
         """
-        data = {'file': {}, 'group': [], 'indicator': []}
-        tracker = {'count': 0}
+        return self.data_collect({'file': {}, 'group': [], 'indicator': []})
+
+    def data_collect(self, data: Union[dict, 'BatchSerializer']) -> Union[dict, 'BatchSerializer']:
+        """Collect the next batch chunk of group, indicator, and file data into the data container.
+
+        Args:
+            data: A dict with file, group, and indicator keys or a BatchSerializer instance.
+
+        Returns:
+            (dict|BatchSerializer): The provided data container.
+        """
+        tracker = {'count': 0, 'bytes': 0}
 
         # process group from memory, returning if max values have been reached
         if self.data_groups(data, self.groups, tracker) is True:
@@ -591,6 +657,8 @@ class BatchWriter:
         if self.data_indicators(data, self.indicators_shelf, tracker) is True:
             return data
 
+        # all groups/indicators have been collected
+        self._batch_size = BatchSize()
         return data
 
     def data_group_association(self, data: dict, tracker: dict, xid: str):
@@ -601,7 +669,8 @@ class BatchWriter:
 
         Args:
             data: The data dict to update with group and file data.
-            tracker: A dict containing total count of all entities collected.
+            tracker: A dict containing total count of all entities collected and
+                the total size in bytes of all entities collected.
             xid: The xid of the group to retrieve associations.
         """
         xids = deque()
@@ -619,13 +688,20 @@ class BatchWriter:
                 del self.groups_shelf[xid]
 
             if group_data:
+                if not isinstance(group_data, dict):
+                    # changes to a collected group are not part of the batch size
+                    group_data._batch_size = None  # pylint: disable=protected-access
                 file_data, group_data = self.data_group_type(group_data)
-                data['group'].append(group_data)
+                if self._dedup_index is not None:
+                    self._dedup_index.discard(self._dedup_index.group_key(group_data), xid)
+                    self._dedup_index.resolve(group_data)
+                entity_bytes = self._data_append(data['group'], group_data)
                 if file_data:
                     data['file'][xid] = file_data
 
                 # update entity trackers
                 tracker['count'] += 1
+                tracker['bytes'] += entity_bytes
 
                 # extend xids with any groups associated with the same GroupType
                 xids.extend(group_data.get('associatedGroupXid', []))
@@ -661,10 +737,14 @@ class BatchWriter:
     def data_groups(self, data: dict, groups: list, tracker: dict) -> bool:
         """Process Group data.
 
+        The max count/size is checked after all associated groups have been collected, so a
+        group and the groups it is associated with are always returned in the same chunk.
+
         Args:
             data: The data dict to update with group and file data.
             groups: The list of groups to process.
-            tracker: A dict containing total count of all entities collected.
+            tracker: A dict containing total count of all entities collected and
+                the total size in bytes of all entities collected.
 
         Returns:
             bool: True if max values have been hit, else False.
@@ -674,15 +754,22 @@ class BatchWriter:
 
         # process the group
         for xid in list(groups.keys()):
+            if xid not in groups:
+                # group was already collected as an association of a previous group
+                continue
+
             # get association from group data
             self.data_group_association(data, tracker, xid)
 
             if tracker.get('count') % 10_000 == 0:
                 # log count/size at a sane level
                 self.log.debug(
-                    '''feature=batch, action=data-groups, ''' f'''count={tracker.get('count'):,}'''
+                    '''feature=batch, action=data-groups, '''
+                    f'''count={tracker.get('count'):,}, bytes={tracker.get('bytes'):,}'''
                 )
 
+            if self.data_max_reached(tracker):
+                return True
         return False
 
     def data_indicators(self, data: dict, indicators: list, tracker: dict) -> bool:
@@ -691,30 +778,91 @@ class BatchWriter:
         Args:
             data: The data dict to update with group and file data.
             indicators: The list of indicators to process.
-            tracker: A dict containing total count of all entities collected.
+            tracker: A dict containing total count of all entities collected and
+                the total size in bytes of all entities collected.
 
         Returns:
             bool: True if max values have been hit, else False.
         """
-        # process the indicator
-        for xid, indicator_data in list(indicators.items()):
+        # iterate over keys only so that shelf data is loaded one indicator at a time
+        for xid in list(indicators.keys()):
+            indicator_data = indicators[xid]
             if not isinstance(indicator_data, dict):
+                # changes to a collected indicator are not part of the batch size
+                indicator_data._batch_size = None  # pylint: disable=protected-access
                 indicator_data = indicator_data.data
-            data['indicator'].append(indicator_data)
+            if self._dedup_index is not None:
+                self._dedup_index.discard(self._dedup_index.indicator_key(indicator_data), xid)
+                self._dedup_index.resolve(indicator_data)
+            entity_bytes = self._data_append(data['indicator'], indicator_data)
             del indicators[xid]
 
             # update entity trackers
             tracker['count'] += 1
+            tracker['bytes'] += entity_bytes
 
             if tracker.get('count') % 10_000 == 0:
                 # log count/size at a sane level
                 self.log.debug(
                     '''feature=batch, action=data-indicators, '''
-                    f'''count={tracker.get('count'):,}'''
+                    f'''count={tracker.get('count'):,}, bytes={tracker.get('bytes'):,}'''
                 )
 
+            if self.data_max_reached(tracker):
+                return True
+        return False
+
+    def data_serialized(self, track_entities: Optional[bool] = False) -> 'BatchSerializer':
+        """Return the next batch chunk serialized one entity at a time.
+
+        Unlike the data property, the group and indicator data is written to a spooled temporary
+        file as it is collected, so memory usage does not grow with the size of the batch.
+
+        Args:
+            track_entities: If True, the serialized entities are indexed by xid.
+
+        Returns:
+            BatchSerializer: The serialized group/indicator data and the file data.
+        """
+        return self.data_collect(
+            BatchSerializer(temp_path=self.inputs.model.tc_temp_path, track_entities=track_entities)
+        )
+
+    def data_max_reached(self, tracker: dict) -> bool:
+        """Return True if the max entity count or max size of a single batch has been reached.
+
+        Args:
+            tracker: A dict containing total count of all entities collected and
+                the total size in bytes of all entities collected.
+        """
+        if (
+            tracker.get('count') >= self._batch_max_chunk
+            or tracker.get('bytes') >= self._batch_max_size
+        ):
+            # stop processing xid once max limit are reached
+            self.log.info(
+                '''feature=batch, event=max-value-reached, '''
+                f'''count={tracker.get('count'):,}, bytes={tracker.get('bytes'):,}'''
+            )
+            return True
         return False
 
+    @property
+    def dedup(self) -> bool:
+        """Return True if duplicate groups/indicators are merged into a single entity."""
+        return self._dedup_index is not None
+
+    @dedup.setter
+    def dedup(self, dedup: bool):
+        """Enable/disable merging of groups/indicators with the same type and summary/name.
+
+        .. note:: Groups/indicators already added to the batch are not indexed.
+        """
+        if dedup is not True:
+            self._dedup_index = None
+        elif self._dedup_index is None:
+            self._dedup_index = BatchDedupIndex()
+
     def document(self, name: str, file_name: str, **kwargs) -> 'Document':
         """Add Document data to Batch.
 
@@ -737,27 +885,31 @@ class BatchWriter:
         return self._group(group_obj, kwargs.get('store', True))
 
     def dump(self):
-        """Process Batch request to ThreatConnect API."""
-        content = self.data
-        content.pop('file', {})
-        if not content.get('group') and not content.get('indicator'):
-            return
-
-        # special code for debugging App using batchV2.
-        self.write_batch_json(content)
-
-        # store the length of the batch data to use for poll interval calculations
-        self.log.info(
-            '''feature=batch, event=dump, type=group, ''' f'''count={len(content.get('group')):,}'''
-        )
-        self.log.info(
-            '''feature=batch, event=dump, type=indicator, '''
-            f'''count={len(content.get('indicator')):,}'''
-        )
-        self.log.info(f'''feature=batch, event=dump, type=batch, size={self._batch_size:,}''')
+        """Write all batch data to disk, one file per batch chunk."""
+        while True:
+            content = self.data_serialized()
+            content.pop('file', {})
+            if not content.get('group') and not content.get('indicator'):
+                content.close()
+                break
+
+            # special code for debugging App using batchV2.
+            self.write_batch_json(content)
+
+            # store the length of the batch data to use for poll interval calculations
+            self.log.info(
+                '''feature=batch, event=dump, type=group, '''
+                f'''count={len(content.get('group')):,}'''
+            )
+            self.log.info(
+                '''feature=batch, event=dump, type=indicator, '''
+                f'''count={len(content.get('indicator')):,}'''
+            )
+            content.close()
+        self.log.info(f'''feature=batch, event=dump, type=batch, size={self._batch_size.value:,}''')
 
         # reset batch size after dump
-        self._batch_size = 0
+        self._batch_size = BatchSize()
 
     def email(self, name: str, subject: str, header: str, body: str, **kwargs) -> 'Email':
         """Add Email data to Batch.
@@ -908,10 +1060,10 @@ class BatchWriter:
         return self._groups
 
     @property
-    def groups_shelf(self) -> 'shelve.DbfilenameShelf':
+    def groups_shelf(self) -> BatchSpillStore:
         """Return dictionary of all Groups data."""
         if self._groups_shelf is None:
-            self._groups_shelf = shelve.open(self.group_shelf_fqfn, writeback=False)  # nosec
+            self._groups_shelf = BatchSpillStore(self.group_shelf_fqfn)
         return self._groups_shelf
 
     def host(self, hostname: str, **kwargs) -> 'Host':
@@ -996,12 +1148,10 @@ class BatchWriter:
         return self._indicators
 
     @property
-    def indicators_shelf(self) -> 'shelve.DbfilenameShelf':
+    def indicators_shelf(self) -> BatchSpillStore:
         """Return dictionary of all Indicator data."""
         if self._indicators_shelf is None:
-            self._indicators_shelf = shelve.open(  # nosec
-                self.indicator_shelf_fqfn, writeback=False
-            )
+            self._indicators_shelf = BatchSpillStore(self.indicator_shelf_fqfn)
         return self._indicators_shelf
 
     def intrusion_set(self, name: str, **kwargs) -> 'IntrusionSet':
@@ -1099,7 +1249,7 @@ class BatchWriter:
         return self._group(group_obj, kwargs.get('store', True))
 
     def save(self, resource: Union[dict, 'GroupType', 'IndicatorType']):
-        """Save group|indicator dict, GroupType, or IndicatorTypes to shelve.
+        """Save group|indicator dict, GroupType, or IndicatorTypes to the shelf (spill store).
 
         Best effort to save group/indicator data to disk.  If for any reason the save fails
         the data will still be accessible from list in memory.
@@ -1280,7 +1430,7 @@ class BatchWriter:
         group_obj = Vulnerability(name, **kwargs)
         return self._group(group_obj, kwargs.get('store', True))
 
-    def write_batch_json(self, content: dict):
+    def write_batch_json(self, content: Union[dict, 'BatchSerializer']):
         """Write batch json data to a file."""
         if content:
             # get timestamp as a string without decimal place and consistent length
@@ -1291,8 +1441,12 @@ class BatchWriter:
             # TODO: is this needed
             self._batch_files.append(filename)
             fqfn = os.path.join(self.output_dir, filename)
-            with gzip.open(fqfn, mode='wt', encoding='utf-8') as fh:
-                json.dump(content, fh)
+            if isinstance(content, BatchSerializer):
+                with gzip.open(fqfn, mode='wb') as fh:
+                    content.write(fh)
+            else:
+                with gzip.open(fqfn, mode='wt', encoding='utf-8') as fh:
+                    json.dump(content, fh)
 
             # send callback the filename
             if callable(self.write_callback):
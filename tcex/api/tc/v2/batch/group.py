@@ -1,35 +1,59 @@
 """ThreatConnect Batch Import Module"""
 # standard library
 import json
+import sys
 import uuid
 from typing import Any, Callable, Optional, Union
 
 # first-party
 from tcex.api.tc.v2.batch.attribute import Attribute
+from tcex.api.tc.v2.batch.batch_size import json_size
 from tcex.api.tc.v2.batch.security_label import SecurityLabel
 from tcex.api.tc.v2.batch.tag import Tag
 from tcex.utils import Utils
 
 
 class Group:
-    """ThreatConnect Batch Group Object"""
+    """ThreatConnect Batch Group Object
+
+    The estimated JSON size of the attributes, labels, and tags is tracked as they are added.
+
+    .. note:: The data property builds the batch JSON on each access, changes made to the
+        returned dict are not stored on the Group. Use add_key_value() or the properties to
+        update fields.
+    """
 
     __slots__ = [
         '_attributes',
+        '_batch_size',
         '_file_content',
         '_group_data',
         '_labels',
-        '_name',
         '_processed',
-        '_type',
+        '_size',
         '_tags',
         'file_content',
         'malware',
         'password',
         'status',
-        'utils',
     ]
 
+    # metadata map for Group objects, shared by all instances
+    _metadata_map = {
+        'date_added': 'dateAdded',
+        'event_date': 'eventDate',
+        'file_name': 'fileName',
+        'file_text': 'fileText',
+        'file_type': 'fileType',
+        'first_seen': 'firstSeen',
+        'from_addr': 'from',
+        'publish_date': 'publishDate',
+        'to_addr': 'to',
+    }
+
+    # shared by all instances, Utils does not hold any state
+    utils = Utils()
+
     def __init__(self, group_type: str, name: str, **kwargs):
         """Initialize Class Properties.
 
@@ -38,39 +62,40 @@ class Group:
             name (str): The name for this Group.
             xid (str, kwargs): The external id for this Group.
         """
-        self._name = name
-        self._group_data = {'name': name, 'type': group_type}
-        self._type = group_type
+        # batch size counter, set when the Group is stored by the batch
+        self._batch_size = None
+        self._group_data = {'name': name, 'type': sys.intern(group_type)}
 
-        # properties
-        self._attributes = []
-        self._labels = []
+        # properties (attributes, labels, and tags are created on first use)
+        self._attributes = None
+        self._labels = None
         self._file_content = None
-        self._tags = []
+        self._tags = None
         self._processed = False
-        self.utils = Utils()
+        # estimated JSON size of the attributes, labels, and tags
+        self._size = 0
 
         # process all kwargs and update metadata field names
         for arg, value in kwargs.items():
             self.add_key_value(arg, value)
         # set xid to random and unique uuid4 value if not provided
         if kwargs.get('xid') is None:
-            self._group_data['xid'] = str(uuid.uuid4())
-
-    @property
-    def _metadata_map(self) -> dict:
-        """Return metadata map for Group objects."""
-        return {
-            'date_added': 'dateAdded',
-            'event_date': 'eventDate',
-            'file_name': 'fileName',
-            'file_text': 'fileText',
-            'file_type': 'fileType',
-            'first_seen': 'firstSeen',
-            'from_addr': 'from',
-            'publish_date': 'publishDate',
-            'to_addr': 'to',
-        }
+            self._set('xid', str(uuid.uuid4()))
+
+    def _resize(self, size: int):
+        """Add the change in size to the Group size and the batch size counter."""
+        self._size += size
+        if self._batch_size is not None:
+            self._batch_size.value += size
+
+    def _set(self, key: str, value: Any):
+        """Set the value of a field, adding the change in size to the batch size counter."""
+        if self._batch_size is not None:
+            size = json_size(value) + len(key) + 6
+            if key in self._group_data:
+                size -= json_size(self._group_data[key]) + len(key) + 6
+            self._batch_size.value += size
+        self._group_data[key] = value
 
     def add_file(self, filename: str, file_content: Union[bytes, Callable[[str], Any], str]):
         """Add a file for Document and Report types.
@@ -84,7 +109,7 @@ class Group:
             filename: The name of the file.
             file_content: The contents of the file or callback to get contents.
         """
-        self._group_data['fileName'] = filename
+        self._set('fileName', filename)
         self._file_content = file_content
 
     def add_key_value(self, key: str, value: str):
@@ -104,14 +129,12 @@ class Group:
         key = self._metadata_map.get(key, key)
         if key in ['dateAdded', 'eventDate', 'firstSeen', 'publishDate']:
             if value is not None:
-                self._group_data[key] = self.utils.any_to_datetime(value).strftime(
-                    '%Y-%m-%dT%H:%M:%SZ'
-                )
+                self._set(key, self.utils.any_to_datetime(value).strftime('%Y-%m-%dT%H:%M:%SZ'))
         elif key == 'file_content':
             # file content arg is not part of Group JSON
             pass
         else:
-            self._group_data[key] = value
+            self._set(key, value)
 
     def association(self, group_xid: str):
         """Add association using xid value.
@@ -119,7 +142,11 @@ class Group:
         Args:
             group_xid: The external id of the Group to associate.
         """
-        self._group_data.setdefault('associatedGroupXid', []).append(group_xid)
+        if 'associatedGroupXid' not in self._group_data:
+            self._set('associatedGroupXid', [])
+        self._group_data['associatedGroupXid'].append(group_xid)
+        if self._batch_size is not None:
+            self._batch_size.value += len(group_xid) + 4
 
     def attribute(
         self,
@@ -149,13 +176,19 @@ class Group:
         Returns:
             Attribute: An instance of the Attribute class.
         """
+        if self._attributes is None:
+            self._attributes = []
+            self._resize(17)  # "attribute": []
+
         attr = Attribute(attr_type, attr_value, displayed, source, formatter)
         if unique == 'Type':
             for attribute_data in self._attributes:
                 if attribute_data.type == attr_type:
                     self._attributes.remove(attribute_data)
+                    self._resize(-(attribute_data.data_size + 2))
                     break
             self._attributes.append(attr)
+            self._resize(attr.data_size + 2)
         elif unique is True:
             for attribute_data in self._attributes:
                 if attribute_data.type == attr_type and attribute_data.value == attr.value:
@@ -163,31 +196,31 @@ class Group:
                     break
             else:
                 self._attributes.append(attr)
+                self._resize(attr.data_size + 2)
         elif unique is False:
             self._attributes.append(attr)
+            self._resize(attr.data_size + 2)
         return attr
 
     @property
     def data(self) -> dict:
-        """Return Group data."""
+        """Return Group data (a new dict is built on each access)."""
+        group_data = dict(self._group_data)
         # add attributes
         if self._attributes:
-            self._group_data['attribute'] = []
-            for attr in self._attributes:
-                if attr.valid:
-                    self._group_data['attribute'].append(attr.data)
+            group_data['attribute'] = [attr.data for attr in self._attributes if attr.valid]
         # add security labels
         if self._labels:
-            self._group_data['securityLabel'] = []
-            for label in self._labels:
-                self._group_data['securityLabel'].append(label.data)
+            group_data['securityLabel'] = [label.data for label in self._labels]
         # add tags
         if self._tags:
-            self._group_data['tag'] = []
-            for tag in self._tags:
-                if tag.valid:
-                    self._group_data['tag'].append(tag.data)
-        return self._group_data
+            group_data['tag'] = [tag.data for tag in self._tags if tag.valid]
+        return group_data
+
+    @property
+    def data_size(self) -> int:
+        """Return the estimated size in bytes of the Group JSON data."""
+        return self._size + json_size(self._group_data)
 
     @property
     def date_added(self) -> str:
@@ -197,8 +230,8 @@ class Group:
     @date_added.setter
     def date_added(self, date_added: str):
         """Set Indicator dateAdded."""
-        self._group_data['dateAdded'] = self.utils.any_to_datetime(date_added).strftime(
-            '%Y-%m-%dT%H:%M:%SZ'
+        self._set(
+            'dateAdded', self.utils.any_to_datetime(date_added).strftime('%Y-%m-%dT%H:%M:%SZ')
         )
 
     @property
@@ -244,6 +277,10 @@ class Group:
         Returns:
             SecurityLabel: An instance of the SecurityLabel class.
         """
+        if self._labels is None:
+            self._labels = []
+            self._resize(21)  # "securityLabel": []
+
         label = SecurityLabel(name, description, color)
         for label_data in self._labels:
             if label_data.name == name:
@@ -251,6 +288,7 @@ class Group:
                 break
         else:
             self._labels.append(label)
+            self._resize(label.data_size + 2)
         return label
 
     def tag(self, name: str, formatter: Optional[Callable[[str], str]] = None) -> 'Tag':
@@ -263,6 +301,10 @@ class Group:
         Returns:
             Tag: An instance of the Tag class.
         """
+        if self._tags is None:
+            self._tags = []
+            self._resize(11)  # "tag": []
+
         tag = Tag(name, formatter)
         for tag_data in self._tags:
             if tag_data.name == name:
@@ -270,6 +312,7 @@ class Group:
                 break
         else:
             self._tags.append(tag)
+            self._resize(tag.data_size + 2)
         return tag
 
     @property
@@ -343,8 +386,8 @@ class Campaign(Group):
     @first_seen.setter
     def first_seen(self, first_seen: str):
         """Set Document first seen."""
-        self._group_data['firstSeen'] = self.utils.any_to_datetime(first_seen).strftime(
-            '%Y-%m-%dT%H:%M:%SZ'
+        self._set(
+            'firstSeen', self.utils.any_to_datetime(first_seen).strftime('%Y-%m-%dT%H:%M:%SZ')
         )
 
 
@@ -383,7 +426,7 @@ class Document(Group):
             xid (str, kwargs): The external id for this Group.
         """
         super().__init__('Document', name, **kwargs)
-        self._group_data['fileName'] = file_name
+        self._set('fileName', file_name)
         # file data/content to upload
         self._file_content = kwargs.get('file_content')
 
@@ -404,7 +447,7 @@ class Document(Group):
     @malware.setter
     def malware(self, malware: bool):
         """Set Document malware."""
-        self._group_data['malware'] = malware
+        self._set('malware', malware)
 
     @property
     def password(self) -> str:
@@ -414,7 +457,7 @@ class Document(Group):
     @password.setter
     def password(self, password: str):
         """Set Document password."""
-        self._group_data['password'] = password
+        self._set('password', password)
 
 
 class Email(Group):
@@ -436,10 +479,10 @@ class Email(Group):
             xid (str, kwargs): The external id for this Group.
         """
         super().__init__('Email', name, **kwargs)
-        self._group_data['subject'] = subject
-        self._group_data['header'] = header
-        self._group_data['body'] = body
-        self._group_data['score'] = 0
+        self._set('subject', subject)
+        self._set('header', header)
+        self._set('body', body)
+        self._set('score', 0)
 
     @property
     def from_addr(self) -> str:
@@ -449,7 +492,7 @@ class Email(Group):
     @from_addr.setter
     def from_addr(self, from_addr: str):
         """Set Email from."""
-        self._group_data['from'] = from_addr
+        self._set('from', from_addr)
 
     @property
     def score(self) -> str:
@@ -459,7 +502,7 @@ class Email(Group):
     @score.setter
     def score(self, score: str):
         """Set Email from."""
-        self._group_data['score'] = score
+        self._set('score', score)
 
     @property
     def to_addr(self) -> str:
@@ -469,7 +512,7 @@ class Email(Group):
     @to_addr.setter
     def to_addr(self, to_addr: str):
         """Set Email to."""
-        self._group_data['to'] = to_addr
+        self._set('to', to_addr)
 
 
 class Event(Group):
@@ -503,8 +546,8 @@ class Event(Group):
     @event_date.setter
     def event_date(self, event_date: str):
         """Set the Events "event date" value."""
-        self._group_data['eventDate'] = self.utils.any_to_datetime(event_date).strftime(
-            '%Y-%m-%dT%H:%M:%SZ'
+        self._set(
+            'eventDate', self.utils.any_to_datetime(event_date).strftime('%Y-%m-%dT%H:%M:%SZ')
         )
 
     @property
@@ -515,7 +558,7 @@ class Event(Group):
     @status.setter
     def status(self, status: str):
         """Set the Events status value."""
-        self._group_data['status'] = status
+        self._set('status', status)
 
 
 class Incident(Group):
@@ -554,8 +597,8 @@ class Incident(Group):
     @event_date.setter
     def event_date(self, event_date: str):
         """Set Incident event_date."""
-        self._group_data['eventDate'] = self.utils.any_to_datetime(event_date).strftime(
-            '%Y-%m-%dT%H:%M:%SZ'
+        self._set(
+            'eventDate', self.utils.any_to_datetime(event_date).strftime('%Y-%m-%dT%H:%M:%SZ')
         )
 
     @property
@@ -578,7 +621,7 @@ class Incident(Group):
         + Rejected
         + Deleted
         """
-        self._group_data['status'] = status
+        self._set('status', status)
 
 
 class IntrusionSet(Group):
@@ -651,8 +694,8 @@ class Report(Group):
     @publish_date.setter
     def publish_date(self, publish_date: str):
         """Set Report publish date"""
-        self._group_data['publishDate'] = self.utils.any_to_datetime(publish_date).strftime(
-            '%Y-%m-%dT%H:%M:%SZ'
+        self._set(
+            'publishDate', self.utils.any_to_datetime(publish_date).strftime('%Y-%m-%dT%H:%M:%SZ')
         )
 
 
@@ -684,9 +727,9 @@ class Signature(Group):
             xid (str, kwargs): The external id for this Group.
         """
         super().__init__('Signature', name, **kwargs)
-        self._group_data['fileName'] = file_name
-        self._group_data['fileType'] = file_type
-        self._group_data['fileText'] = file_text
+        self._set('fileName', file_name)
+        self._set('fileType', file_type)
+        self._set('fileText', file_text)
 
 
 class Tactic(Group):
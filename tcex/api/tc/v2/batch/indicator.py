@@ -1,11 +1,13 @@
 """ThreatConnect Batch Import Module"""
 # standard library
 import json
+import sys
 import uuid
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 # first-party
 from tcex.api.tc.v2.batch.attribute import Attribute
+from tcex.api.tc.v2.batch.batch_size import json_size
 from tcex.api.tc.v2.batch.security_label import SecurityLabel
 from tcex.api.tc.v2.batch.tag import Tag
 from tcex.utils import Utils
@@ -50,20 +52,53 @@ def custom_indicator_class_factory(indicator_type, base_class, class_dict, value
 
 
 class Indicator:
-    """ThreatConnect Batch Indicator Object"""
+    """ThreatConnect Batch Indicator Object
+
+    The summary, type, xid, confidence, and rating are stored as slots and any other field in a
+    dict that is only created when a field is added. Associations (group xids), attributes, file
+    occurrences, labels, and tags share a single list that is only created when the first one is
+    added.
+
+    .. note:: The data property builds the batch JSON on each access, changes made to the
+        returned dict are not stored on the Indicator. Use add_key_value() or the properties
+        to update fields.
+    """
 
     __slots__ = [
-        '_attributes',
-        '_file_actions',
-        '_indicator_data',
-        '_labels',
-        '_occurrences',
+        '_batch_size',
+        '_children',
+        '_confidence',
+        '_fields',
+        '_rating',
         '_summary',
-        '_tags',
         '_type',
-        'utils',
+        '_xid',
     ]
 
+    # batch JSON key of each child class
+    _child_keys = {
+        'Attribute': 'attribute',
+        'FileOccurrence': 'fileOccurrence',
+        'SecurityLabel': 'securityLabel',
+        'str': 'associatedGroups',
+        'Tag': 'tag',
+    }
+
+    # metadata map for Indicator objects, shared by all instances
+    _metadata_map = {
+        'date_added': 'dateAdded',
+        'dnsActive': 'flag1',
+        'dns_active': 'flag1',
+        'last_modified': 'lastModified',
+        'private_flag': 'privateFlag',
+        'size': 'intValue1',
+        'whoisActive': 'flag2',
+        'whois_active': 'flag2',
+    }
+
+    # shared by all instances, Utils does not hold any state
+    utils = Utils()
+
     def __init__(self, indicator_type: str, summary: str, **kwargs):
         """Initialize Class Properties.
 
@@ -78,38 +113,84 @@ class Indicator:
             rating (str, kwargs): The threat rating for this Indicator.
             xid (str, kwargs): The external id for this Indicator.
         """
+        # batch size counter, set when the Indicator is stored by the batch
+        self._batch_size = None
         self._summary = summary
-        self._type = indicator_type
-        self._indicator_data = {'summary': summary, 'type': indicator_type}
+        self._type = sys.intern(indicator_type)
+        self._xid = None
+        self._confidence = None
+        self._rating = None
 
-        # properties
-        self._attributes = []
-        self._file_actions = []
-        self._labels = []
-        self._occurrences = []
-        self._tags = []
-        self.utils = Utils()
+        # properties (created on first use)
+        self._children = None
+        self._fields = None
 
         # process all kwargs and update metadata field names
         for arg, value in kwargs.items():
             self.add_key_value(arg, value)
         # set xid to random and unique uuid4 value if not provided
-        if kwargs.get('xid') is None:
-            self._indicator_data['xid'] = str(uuid.uuid4())
-
-    @property
-    def _metadata_map(self) -> dict:
-        """Return metadata map for Indicator objects."""
-        return {
-            'date_added': 'dateAdded',
-            'dnsActive': 'flag1',
-            'dns_active': 'flag1',
-            'last_modified': 'lastModified',
-            'private_flag': 'privateFlag',
-            'size': 'intValue1',
-            'whoisActive': 'flag2',
-            'whois_active': 'flag2',
-        }
+        if self._xid is None:
+            self._xid = str(uuid.uuid4())
+
+    def _child_add(self, child: Any):
+        """Add an association, attribute, file occurrence, label, or tag."""
+        if self._children is None:
+            self._children = []
+        if self._batch_size is not None:
+            child_class = child.__class__
+            # {"groupXid": ""},
+            size = 16 + len(child) if child_class is str else child.data_size + 2
+            if not any(c.__class__ is child_class for c in self._children):
+                # the key and brackets of the list (e.g., "tag": [])
+                size += len(self._child_keys[child_class.__name__]) + 6
+            self._batch_size.value += size
+        self._children.append(child)
+
+    def _children_of(self, child_class: type) -> list:
+        """Return the children of the provided class (e.g., Attribute) in the order added."""
+        return [c for c in self._children or [] if c.__class__ is child_class]
+
+    def _get(self, key: str) -> Any:
+        """Return the value of a field."""
+        if key == 'confidence':
+            return self._confidence
+        if key == 'rating':
+            return self._rating
+        if self._fields is None:
+            return None
+        return self._fields.get(key)
+
+    def _fields_size(self) -> int:
+        """Return the estimated size in bytes of the Indicator fields (excluding children)."""
+        # {"summary": "", "type": "", "xid": ""}
+        size = 30 + json_size(self._summary) + json_size(self._type) + json_size(self._xid)
+        if self._confidence is not None:
+            size += 20
+        if self._rating is not None:
+            size += 20
+        if self._fields:
+            size += json_size(self._fields)
+        return size
+
+    def _set(self, key: str, value: Any):
+        """Set the value of a field, adding the change in size to the batch size counter."""
+        size = 0 if self._batch_size is None else self._fields_size()
+        if key == 'summary':
+            self._summary = value
+        elif key == 'type':
+            self._type = sys.intern(value)
+        elif key == 'xid':
+            self._xid = value
+        elif key == 'confidence':
+            self._confidence = value
+        elif key == 'rating':
+            self._rating = value
+        else:
+            if self._fields is None:
+                self._fields = {}
+            self._fields[key] = value
+        if self._batch_size is not None:
+            self._batch_size.value += self._fields_size() - size
 
     def add_key_value(self, key: str, value: str):
         """Add custom field to Indicator object.
@@ -127,25 +208,23 @@ class Indicator:
         """
         key = self._metadata_map.get(key, key)
         if key in ['dateAdded', 'lastModified']:
-            self._indicator_data[key] = self.utils.any_to_datetime(value).strftime(
-                '%Y-%m-%dT%H:%M:%SZ'
-            )
+            self._set(key, self.utils.any_to_datetime(value).strftime('%Y-%m-%dT%H:%M:%SZ'))
         elif key == 'confidence':
-            self._indicator_data[key] = int(value)
+            self._set(key, int(value))
         elif key == 'rating':
-            self._indicator_data[key] = float(value)
+            self._set(key, float(value))
         else:
-            self._indicator_data[key] = value
+            self._set(key, value)
 
     @property
     def active(self) -> bool:
         """Return Indicator active."""
-        return self._indicator_data.get('active')
+        return self._get('active')
 
     @active.setter
     def active(self, active: bool):
         """Set Indicator active."""
-        self._indicator_data['active'] = self.utils.to_bool(active)
+        self._set('active', self.utils.to_bool(active))
 
     def association(self, group_xid: str):
         """Add association using xid value.
@@ -153,8 +232,8 @@ class Indicator:
         Args:
             group_xid (str): The external id of the Group to associate.
         """
-        association = {'groupXid': group_xid}
-        self._indicator_data.setdefault('associatedGroups', []).append(association)
+        # associations are stored as the group xid string
+        self._child_add(group_xid)
 
     def attribute(
         self,
@@ -186,21 +265,21 @@ class Indicator:
         """
         attr = Attribute(attr_type, attr_value, displayed, source, formatter)
         if unique == 'Type':
-            for attribute_data in self._attributes:
+            for attribute_data in self._children_of(Attribute):
                 if attribute_data.type == attr_type:
                     attr = attribute_data
                     break
             else:
-                self._attributes.append(attr)
+                self._child_add(attr)
         elif unique is True:
-            for attribute_data in self._attributes:
+            for attribute_data in self._children_of(Attribute):
                 if attribute_data.type == attr_type and attribute_data.value == attr.value:
                     attr = attribute_data
                     break
             else:
-                self._attributes.append(attr)
+                self._child_add(attr)
         elif unique is False:
-            self._attributes.append(attr)
+            self._child_add(attr)
         return attr
 
     @staticmethod
@@ -223,68 +302,80 @@ class Indicator:
     @property
     def confidence(self) -> int:
         """Return Indicator confidence."""
-        return self._indicator_data.get('confidence')
+        return self._get('confidence')
 
     @confidence.setter
     def confidence(self, confidence: int):
         """Set Indicator confidence."""
-        self._indicator_data['confidence'] = int(confidence)
+        self._set('confidence', int(confidence))
 
     @property
     def data(self) -> dict:
-        """Return Indicator data."""
-        # add attributes
-        if self._attributes:
-            self._indicator_data['attribute'] = []
-            for attr in self._attributes:
-                if attr.valid:
-                    self._indicator_data['attribute'].append(attr.data)
-        # add file actions
-        if self._file_actions:
-            self._indicator_data.setdefault('fileAction', {})
-            self._indicator_data['fileAction'].setdefault('children', [])
-            for action in self._file_actions:
-                self._indicator_data['fileAction']['children'].append(action.data)
-        # add file occurrences
-        if self._occurrences:
-            self._indicator_data.setdefault('fileOccurrence', [])
-            for occurrence in self._occurrences:
-                self._indicator_data['fileOccurrence'].append(occurrence.data)
-        # add security labels
-        if self._labels:
-            self._indicator_data['securityLabel'] = []
-            for label in self._labels:
-                self._indicator_data['securityLabel'].append(label.data)
-        # add tags
-        if self._tags:
-            self._indicator_data['tag'] = []
-            for tag in self._tags:
-                if tag.valid:
-                    self._indicator_data['tag'].append(tag.data)
-        return self._indicator_data
+        """Return Indicator data (a new dict is built on each access)."""
+        indicator_data = {'summary': self._summary, 'type': self._type, 'xid': self._xid}
+        if self._confidence is not None:
+            indicator_data['confidence'] = self._confidence
+        if self._rating is not None:
+            indicator_data['rating'] = self._rating
+        if self._fields:
+            indicator_data.update(self._fields)
+        if self._children:
+            children = {}
+            for child in self._children:
+                if child.__class__ is str:
+                    children.setdefault('associatedGroups', []).append({'groupXid': child})
+                    continue
+                items = children.setdefault(self._child_keys[child.__class__.__name__], [])
+                # attributes and tags without a value are not added
+                if getattr(child, 'valid', True):
+                    items.append(child.data)
+            # add associations, attributes, file occurrences, security labels, and tags
+            for key in ['associatedGroups', 'attribute', 'fileOccurrence', 'securityLabel', 'tag']:
+                if key in children:
+                    indicator_data[key] = children[key]
+        return indicator_data
+
+    @property
+    def data_size(self) -> int:
+        """Return the estimated size in bytes of the Indicator JSON data."""
+        size = self._fields_size()
+        if self._children:
+            child_classes = set()
+            for child in self._children:
+                child_class = child.__class__
+                child_classes.add(child_class)
+                if child_class is str:
+                    # {"groupXid": ""},
+                    size += 16 + len(child)
+                else:
+                    size += child.data_size + 2
+            # the key and brackets of each list (e.g., "tag": [])
+            size += sum(len(self._child_keys[c.__name__]) + 6 for c in child_classes)
+        return size
 
     @property
     def date_added(self) -> str:
         """Return Indicator dateAdded."""
-        return self._indicator_data.get('dateAdded')
+        return self._get('dateAdded')
 
     @date_added.setter
     def date_added(self, date_added: str):
         """Set Indicator dateAdded."""
-        self._indicator_data['dateAdded'] = self.utils.any_to_datetime(date_added).strftime(
-            '%Y-%m-%dT%H:%M:%SZ'
+        self._set(
+            'dateAdded', self.utils.any_to_datetime(date_added).strftime('%Y-%m-%dT%H:%M:%SZ')
         )
 
     @property
     def last_modified(self) -> str:
         """Return Indicator lastModified."""
-        return self._indicator_data.get('lastModified')
+        return self._get('lastModified')
 
     @last_modified.setter
     def last_modified(self, last_modified: str):
         """Set Indicator lastModified."""
-        self._indicator_data['lastModified'] = self.utils.any_to_datetime(last_modified).strftime(
-            '%Y-%m-%dT%H:%M:%SZ'
+        self._set(
+            'lastModified',
+            self.utils.any_to_datetime(last_modified).strftime('%Y-%m-%dT%H:%M:%SZ'),
         )
 
     def occurrence(
@@ -303,38 +394,38 @@ class Indicator:
         Returns:
             FileOccurrence: An instance of Occurrence.
         """
-        if self._indicator_data.get('type') != 'File':
+        if self._type != 'File':
             # Indicator object has no logger to output warning
             return None
 
         occurrence_obj = FileOccurrence(file_name, path, date)
-        self._occurrences.append(occurrence_obj)
+        self._child_add(occurrence_obj)
         return occurrence_obj
 
     @property
     def private_flag(self) -> bool:
         """Return Indicator private flag."""
-        return self._indicator_data.get('privateFlag')
+        return self._get('privateFlag')
 
     @private_flag.setter
     def private_flag(self, private_flag: bool):
         """Set Indicator private flag."""
-        self._indicator_data['privateFlag'] = self.utils.to_bool(private_flag)
+        self._set('privateFlag', self.utils.to_bool(private_flag))
 
     @property
     def rating(self) -> float:
         """Return Indicator rating."""
-        return self._indicator_data.get('rating')
+        return self._get('rating')
 
     @rating.setter
     def rating(self, rating: float):
         """Set Indicator rating."""
-        self._indicator_data['rating'] = float(rating)
+        self._set('rating', float(rating))
 
     @property
     def summary(self) -> str:
         """Return Indicator summary."""
-        return self._indicator_data.get('summary')
+        return self._summary
 
     def security_label(
         self, name: str, description: Optional[str] = None, color: Optional[str] = None
@@ -353,12 +444,12 @@ class Indicator:
             SecurityLabel: An instance of the SecurityLabel class.
         """
         label = SecurityLabel(name, description, color)
-        for label_data in self._labels:
+        for label_data in self._children_of(SecurityLabel):
             if label_data.name == name:
                 label = label_data
                 break
         else:
-            self._labels.append(label)
+            self._child_add(label)
         return label
 
     def tag(self, name: str, formatter: Optional[Callable[[str], str]] = None) -> 'Tag':
@@ -372,23 +463,23 @@ class Indicator:
             Tag: An instance of the Tag class.
         """
         tag = Tag(name, formatter)
-        for tag_data in self._tags:
+        for tag_data in self._children_of(Tag):
             if tag_data.name == name:
                 tag = tag_data
                 break
         else:
-            self._tags.append(tag)
+            self._child_add(tag)
         return tag
 
     @property
     def type(self) -> str:
         """Return Group type."""
-        return self._indicator_data.get('type')
+        return self._type
 
     @property
     def xid(self) -> str:
         """Return Group xid."""
-        return self._indicator_data.get('xid')
+        return self._xid
 
     def __str__(self) -> str:
         """Return string represtentation of object"""
@@ -482,7 +573,7 @@ class EmailAddress(Indicator):
 class File(Indicator):
     """ThreatConnect Batch File Object"""
 
-    __slots__ = []
+    __slots__ = ['_file_actions']
 
     def __init__(
         self,
@@ -506,55 +597,82 @@ class File(Indicator):
             size (str, kwargs): The file size for this Indicator.
             xid (str, kwargs): The external id for this Indicator.
         """
+        self._file_actions = None
         summary = self.build_summary(md5, sha1, sha256)  # build the indicator summary
         super().__init__('File', summary, **kwargs)
-        # self._file_action = []
 
     def action(self, relationship: str) -> 'FileAction':
         """Add a File Action."""
-        action_obj = FileAction(self._indicator_data.get('xid'), relationship)
+        if self._file_actions is None:
+            self._file_actions = []
+
+        action_obj = FileAction(self._xid, relationship)
+        if self._batch_size is not None:
+            # "fileAction": {"children": []}
+            self._batch_size.value += action_obj.data_size + (2 if self._file_actions else 32)
         self._file_actions.append(action_obj)
         return action_obj
 
+    @property
+    def data(self) -> dict:
+        """Return Indicator data (a new dict is built on each access)."""
+        indicator_data = super().data
+        # add file actions
+        if self._file_actions:
+            indicator_data['fileAction'] = dict(
+                indicator_data.get('fileAction', {}),
+                children=[action.data for action in self._file_actions],
+            )
+        return indicator_data
+
+    @property
+    def data_size(self) -> int:
+        """Return the estimated size in bytes of the Indicator JSON data."""
+        size = super().data_size
+        if self._file_actions:
+            # "fileAction": {"children": []}
+            size += 30 + sum(action.data_size + 2 for action in self._file_actions)
+        return size
+
     @property
     def md5(self) -> str:
         """Return Indicator md5."""
-        return self._indicator_data.get('md5')
+        return self._get('md5')
 
     @md5.setter
     def md5(self, md5: str):
         """Set Indicator md5."""
-        self._indicator_data['md5'] = md5
+        self._set('md5', md5)
 
     @property
     def sha1(self) -> str:
         """Return Indicator sha1."""
-        return self._indicator_data.get('sha1')
+        return self._get('sha1')
 
     @sha1.setter
     def sha1(self, sha1: str):
         """Set Indicator sha1."""
-        self._indicator_data['sha1'] = sha1
+        self._set('sha1', sha1)
 
     @property
     def sha256(self) -> str:
         """Return Indicator sha256."""
-        return self._indicator_data.get('sha256')
+        return self._get('sha256')
 
     @sha256.setter
     def sha256(self, sha256: str):
         """Set Indicator sha256."""
-        self._indicator_data['sha256'] = sha256
+        self._set('sha256', sha256)
 
     @property
     def size(self) -> int:
         """Return Indicator size."""
-        return self._indicator_data.get('intValue1')
+        return self._get('intValue1')
 
     @size.setter
     def size(self, size: int):
         """Set Indicator size."""
-        self._indicator_data['intValue1'] = size
+        self._set('intValue1', size)
 
 
 class Host(Indicator):
@@ -582,22 +700,22 @@ class Host(Indicator):
     @property
     def dns_active(self) -> bool:
         """Return Indicator dns active."""
-        return self._indicator_data.get('flag1')
+        return self._get('flag1')
 
     @dns_active.setter
     def dns_active(self, dns_active: bool):
         """Set Indicator dns active."""
-        self._indicator_data['flag1'] = self.utils.to_bool(dns_active)
+        self._set('flag1', self.utils.to_bool(dns_active))
 
     @property
     def whois_active(self) -> bool:
         """Return Indicator whois active."""
-        return self._indicator_data.get('flag2')
+        return self._get('flag2')
 
     @whois_active.setter
     def whois_active(self, whois_active: bool):
         """Set Indicator whois active."""
-        self._indicator_data['flag2'] = self.utils.to_bool(whois_active)
+        self._set('flag2', self.utils.to_bool(whois_active))
 
 
 class Mutex(Indicator):
@@ -711,12 +829,20 @@ class FileAction:
 
     @property
     def data(self) -> dict:
-        """Return File Occurrence data."""
+        """Return File Action data."""
         if self._children:
-            for child in self._children:
-                self._action_data.setdefault('children', []).append(child.data)
+            return dict(self._action_data, children=[child.data for child in self._children])
         return self._action_data
 
+    @property
+    def data_size(self) -> int:
+        """Return the estimated size in bytes of the File Action JSON data."""
+        size = json_size(self._action_data)
+        if self._children:
+            # "children": []
+            size += 16 + sum(child.data_size + 2 for child in self._children)
+        return size
+
     def action(self, relationship):
         """Add a nested File Action."""
         action_obj = FileAction(self.xid, relationship)
@@ -730,7 +856,10 @@ class FileAction:
 class FileOccurrence:
     """ThreatConnect Batch FileAction Object."""
 
-    __slots__ = ['_occurrence_data', 'utils']
+    __slots__ = ['_occurrence_data']
+
+    # shared by all instances, Utils does not hold any state
+    utils = Utils()
 
     def __init__(
         self,
@@ -747,9 +876,6 @@ class FileOccurrence:
         """
         self._occurrence_data = {}
 
-        # properties
-        self.utils = Utils()
-
         if file_name is not None:
             self._occurrence_data['fileName'] = file_name
         if path is not None:
@@ -764,6 +890,11 @@ class FileOccurrence:
         """Return File Occurrence data."""
         return self._occurrence_data
 
+    @property
+    def data_size(self) -> int:
+        """Return the estimated size in bytes of the File Occurrence JSON data."""
+        return json_size(self._occurrence_data)
+
     @property
     def date(self) -> str:
         """Return File Occurrence date."""
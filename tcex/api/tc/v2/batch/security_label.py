@@ -3,11 +3,14 @@
 import json
 from typing import Optional
 
+# first-party
+from tcex.api.tc.v2.batch.batch_size import json_size
+
 
 class SecurityLabel:
     """ThreatConnect Batch SecurityLabel Object."""
 
-    __slots__ = ['_label_data']
+    __slots__ = ['_color', '_description', '_name']
 
     def __init__(self, name: str, description: Optional[str] = None, color: Optional[str] = None):
         """Initialize Class Properties.
@@ -17,42 +20,56 @@ class SecurityLabel:
             description: A description for this security label.
             color: A color (hex value) for this security label.
         """
-        self._label_data = {'name': name}
-        # add description if provided
-        if description is not None:
-            self._label_data['description'] = description
-        if color is not None:
-            self._label_data['color'] = color
+        self._name = name
+        self._description = description
+        self._color = color
 
     @property
     def color(self) -> str:
         """Return Security Label color."""
-        return self._label_data.get('color')
+        return self._color
 
     @color.setter
     def color(self, color: str):
         """Set Security Label color."""
-        self._label_data['color'] = color
+        self._color = color
 
     @property
     def data(self) -> dict:
         """Return Security Label data."""
-        return self._label_data
+        label_data = {'name': self._name}
+        # add description and color if provided
+        if self._description is not None:
+            label_data['description'] = self._description
+        if self._color is not None:
+            label_data['color'] = self._color
+        return label_data
+
+    @property
+    def data_size(self) -> int:
+        """Return the estimated size in bytes of the Security Label JSON data."""
+        # {"name": ""}
+        size = 12 + json_size(self._name)
+        if self._description is not None:
+            size += 17 + json_size(self._description)
+        if self._color is not None:
+            size += 11 + json_size(self._color)
+        return size
 
     @property
     def description(self) -> str:
         """Return Security Label description."""
-        return self._label_data.get('description')
+        return self._description
 
     @description.setter
     def description(self, description: str):
         """Set Security Label description."""
-        self._label_data['description'] = description
+        self._description = description
 
     @property
     def name(self) -> str:
         """Return Security Label name."""
-        return self._label_data.get('name')
+        return self._name
 
     def __str__(self) -> str:
         """Return string represtentation of object."""
@@ -3,11 +3,14 @@
 import json
 from typing import Callable, Optional
 
+# first-party
+from tcex.api.tc.v2.batch.batch_size import json_size
+
 
 class Tag:
     """ThreatConnect Batch Tag Object"""
 
-    __slots__ = ['_tag_data', '_valid']
+    __slots__ = ['_name']
 
     def __init__(self, name: str, formatter: Optional[Callable[[str], str]] = None):
         """Initialize Class Properties.
@@ -18,26 +21,29 @@ class Tag:
         """
         if formatter is not None:
             name = formatter(name)
-        self._tag_data = {'name': name}
-        # is tag not null or ''
-        self._valid = True
-        if not name:
-            self._valid = False
+        self._name = name
 
     @property
     def data(self) -> dict:
         """Return Tag data."""
-        return self._tag_data
+        return {'name': self._name}
+
+    @property
+    def data_size(self) -> int:
+        """Return the estimated size in bytes of the Tag JSON data."""
+        # {"name": ""}
+        return 10 + json_size(self._name)
 
     @property
     def name(self) -> str:
         """Return Tag name."""
-        return self._tag_data.get('name')
+        return self._name
 
     @property
     def valid(self) -> bool:
         """Return valid data."""
-        return self._valid
+        # is tag not null or ''
+        return bool(self._name)
 
     def __str__(self) -> str:
         """Return string represtentation of object."""
@@ -2,6 +2,8 @@
 # standard library
 import hashlib
 import logging
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from functools import lru_cache
 from typing import Optional
 from urllib.parse import quote
@@ -11,6 +13,7 @@ from requests import Session
 
 # first-party
 from tcex.exit.error_codes import TcExErrorCodes
+from tcex.sessions.thread_sessions import ThreadSessions
 
 # import local modules for dynamic reference
 module = __import__(__name__)
@@ -28,6 +31,8 @@ class TiTcRequest:
 
         # properties
         self.log = logger
+        self.parallel_ordered = True  # yield parallel pages in offset order
+        self.parallel_pages = 0  # number of pages fetched concurrently (0 disables)
         self.result_limit = 10000
 
     def _delete(self, url, params=None):
@@ -55,12 +60,13 @@ class TiTcRequest:
         """Return TcEx error codes."""
         return TcExErrorCodes()
 
-    def _get(self, url, params=None):
+    def _get(self, url, params=None, session=None):
         """Delete data from API."""
         params = params or {}
         params['createActivityLog'] = params.get('createActivityLog') or 'false'
 
-        r = self.session.get(url, params=params)
+        session = session or self.session
+        r = session.get(url, params=params)
 
         self.log.debug(
             f'Method: ({r.request.method.upper()}), '
@@ -105,33 +111,108 @@ class TiTcRequest:
             raise RuntimeError(code, message)
 
     def _iterate(self, url, params, api_entity):
-        """Iterate over API pagination."""
+        """Iterate over API pagination.
+
+        When parallel_pages is set the total count is taken from the first page and the
+        remaining pages are fetched concurrently by offset.
+        """
         safe_params = params.copy()
         safe_params['resultLimit'] = self.result_limit
 
-        should_iterate = True
         result_start = params.get('resultStart', 0)
         try:
             result_start = int(result_start)
         except Exception:
             result_start = 0
             self.log.error('Invalid ResultStart Param. Starting at 0')
-        while should_iterate:
-            safe_params['resultStart'] = result_start
-            r = self._get(url, params=safe_params)
-            if not self.success(r):
-                err = r.text or r.reason
-                self._handle_error(950, [r.status_code, err, r.url])
-            data = r.json().get('data', {})
-            if api_entity:
-                data = data.get(api_entity, [])
 
+        if self.parallel_pages > 0:
+            data, result_count = self._iterate_page(url, safe_params, api_entity, result_start)
+            yield from data
+            if len(data) < self.result_limit:
+                return
+
+            result_start += self.result_limit
+            if result_count is not None:
+                offsets = range(result_start, result_count, self.result_limit)
+                complete = False
+                for data in self._iterate_parallel(url, safe_params, api_entity, offsets):
+                    complete = complete or len(data) < self.result_limit
+                    yield from data
+                if complete:
+                    return
+
+                # continue with sequential pages if results were added while iterating
+                if offsets:
+                    result_start = offsets[-1] + self.result_limit
+
+        should_iterate = True
+        while should_iterate:
+            data, _ = self._iterate_page(url, safe_params, api_entity, result_start)
             if len(data) < self.result_limit:
                 should_iterate = False
             result_start += self.result_limit
 
             yield from data
 
+    def _iterate_page(self, url, params, api_entity, result_start, session=None):
+        """Return the data and the total result count (if available) of a single page."""
+        params = dict(params, resultStart=result_start)
+        r = self._get(url, params=params, session=session)
+        if not self.success(r):
+            err = r.text or r.reason
+            self._handle_error(950, [r.status_code, err, r.url])
+        data = r.json().get('data', {})
+        result_count = None
+        if api_entity:
+            result_count = data.get('resultCount')
+            data = data.get(api_entity, [])
+        return data, result_count
+
+    def _iterate_parallel(self, url, params, api_entity, offsets):
+        """Yield the data of each page, fetching up to parallel_pages pages concurrently.
+
+        Each worker thread fetches pages with its own copy of the session.
+        """
+        offsets = iter(offsets)
+        sessions = ThreadSessions(self.session)
+
+        def _page(result_start):
+            """Return the data and the total result count of a page fetched by a worker."""
+            return self._iterate_page(url, params, api_entity, result_start, sessions.current)
+
+        with ThreadPoolExecutor(
+            max_workers=self.parallel_pages, thread_name_prefix='ti-iterate'
+        ) as executor:
+
+            def _submit():
+                """Submit the next offset, returning False when there are no offsets left."""
+                result_start = next(offsets, None)
+                if result_start is None:
+                    return False
+                futures.append(executor.submit(_page, result_start))
+                return True
+
+            futures = deque()
+            while len(futures) < self.parallel_pages and _submit():
+                pass
+
+            try:
+                while futures:
+                    if self.parallel_ordered:
+                        future = futures.popleft()
+                    else:
+                        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                        future = done.pop()
+                        futures.remove(future)
+                    _submit()
+
+                    yield future.result()[0]
+            finally:
+                # cancel pending pages if the consumer stops iterating or on error
+                for future in futures:
+                    future.cancel()
+
     def _post(self, url, data, params=None):
         """Post data to API."""
         params = params or {}
@@ -181,38 +181,96 @@ class GenerateObjectABC(GenerateABC, ABC):
             '''Return the type specific filter object.'''
             return ArtifactFilter(self._session, self.tql)
         """
-        self.requirements['standard library'].append({'module': 'typing', 'imports': ['Optional']})
+        self.requirements['standard library'].append(
+            {'module': 'typing', 'imports': ['IO', 'Iterable', 'Iterator', 'Optional']}
+        )
         self.requirements['type-checking'].append('''from requests import Response''')
         return '\n'.join(
             [
-                f'''{self.i1}def download(self, params: Optional[dict] = None) -> bytes:''',
-                f'''{self.i2}"""Return the document attachment for Document/Report Types."""''',
-                f'''{self.i2}self._request(''',
-                f'''{self.i3}method='GET',''',
-                f'''{self.i3}url=f\'\'\'{{self.url('GET')}}/download\'\'\',''',
-                f'''{self.i3}# headers={{'content-type': 'application/octet-stream'}},''',
-                f'''{self.i3}headers=None,''',
-                f'''{self.i3}params=params,''',
-                f'''{self.i2})''',
-                f'''{self.i2}return self.request.content''',
+                f'''{self.i1}def download(''',
+                f'''{self.i2}self,''',
+                f'''{self.i2}params: Optional[dict] = None,''',
+                f'''{self.i2}output: Optional[Union[str, IO[bytes]]] = None,''',
+                f'''{self.i2}chunk_size: Optional[int] = 1_048_576,''',
+                f'''{self.i1}) -> Union[bytes, int]:''',
+                f'''{self.i2}"""Return the document attachment for Document/Report Types.''',
                 '',
-                f'''{self.i1}def pdf(self, params: Optional[dict] = None) -> bytes:''',
-                f'''{self.i2}"""Return the document attachment for Document/Report Types."""''',
-                f'''{self.i2}self._request(''',
-                f'''{self.i3}method='GET',''',
-                f'''{self.i3}body=None,''',
-                f'''{self.i3}url=f\'\'\'{{self.url('GET')}}/pdf\'\'\',''',
-                f'''{self.i3}headers=None,''',
-                f'''{self.i3}params=params,''',
-                f'''{self.i2})''',
+                (
+                    f'''{self.i2}When output (a file path or binary file object) is provided '''
+                    '''the attachment is written'''
+                ),
+                (
+                    f'''{self.i2}to output in chunks and the number of bytes written is '''
+                    '''returned.'''
+                ),
+                f'''{self.i2}"""''',
+                (
+                    f'''{self.i2}return self._download(f\'\'\'{{self.url('GET')}}/download'''
+                    '''\'\'\', params, output, chunk_size)'''
+                ),
+                '',
+                f'''{self.i1}def download_stream(''',
+                (
+                    f'''{self.i2}self, params: Optional[dict] = None, '''
+                    '''chunk_size: Optional[int] = 1_048_576'''
+                ),
+                f'''{self.i1}) -> Iterator[bytes]:''',
+                (
+                    f'''{self.i2}"""Yield the document attachment for Document/Report Types '''
+                    '''in chunks."""'''
+                ),
+                (
+                    f'''{self.i2}return self._download_stream(f\'\'\'{{self.url('GET')}}/'''
+                    '''download\'\'\', params, chunk_size)'''
+                ),
+                '',
+                f'''{self.i1}def pdf(''',
+                f'''{self.i2}self,''',
+                f'''{self.i2}params: Optional[dict] = None,''',
+                f'''{self.i2}output: Optional[Union[str, IO[bytes]]] = None,''',
+                f'''{self.i2}chunk_size: Optional[int] = 1_048_576,''',
+                f'''{self.i1}) -> Union[bytes, int]:''',
+                f'''{self.i2}"""Return the PDF for Document/Report Types.''',
+                '',
+                (
+                    f'''{self.i2}When output (a file path or binary file object) is provided '''
+                    '''the PDF is written to'''
+                ),
+                f'''{self.i2}output in chunks and the number of bytes written is returned.''',
+                f'''{self.i2}"""''',
+                (
+                    f'''{self.i2}return self._download(f\'\'\'{{self.url('GET')}}/pdf'''
+                    '''\'\'\', params, output, chunk_size)'''
+                ),
+                '',
+                f'''{self.i1}def pdf_stream(''',
+                (
+                    f'''{self.i2}self, params: Optional[dict] = None, '''
+                    '''chunk_size: Optional[int] = 1_048_576'''
+                ),
+                f'''{self.i1}) -> Iterator[bytes]:''',
+                f'''{self.i2}"""Yield the PDF for Document/Report Types in chunks."""''',
+                (
+                    f'''{self.i2}return self._download_stream(f\'\'\'{{self.url('GET')}}/pdf'''
+                    '''\'\'\', params, chunk_size)'''
+                ),
                 '',
-                f'''{self.i2}return self.request.content''',
+                f'''{self.i1}def upload(''',
+                f'''{self.i2}self,''',
+                f'''{self.i2}content: Union[bytes, str, IO[bytes], Iterable[bytes]],''',
+                f'''{self.i2}params: Optional[dict] = None,''',
+                f'''{self.i1}) -> 'Response':''',
+                f'''{self.i2}"""Upload the document attachment for Document/Report Types.''',
                 '',
                 (
-                    f'''{self.i1}def upload(self, content: Union[bytes, str], '''
-                    '''params: Optional[dict] = None) -> 'Response':'''
+                    f'''{self.i2}A file object or an iterable of bytes is streamed to the API. '''
+                    '''File objects are rewound'''
                 ),
-                f'''{self.i2}"""Return the document attachment for Document/Report Types."""''',
+                (
+                    f'''{self.i2}if the request is retried on a 401, an iterable can only be '''
+                    '''sent once and is not retried.'''
+                ),
+                f'''{self.i2}"""''',
                 f'''{self.i2}self._request(''',
                 f'''{self.i3}method='POST',''',
                 f'''{self.i3}url=f\'\'\'{{self.url('GET')}}/upload\'\'\',''',
@@ -1,7 +1,7 @@
 """Group / Groups Object"""
 # standard library
 import json
-from typing import TYPE_CHECKING, Iterator, Optional, Union
+from typing import IO, TYPE_CHECKING, Iterable, Iterator, Optional, Union
 
 # first-party
 from tcex.api.tc.v3.api_endpoints import ApiEndpoints
@@ -185,31 +185,54 @@ class Group(ObjectABC):
 
         return self.request
 
-    def download(self, params: Optional[dict] = None) -> bytes:
-        """Return the document attachment for Document/Report Types."""
-        self._request(
-            method='GET',
-            url=f'''{self.url('GET')}/download''',
-            # headers={'content-type': 'application/octet-stream'},
-            headers=None,
-            params=params,
-        )
-        return self.request.content
-
-    def pdf(self, params: Optional[dict] = None) -> bytes:
-        """Return the document attachment for Document/Report Types."""
-        self._request(
-            method='GET',
-            body=None,
-            url=f'''{self.url('GET')}/pdf''',
-            headers=None,
-            params=params,
-        )
-
-        return self.request.content
-
-    def upload(self, content: Union[bytes, str], params: Optional[dict] = None) -> 'Response':
-        """Return the document attachment for Document/Report Types."""
+    def download(
+        self,
+        params: Optional[dict] = None,
+        output: Optional[Union[str, IO[bytes]]] = None,
+        chunk_size: Optional[int] = 1_048_576,
+    ) -> Union[bytes, int]:
+        """Return the document attachment for Document/Report Types.
+
+        When output (a file path or binary file object) is provided the attachment is written
+        to output in chunks and the number of bytes written is returned.
+        """
+        return self._download(f'''{self.url('GET')}/download''', params, output, chunk_size)
+
+    def download_stream(
+        self, params: Optional[dict] = None, chunk_size: Optional[int] = 1_048_576
+    ) -> Iterator[bytes]:
+        """Yield the document attachment for Document/Report Types in chunks."""
+        return self._download_stream(f'''{self.url('GET')}/download''', params, chunk_size)
+
+    def pdf(
+        self,
+        params: Optional[dict] = None,
+        output: Optional[Union[str, IO[bytes]]] = None,
+        chunk_size: Optional[int] = 1_048_576,
+    ) -> Union[bytes, int]:
+        """Return the PDF for Document/Report Types.
+
+        When output (a file path or binary file object) is provided the PDF is written to
+        output in chunks and the number of bytes written is returned.
+        """
+        return self._download(f'''{self.url('GET')}/pdf''', params, output, chunk_size)
+
+    def pdf_stream(
+        self, params: Optional[dict] = None, chunk_size: Optional[int] = 1_048_576
+    ) -> Iterator[bytes]:
+        """Yield the PDF for Document/Report Types in chunks."""
+        return self._download_stream(f'''{self.url('GET')}/pdf''', params, chunk_size)
+
+    def upload(
+        self,
+        content: Union[bytes, str, IO[bytes], Iterable[bytes]],
+        params: Optional[dict] = None,
+    ) -> 'Response':
+        """Upload the document attachment for Document/Report Types.
+
+        A file object or an iterable of bytes is streamed to the API. File objects are rewound
+        if the request is retried on a 401, an iterable can only be sent once and is not retried.
+        """
         self._request(
             method='POST',
             url=f'''{self.url('GET')}/upload''',
@@ -1,11 +1,12 @@
 """Case Management Abstract Base Class"""
 # standard library
 import logging
+import os
 
 # import inspect
 # import re
 from abc import ABC
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import IO, TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Union
 
 # third-party
 from requests import Response
@@ -95,20 +96,82 @@ class ObjectABC(ABC):
             yield obj
         self.request = sublist.request
 
+    def _download(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        output: Optional[Union[str, IO[bytes]]] = None,
+        chunk_size: Optional[int] = 1_048_576,
+    ) -> Union[bytes, int]:
+        """Return the downloaded content or write the content to output in chunks.
+
+        Args:
+            url: The URL for the request.
+            params: The query string parameters for the request.
+            output: An optional file path or file object opened in binary mode.
+            chunk_size: The number of bytes read into memory at a time.
+
+        Returns:
+            Union[bytes, int]: The content, or the number of bytes written when output is provided.
+        """
+        if output is None:
+            self._request(method='GET', url=url, body=None, headers=None, params=params)
+            return self.request.content
+
+        if isinstance(output, (str, os.PathLike)):
+            with open(output, 'wb') as fh:
+                return self._download(url, params, fh, chunk_size)
+
+        size = 0
+        for chunk in self._download_stream(url, params, chunk_size):
+            output.write(chunk)
+            size += len(chunk)
+        return size
+
+    def _download_stream(
+        self, url: str, params: Optional[dict] = None, chunk_size: Optional[int] = 1_048_576
+    ) -> Iterator[bytes]:
+        """Yield the downloaded content in chunks without reading the full content into memory.
+
+        Args:
+            url: The URL for the request.
+            params: The query string parameters for the request.
+            chunk_size: The number of bytes read into memory at a time.
+        """
+        self._request(method='GET', url=url, body=None, headers=None, params=params, stream=True)
+        try:
+            if not self.request.ok:
+                handle_error(
+                    code=952,
+                    message_values=[
+                        self.request.request.method.upper(),
+                        self.request.status_code,
+                        self.request.text or self.request.reason,
+                        self.request.url,
+                    ],
+                )
+            yield from self.request.iter_content(chunk_size=chunk_size)
+        finally:
+            self.request.close()
+
     def _request(
         self,
         method: str,
         url: str,
-        body: Optional[Union[bytes, str]] = None,
+        body: Optional[Union[bytes, str, IO[bytes], Iterable[bytes]]] = None,
         params: Optional[dict] = None,
         headers: Optional[dict] = None,
+        stream: Optional[bool] = False,
     ) -> 'Response':
         """Handle standard request with error checking."""
         try:
             self.request = self._session.request(
-                method, url, data=body, headers=headers, params=params
+                method, url, data=body, headers=headers, params=params, stream=stream
             )
-            self.log.debug(f'feature=api-tc-v3, request-body={self.request.request.body}')
+            request_body = self.request.request.body
+            if isinstance(request_body, (bytes, str)) and len(request_body) > 5000:
+                request_body = '(request body to large to log)'
+            self.log.debug(f'feature=api-tc-v3, request-body={request_body}')
         except (ConnectionError, ProxyError, RetryError):  # pragma: no cover
             handle_error(
                 code=951,
@@ -261,7 +324,11 @@ class ObjectABC(ABC):
     def log_response_text(self, response: Response):
         """Log the response text."""
         response_text = 'response text: (text to large to log)'
-        if len(response.content) < 5000:  # check size of content for performance
+        content_type = response.headers.get('Content-Type') or ''
+        if 'json' not in content_type and not content_type.startswith('text/'):
+            # never read binary (e.g., document download) content for logging
+            response_text = f'response text: (binary content of type {content_type} not logged)'
+        elif len(response.content) < 5000:  # check size of content for performance
             response_text = response.text
         self.log.debug(f'feature=api-tc-v3, response-body={response_text}')
 
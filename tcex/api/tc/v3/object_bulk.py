@@ -0,0 +1,206 @@
+"""ThreatConnect API V3 Bulk Object Executor"""
+# standard library
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+# first-party
+from tcex.sessions.external_session import default_too_many_requests_handler
+from tcex.sessions.thread_sessions import ThreadSessions
+
+if TYPE_CHECKING:
+    # third-party
+    from requests import Response
+
+    # first-party
+    from tcex.api.tc.v3.v3_types import V3Type
+
+# get tcex logger
+logger = logging.getLogger('tcex')
+
+
+class ObjectBulk:
+    """Run create, update, or delete for many V3 objects on a bounded thread pool.
+
+    A 429 or 503 response pauses all workers for the Retry-After period (or an exponential
+    back off when not provided) before the object is retried. A failed object does not stop
+    the remaining objects from being processed.
+
+    Args:
+        max_workers: The max number of concurrent requests.
+        retries: The number of times to retry an object on a 429 or 503 response.
+        back_off: The base number of seconds to wait before a retry.
+        max_back_off: The max number of seconds to wait before a retry.
+    """
+
+    # status codes that indicate the request should be retried
+    retry_status_codes = [429, 503]
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = 8,
+        retries: Optional[int] = 5,
+        back_off: Optional[float] = 1.0,
+        max_back_off: Optional[float] = 60.0,
+    ):
+        """Initialize Class properties."""
+        self.back_off = back_off
+        self.max_back_off = max_back_off
+        self.max_workers = max_workers
+        self.retries = retries
+
+        # properties
+        self._lock = threading.Lock()
+        self._resume_time = 0.0
+        self.log = logger
+
+    def _pause(self, attempt: int, response: Optional['Response']):
+        """Pause all workers before the next request is sent."""
+        seconds = None
+        if response is not None and response.headers.get('Retry-After') is not None:
+            try:
+                seconds = default_too_many_requests_handler(response)
+            except (TypeError, ValueError):
+                seconds = None
+        if seconds is None:
+            seconds = self.back_off * 2**attempt
+        seconds = min(max(seconds, 0), self.max_back_off)
+
+        with self._lock:
+            self._resume_time = max(self._resume_time, time.monotonic() + seconds)
+        self.log.info(
+            f'feature=api-tc-v3, event=bulk-back-off, seconds={seconds}, '
+            f'status-code={getattr(response, "status_code", None)}'
+        )
+
+    def _process(self, action: str, object_: 'V3Type', sessions: ThreadSessions, **kwargs) -> dict:
+        """Run the action on a single object with the session of the worker thread."""
+        session = object_._session  # pylint: disable=protected-access
+        object_._session = sessions.current  # pylint: disable=protected-access
+        try:
+            return self._process_retry(action, object_, **kwargs)
+        finally:
+            object_._session = session  # pylint: disable=protected-access
+
+    def _process_retry(self, action: str, object_: 'V3Type', **kwargs) -> dict:
+        """Run the action on a single object, retrying on a 429 or 503 response."""
+        result = {
+            'action': action,
+            'attempts': 0,
+            'error': None,
+            'object': object_,
+            'status_code': None,
+            'success': False,
+        }
+        while True:
+            # wait for any back off triggered by another worker
+            with self._lock:
+                seconds = self._resume_time - time.monotonic()
+            if seconds > 0:
+                time.sleep(seconds)
+
+            result['attempts'] += 1
+            object_.request = None
+            try:
+                getattr(object_, action)(**kwargs)
+                result['error'] = None
+                result['success'] = True
+            except Exception as ex:
+                result['error'] = str(ex)
+            result['status_code'] = getattr(object_.request, 'status_code', None)
+
+            if (
+                result['success'] is True
+                or result['status_code'] not in self.retry_status_codes
+                or result['attempts'] > self.retries
+            ):
+                break
+            self._pause(result['attempts'] - 1, object_.request)
+
+        if result['success'] is False:
+            self.log.warning(
+                f'''feature=api-tc-v3, event=bulk-{action}-failed, '''
+                f'''status-code={result['status_code']}, error="""{result['error']}"""'''
+            )
+        return result
+
+    def create(self, objects: Iterable['V3Type'], params: Optional[dict] = None) -> List[dict]:
+        """Create the objects, updating the model of each object with the API response.
+
+        Args:
+            objects: The V3 objects (e.g., Case, Artifact, Indicator) to create.
+            params: The query params for each request.
+        """
+        return self.run('create', objects, params=params)
+
+    def delete(self, objects: Iterable['V3Type'], params: Optional[dict] = None) -> List[dict]:
+        """Delete the objects.
+
+        Args:
+            objects: The V3 objects (e.g., Case, Artifact, Indicator) to delete.
+            params: The query params for each request.
+        """
+        return self.run('delete', objects, params=params)
+
+    def run(self, action: str, objects: Iterable['V3Type'], **kwargs) -> List[dict]:
+        """Run the action (create, delete, or update) on all objects.
+
+        Objects are pulled from the iterable as workers become available, so a generator of
+        objects is never fully loaded into memory by the executor. Each worker thread sends the
+        requests with its own copy of the object session.
+
+        Args:
+            action: The object method to call (create, delete, or update).
+            objects: The V3 objects.
+            **kwargs: Additional keyword args passed to the object method.
+
+        Returns:
+            list: A result for each object in the order provided, with the action, attempts,
+                error, object, status_code, and success keys.
+        """
+        results = {}
+        sessions = {}  # the per thread sessions for each distinct object session
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=f'v3-bulk-{action}'
+        ) as executor:
+            futures = {}
+            for index, object_ in enumerate(objects):
+                # limit the number of objects waiting on a worker
+                if len(futures) >= self.max_workers * 2:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results[futures.pop(future)] = future.result()
+                session = object_._session  # pylint: disable=protected-access
+                if id(session) not in sessions:
+                    sessions[id(session)] = ThreadSessions(session)
+                futures[
+                    executor.submit(self._process, action, object_, sessions[id(session)], **kwargs)
+                ] = index
+
+            for future, index in futures.items():
+                results[index] = future.result()
+
+        results = [results[i] for i in sorted(results)]
+        failed = sum(1 for r in results if r.get('success') is False)
+        self.log.info(
+            f'feature=api-tc-v3, event=bulk-{action}, count={len(results)}, '
+            f'success={len(results) - failed}, failed={failed}'
+        )
+        return results
+
+    def update(
+        self,
+        objects: Iterable['V3Type'],
+        mode: Optional[str] = None,
+        params: Optional[dict] = None,
+    ) -> List[dict]:
+        """Update the objects, updating the model of each object with the API response.
+
+        Args:
+            objects: The V3 objects (e.g., Case, Artifact, Indicator) to update.
+            mode: The mode for nested objects (append, delete, replace).
+            params: The query params for each request.
+        """
+        return self.run('update', objects, mode=mode, params=params)
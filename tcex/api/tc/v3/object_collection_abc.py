@@ -1,17 +1,21 @@
 """Case Management Collection Abstract Base Class"""
 # standard library
+import functools
 import logging
+import queue
+import threading
 from abc import ABC
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Iterator, Optional, Tuple, Union
 
 # third-party
-from requests import Response
+from requests import Response, Session
 from requests.exceptions import ProxyError, RetryError
 
 # first-party
 from tcex.api.tc.v3.tql.tql import Tql
 from tcex.backports import cached_property
 from tcex.exit.error_codes import handle_error
+from tcex.sessions.thread_sessions import ThreadSessions
 from tcex.utils import Utils
 
 if TYPE_CHECKING:
@@ -56,7 +60,10 @@ class ObjectCollectionABC(ABC):
         params: Optional[dict] = None,
     ):
         """Initialize class properties."""
+        self._lazy = False
+        self._page_size = None
         self._params = params or {}
+        self._prefetch = 0
         self._tql_filters = tql_filters or []
 
         # properties
@@ -109,11 +116,28 @@ class ObjectCollectionABC(ABC):
         headers: Optional[dict] = None,
     ):
         """Handle standard request with error checking."""
+        self.request = self._send(method, url, body=body, params=params, headers=headers)
+        return self.request
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[Union[bytes, str]] = None,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        session: Optional[Session] = None,
+    ) -> Response:
+        """Send the request with error checking and return the response.
+
+        Unlike _request the response is not stored on the collection, so this method can be
+        called from another thread (e.g., to prefetch pages).
+        """
+        session = session or self._session
+        r = None
         try:
-            self.request = self._session.request(
-                method, url, data=body, headers=headers, params=params
-            )
-            self.log.debug(f'feature=api-tc-v3, request-body={self.request.request.body}')
+            r = session.request(method, url, data=body, headers=headers, params=params)
+            self.log.debug(f'feature=api-tc-v3, request-body={r.request.body}')
         except (ConnectionError, ProxyError, RetryError):  # pragma: no cover
             handle_error(
                 code=951,
@@ -125,26 +149,37 @@ class ObjectCollectionABC(ABC):
                 ],
             )
 
-        if not self.success(self.request):
-            err = self.request.text or self.request.reason
+        if not self.success(r):
+            err = r.text or r.reason
             handle_error(
                 code=950,
                 message_values=[
-                    self.request.request.method.upper(),
-                    self.request.status_code,
+                    r.request.method.upper(),
+                    r.status_code,
                     err,
-                    self.request.url,
+                    r.url,
                 ],
             )
 
         # log content for debugging
-        self.log_response_text(self.request)
+        self.log_response_text(r)
+        return r
 
     @property
     def filter(self):  # pragma: no cover
         """Return filter method."""
         raise NotImplementedError('Child class must implement this method.')
 
+    @property
+    def lazy(self) -> bool:
+        """Return True if the models of iterated objects are validated on access."""
+        return self._lazy
+
+    @lazy.setter
+    def lazy(self, lazy: bool):
+        """Set lazy model validation for iterated objects."""
+        self._lazy = lazy
+
     def log_response_text(self, response: Response):
         """Log the response text."""
         response_text = 'response text: (text to large to log)'
@@ -161,13 +196,83 @@ class ObjectCollectionABC(ABC):
     def model(self, data):
         self._model = type(self.model)(**data)
 
+    def _pages(
+        self, url: str, params: dict, session: Optional[Session] = None
+    ) -> Iterator[Tuple[Response, dict]]:
+        """Yield the response and the data of each page, following the next URL."""
+        while url:
+            r = self._send(
+                'GET',
+                body=None,
+                url=url,
+                headers={'content-type': 'application/json'},
+                params=params,
+                session=session,
+            )
+
+            # reset some vars
+            params = {}
+
+            response = r.json()
+            url = response.pop('next', None)
+            yield r, response
+
+    def _pages_prefetch(self, url: str, params: dict) -> Iterator[Tuple[Response, dict]]:
+        """Yield the response and the data of each page, fetching the following pages in a thread.
+
+        The thread uses its own session and does not update any state of the collection.
+        """
+        pages = queue.Queue(maxsize=self.prefetch)
+        session = ThreadSessions(self._session)
+        stop = threading.Event()
+        done = object()
+
+        def _put(item: object):
+            """Add the item to the queue unless the consumer has stopped iterating."""
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _fetch():
+            """Fetch pages until there is no next URL."""
+            try:
+                for page in self._pages(url, params, session=session.current):
+                    if not _put(page):
+                        return
+            except Exception as ex:
+                # errors are raised by handle_error and re-raised in the consuming thread
+                _put(ex)
+            _put(done)
+
+        thread = threading.Thread(name='v3-prefetch', target=_fetch, daemon=True)
+        thread.start()
+        try:
+            while True:
+                page = pages.get()
+                if page is done:
+                    break
+                if isinstance(page, Exception):
+                    raise page
+                yield page
+        finally:
+            stop.set()
+
     def iterate(
         self,
         base_class: 'BaseModel',
         api_endpoint: Optional[str] = None,
         params: Optional[dict] = None,
     ) -> 'CaseManagementType':
-        """Iterate over CM/TI objects."""
+        """Iterate over CM/TI objects.
+
+        When prefetch is set the next pages are fetched in a thread while the current page is
+        being consumed. When lazy is set the models of the returned objects are validated as
+        fields are accessed instead of on creation.
+        """
         url = api_endpoint or self._api_endpoint
         params = params or self.params
 
@@ -181,34 +286,25 @@ class ObjectCollectionABC(ABC):
             k = self.utils.snake_to_camel(k)
             params[k] = v
 
+        # page size hint, a result limit provided in params takes precedence
+        if self.page_size:
+            params.setdefault('resultLimit', self.page_size)
+
         tql_string = self.tql.raw_tql or self.tql.as_str
 
         if tql_string:
             params['tql'] = tql_string
 
-        while True:
-            self._request(
-                'GET',
-                body=None,
-                url=url,
-                headers={'content-type': 'application/json'},
-                params=params,
-            )
-
-            # reset some vars
-            params = {}
-
-            response = self.request.json()
-            data = response.get('data', [])
-            url = response.pop('next', None)
+        # defer model validation and hashing until the fields are accessed
+        if self.lazy:
+            base_class = functools.partial(base_class, _lazy=True)
 
-            for result in data:
+        pages = self._pages_prefetch if self.prefetch > 0 else self._pages
+        for r, response in pages(url, params):
+            self.request = r
+            for result in response.get('data', []):
                 yield base_class(session=self._session, **result)
 
-            # break out of pagination if no next url present in results
-            if not url:
-                break
-
     # @staticmethod
     # def list_as_dict(added_items: 'CaseManagementType') -> dict:
     #     """Return the dict representation of the case management collection object."""
@@ -217,6 +313,16 @@ class ObjectCollectionABC(ABC):
     #         as_dict['data'].append(item.as_dict)
     #     return as_dict
 
+    @property
+    def page_size(self) -> Optional[int]:
+        """Return the number of results requested per page (resultLimit)."""
+        return self._page_size
+
+    @page_size.setter
+    def page_size(self, page_size: Optional[int]):
+        """Set the number of results requested per page (resultLimit)."""
+        self._page_size = page_size
+
     @property
     def params(self) -> dict:
         """Return the parameters of the case management object collection."""
@@ -227,6 +333,16 @@ class ObjectCollectionABC(ABC):
         """Set the parameters of the case management object collection."""
         self._params = params
 
+    @property
+    def prefetch(self) -> int:
+        """Return the number of pages to fetch ahead of the page being consumed."""
+        return self._prefetch
+
+    @prefetch.setter
+    def prefetch(self, prefetch: int):
+        """Set the number of pages to fetch ahead of the page being consumed (0 to disable)."""
+        self._prefetch = prefetch
+
     @staticmethod
     def success(r: Response) -> bool:
         """Validate the response is valid.
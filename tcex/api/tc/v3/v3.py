@@ -1,8 +1,12 @@
 """V3 API"""
 
+# standard library
+from typing import Optional
+
 # first-party
 from tcex.api.tc.v3.attribute_types.attribute_type import AttributeType, AttributeTypes
 from tcex.api.tc.v3.case_management.case_management import CaseManagement
+from tcex.api.tc.v3.object_bulk import ObjectBulk
 from tcex.api.tc.v3.security.security import Security
 from tcex.api.tc.v3.threat_intelligence.threat_intelligence import ThreatIntelligence
 
@@ -22,6 +26,24 @@ class V3(CaseManagement, Security, ThreatIntelligence):
         """Return a instance of Attribute Types object."""
         return AttributeTypes(session=self.session, **kwargs)
 
+    @staticmethod
+    def bulk(max_workers: Optional[int] = 8, retries: Optional[int] = 5) -> 'ObjectBulk':
+        """Return a instance of the bulk create/update/delete executor.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            cases = [tcex.v3.case(name=f'case-{i}', status='Open') for i in range(1_000)]
+            results = tcex.v3.bulk(max_workers=8).create(cases)
+            failed = [r for r in results if r.get('success') is False]
+
+        Args:
+            max_workers: The max number of concurrent requests.
+            retries: The number of times to retry an object on a 429 or 503 response.
+        """
+        return ObjectBulk(max_workers=max_workers, retries=retries)
+
     @property
     def cm(self):
         """Return Case Management API collection."""
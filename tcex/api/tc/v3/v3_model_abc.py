@@ -1,5 +1,6 @@
 """ThreatConnect API V3 Base Model."""
 # standard library
+import copy
 import datetime
 import hashlib
 import json
@@ -9,7 +10,8 @@ from json import JSONEncoder
 from typing import Any, Optional
 
 # third-party
-from pydantic import BaseModel, PrivateAttr
+from pydantic import BaseModel, PrivateAttr, ValidationError, validate_model
+from pydantic.utils import lenient_issubclass
 
 # get tcex logger
 
@@ -31,14 +33,33 @@ class V3ModelABC(BaseModel, ABC):
 
     _associated_type = PrivateAttr(False)
     _cm_type = PrivateAttr(False)
-    _dict_hash: str = PrivateAttr()
+    _dict_hash: str = PrivateAttr(None)
+    _lazy_data: dict = PrivateAttr(None)
+    _lazy_hydrated: bool = PrivateAttr(True)
     _log = logger
+    _properties_cache = {}  # field properties per model class
     _shared_type = PrivateAttr(False)
     _staged = PrivateAttr(False)
     id: int = None
 
     def __init__(self, **kwargs):
-        """Initialize class properties."""
+        """Initialize class properties.
+
+        When "_lazy" is passed the data (e.g., an API response) is stored without validation.
+        Fields are validated on first access, the full model is validated on first use of
+        dict(), json(), iteration, or assignment, and the hash used by the "updated" property
+        is calculated when first needed.
+        """
+        if kwargs.pop('_lazy', False):
+            object.__setattr__(self, '__dict__', {})
+            object.__setattr__(self, '__fields_set__', set())
+            self._init_private_attributes()
+            self._lazy_data = kwargs
+            self._lazy_hydrated = False
+            if kwargs and kwargs.get('id') is None:
+                self._staged = True
+            return
+
         super().__init__(**kwargs)
 
         # when "id" field is present it indicates that the data was returned from the
@@ -50,6 +71,56 @@ class V3ModelABC(BaseModel, ABC):
         # store initial dict hash of model
         self._dict_hash = self.gen_model_hash(self.json(sort_keys=True))
 
+    def __getattr__(self, name: str) -> Any:
+        """Validate fields of a lazy model on first access."""
+        if name.startswith('__') or object.__getattribute__(self, '_lazy_hydrated'):
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+        field = self.__fields__.get(name)
+        if field is None:
+            # extra fields are only available once the full model is validated
+            self._hydrate()
+            try:
+                return self.__dict__[name]
+            except KeyError as ex:
+                raise AttributeError(
+                    f"'{self.__class__.__name__}' object has no attribute '{name}'"
+                ) from ex
+
+        data = self._lazy_data
+        value = data.get(field.alias, data.get(name, Ellipsis))
+        if value is Ellipsis:
+            value = field.get_default()
+            if not field.validate_always:
+                self.__dict__[name] = value
+                return value
+        else:
+            # the source data is copied to ensure the initial hash can be calculated
+            value = copy.deepcopy(value)
+            self.__fields_set__.add(name)
+
+        value, errors = field.validate(value, self.__dict__, loc=field.alias, cls=self.__class__)
+        if errors:
+            raise ValidationError([errors], self.__class__)
+        self.__dict__[name] = value
+        return value
+
+    def __iter__(self):
+        """Iterate over the model fields, validating a lazy model first."""
+        self._hydrate()
+        return super().__iter__()
+
+    def __repr_args__(self):
+        """Return the repr args, validating a lazy model first."""
+        self._hydrate()
+        return super().__repr_args__()
+
+    def __setattr__(self, name: str, value: Any):
+        """Set the attribute, validating a lazy model first."""
+        if name not in self.__private_attributes__:
+            self._hydrate()
+        super().__setattr__(name, value)
+
     def _calculate_field_inclusion(
         self, field: str, method: str, mode: str, nested: bool, property_: dict, value: Any
     ) -> str:
@@ -306,12 +377,45 @@ class V3ModelABC(BaseModel, ABC):
                 return data
         return None
 
-    def _properties(self):
-        """Return properties of the current model."""
-        schema = self.schema(by_alias=False)
-        if schema.get('properties') is not None:
-            return schema.get('properties')
-        return schema.get('definitions').get(self.__class__.__name__).get('properties')
+    def _hydrate(self):
+        """Validate all fields of a lazy model, keeping fields that were already accessed."""
+        if self._lazy_hydrated:
+            return
+
+        values, fields_set, errors = validate_model(self.__class__, copy.deepcopy(self._lazy_data))
+        if errors:
+            raise errors
+        values.update(self.__dict__)
+        object.__setattr__(self, '__dict__', values)
+        object.__setattr__(self, '__fields_set__', fields_set | self.__fields_set__)
+        self._lazy_hydrated = True
+
+    def _iter(self, *args, **kwargs):
+        """Iterate over the model fields for dict()/json(), validating a lazy model first."""
+        self._hydrate()
+        return super()._iter(*args, **kwargs)
+
+    @classmethod
+    def _properties(cls) -> dict:
+        """Return properties of the current model.
+
+        The title, read_only, methods, and nested values of each field are built from the field
+        definitions once per model class, instead of generating the schema on each call.
+        """
+        properties = cls._properties_cache.get(cls)
+        if properties is None:
+            properties = {}
+            for name, field in cls.__fields__.items():
+                field_info = field.field_info
+                properties[name] = {
+                    'methods': field_info.extra.get('methods', []),
+                    'nested': lenient_issubclass(field.type_, BaseModel),
+                    'read_only': field_info.extra.get('read_only'),
+                    # match the default title used by pydantic schema
+                    'title': field_info.title or field.alias.title().replace('_', ' '),
+                }
+            cls._properties_cache[cls] = properties
+        return properties
 
     @staticmethod
     def gen_model_hash(json_: str) -> str:
@@ -336,13 +440,13 @@ class V3ModelABC(BaseModel, ABC):
         but should be added for a PUT on a nested object.
         """
         _body = {}
-        schema_properties = self._properties()
+        properties = self._properties()
         for name, value in self:
             if exclude_none is True and value is None:
                 continue
 
             # get the current field from the schema to us in validating method membership.
-            property_ = schema_properties.get(name)
+            property_ = properties.get(name)
             if property_ is None:
                 # a field not being available does not indicate a failure, it could simple
                 # be the incorrect field was passed to the object, which will be dropped.
@@ -353,7 +457,11 @@ class V3ModelABC(BaseModel, ABC):
                 continue
 
             key = property_.get('title')
-            if isinstance(value, BaseModel) and property_.get('read_only') is False:
+            if (
+                property_['nested'] is True
+                and property_['read_only'] is False
+                and isinstance(value, BaseModel)
+            ):
                 # Handle nested models that should be included in the body (non-read-only).
 
                 if hasattr(value, 'data') and isinstance(value.data, list):
@@ -415,4 +523,9 @@ class V3ModelABC(BaseModel, ABC):
     @property
     def updated(self):
         """Return True if model values have changed, else False."""
+        if self._dict_hash is None and self._lazy_data is not None:
+            # calculate the initial hash of a lazy model from the source data
+            self._hydrate()
+            self._dict_hash = self.__class__(**copy.deepcopy(self._lazy_data))._dict_hash
+            self._lazy_data = None
         return self._dict_hash != self.gen_model_hash(self.json(sort_keys=True))
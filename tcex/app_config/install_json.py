@@ -28,6 +28,9 @@ class InstallJson:
     command to create a install.json file in the build directory.
     """
 
+    # parsed models shared by all instances, keyed on the install.json filename
+    _models: Dict[Path, tuple] = {}
+
     def __init__(
         self,
         filename: Optional[str] = None,
@@ -42,6 +45,21 @@ class InstallJson:
         # properties
         self.fqfn = Path(os.path.join(path, filename))
 
+    @property
+    def _file_key(self) -> Optional[tuple]:
+        """Return the inode, ctime, mtime, and size of the install.json file to detect changes."""
+        try:
+            stat = self.fqfn.stat()
+        except OSError:
+            return None
+        # ctime is included as copying a file can preserve the mtime (e.g., shutil.copy2)
+        return stat.st_ino, stat.st_ctime_ns, stat.st_mtime_ns, stat.st_size
+
+    def _model_reset(self):
+        """Reset the cached contents and model, forcing the file to be read on next access."""
+        self.__dict__.pop('contents', None)
+        self._models.pop(self.fqfn, None)
+
     @property
     def app_prefix(self) -> str:
         """Return the appropriate output var type for the current App."""
@@ -152,11 +170,22 @@ class InstallJson:
         """Return True if App has the provided feature."""
         return feature.lower() in [f.lower() for f in self.model.features]
 
-    # @cached_property
     @property
     def model(self) -> 'InstallJsonModel':
-        """Return the Install JSON model."""
-        return InstallJsonModel(**self.contents)
+        """Return the Install JSON model.
+
+        The model is cached until the install.json file changes on disk or is written.
+        """
+        file_key = self._file_key
+        cached = self._models.get(self.fqfn)
+        if cached is not None and cached[0] == file_key:
+            return cached[1]
+
+        # the file is new or has changed since it was read
+        self._model_reset()
+        model = InstallJsonModel(**self.contents)
+        self._models[self.fqfn] = (file_key, model)
+        return model
 
     @property
     def params_dict(self) -> List['ParamsModel']:
@@ -246,10 +275,18 @@ class InstallJson:
         """Validate install.json."""
         return InstallJsonValidate(ij=self)
 
-    def write(self):
-        """Write current data file."""
-        data = self.model.json(
+    def write(self, model: Optional['InstallJsonModel'] = None):
+        """Write current data file.
+
+        Args:
+            model: The model to write (e.g., an updated copy), defaults to the current model.
+        """
+        model = model or self.model
+        data = model.json(
             by_alias=True, exclude_defaults=True, exclude_none=True, indent=2, sort_keys=True
         )
         with self.fqfn.open(mode='w') as fh:
             fh.write(f'{data}\n')
+
+        # the model is read from the updated file on next access
+        self._model_reset()
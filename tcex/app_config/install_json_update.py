@@ -4,8 +4,12 @@
 import os
 from typing import TYPE_CHECKING, Optional
 
+# first-party
+from tcex.backports import cached_property
+
 if TYPE_CHECKING:  # pragma: no cover
     from .install_json import InstallJson
+    from .models import InstallJsonModel
 
 
 class InstallJsonUpdate:
@@ -15,6 +19,15 @@ class InstallJsonUpdate:
         """Initialize class properties."""
         self.ij = ij
 
+    @cached_property
+    def model(self) -> 'InstallJsonModel':
+        """Return a copy of the install.json model to update.
+
+        The model of the InstallJson instance is shared by all instances for the same file, so
+        changes are only applied to this copy until it is written.
+        """
+        return self.ij.model.copy(deep=True)
+
     def multiple(
         self,
         features: Optional[bool] = True,
@@ -53,7 +66,7 @@ class InstallJsonUpdate:
             self.update_playbook_data_types()
 
         # write updated profile
-        self.ij.write()
+        self.ij.write(self.model)
 
     # def update_display_name(self, json_data: dict):
     #     """Update the displayName parameter."""
@@ -67,9 +80,9 @@ class InstallJsonUpdate:
         """Update feature set based on App type."""
         features = ['runtimeVariables']
 
-        if self.ij.model.runtime_level.lower() in ['organization']:
+        if self.model.runtime_level.lower() in ['organization']:
             features.extend(['fileParams', 'secureParams'])
-        elif self.ij.model.runtime_level.lower() in ['playbook']:
+        elif self.model.runtime_level.lower() in ['playbook']:
             features.extend(
                 [
                     'aotExecutionEnabled',
@@ -79,7 +92,7 @@ class InstallJsonUpdate:
                     'secureParams',
                 ]
             )
-        elif self.ij.model.runtime_level.lower() in [
+        elif self.model.runtime_level.lower() in [
             'apiservice',
             'triggerservice',
             'webhooktriggerservice',
@@ -91,7 +104,7 @@ class InstallJsonUpdate:
             features.append('layoutEnabledApp')
 
         # re-add supported optional features
-        for feature in self.ij.model.features:
+        for feature in self.model.features:
             if feature in [
                 'advancedRequest',
                 'CALSettings',
@@ -111,20 +124,20 @@ class InstallJsonUpdate:
             ]:
                 features.append(feature)
 
-        self.ij.model.features = sorted(list(set(features)))
+        self.model.features = sorted(list(set(features)))
 
     def update_program_main(self):
         """Update program main."""
-        self.ij.model.program_main = 'run'
+        self.model.program_main = 'run'
 
     def update_sequence_numbers(self):
         """Update program sequence numbers."""
-        for sequence, param in enumerate(self.ij.model.params, start=1):
+        for sequence, param in enumerate(self.model.params, start=1):
             param.sequence = sequence
 
     def update_valid_values(self):
         """Update program main on App type."""
-        for param in self.ij.model.params:
+        for param in self.model.params:
             if param.type not in ['String', 'KeyValueList']:
                 continue
 
@@ -132,10 +145,7 @@ class InstallJsonUpdate:
             if param.encrypt is True:
                 store = 'KEYCHAIN'
 
-            if (
-                self.ij.model.runtime_level.lower() == 'organization'
-                or param.service_config is True
-            ):
+            if self.model.runtime_level.lower() == 'organization' or param.service_config is True:
                 if f'${{USER:{store}}}' not in param.valid_values:
                     param.valid_values.append(f'${{USER:{store}}}')
 
@@ -146,7 +156,7 @@ class InstallJsonUpdate:
                 if f'${{{store}}}' in param.valid_values:
                     param.valid_values.remove(f'${{{store}}}')
 
-            elif self.ij.model.runtime_level.lower() == 'playbook':
+            elif self.model.runtime_level.lower() == 'playbook':
                 if f'${{{store}}}' not in param.valid_values:
                     param.valid_values.append(f'${{{store}}}')
 
@@ -160,10 +170,10 @@ class InstallJsonUpdate:
 
     def update_playbook_data_types(self):
         """Update program main on App type."""
-        if self.ij.model.runtime_level.lower() != 'playbook':
+        if self.model.runtime_level.lower() != 'playbook':
             return
 
-        for param in self.ij.model.params:
+        for param in self.model.params:
             if param.type != 'String':
                 continue
             if not param.playbook_data_type:
@@ -8,7 +8,7 @@ from enum import Enum
 from typing import Dict, List, Optional, Union
 
 # third-party
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, validator
 from pydantic.types import UUID4, UUID5, constr
 from semantic_version import Version
 
@@ -707,6 +707,9 @@ class InstallJsonModel(InstallJsonCommonModel, InstallJsonOrganizationModel):
             'is only applicable to Spaces Apps.'
         ),
     )
+    # name/model dicts built once for the params and output variables lists
+    _outputs_dict: Optional[tuple] = PrivateAttr(None)
+    _params_dict: Optional[tuple] = PrivateAttr(None)
 
     class Config:
         """DataModel Config"""
@@ -716,6 +719,13 @@ class InstallJsonModel(InstallJsonCommonModel, InstallJsonOrganizationModel):
         json_encoders = json_encoders
         validate_assignment = True
 
+    @staticmethod
+    def _names_dict(cached: Optional[tuple], items: list) -> tuple:
+        """Return the cached name/model dict for items, rebuilt if the list has changed."""
+        if cached is None or cached[0] is not items or cached[1] != len(items):
+            cached = (items, len(items), {i.name: i for i in items})
+        return cached
+
     @property
     def app_output_var_type(self) -> str:
         """Return the appropriate output var type for the current App."""
@@ -801,12 +811,14 @@ class InstallJsonModel(InstallJsonCommonModel, InstallJsonOrganizationModel):
     @property
     def params_dict(self) -> Dict[str, 'ParamsModel']:
         """Return params as name/data dict."""
-        return {p.name: p for p in self.params}
+        self._params_dict = self._names_dict(self._params_dict, self.params)
+        return self._params_dict[2]
 
     @property
     def playbook_outputs(self) -> Dict[str, 'OutputVariablesModel']:
         """Return outputs as name/data model."""
-        return {o.name: o for o in self.playbook.output_variables}
+        self._outputs_dict = self._names_dict(self._outputs_dict, self.playbook.output_variables)
+        return self._outputs_dict[2]
 
     @property
     def required_params(self) -> Dict[str, 'ParamsModel']:
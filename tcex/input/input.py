@@ -258,44 +258,57 @@ class Input:
         if not self.ij.fqfn.is_file():  # pragma: no cover
             return _inputs
 
-        for name, value in _inputs.items():
-            if name == 'tc_playbook_out_variables':
-                # for services, this input contains the name of the expected outputs.  If we don't
-                # skip this, we'll try to resolve the value (e.g.
-                # #Trigger:334:example.service_input!String), but that 1) won't work for services
-                # and 2) doesn't make sense.  Service configs will never have playbook variables.
-                continue
+        playbook = self.ij.model.runtime_level.lower() == 'playbook'
+        try:
+            if playbook:
+                # read all playbook variables referenced by inputs with a single bulk read
+                registry.playbook.read.prefetch(
+                    v for k, v in _inputs.items() if k != 'tc_playbook_out_variables'
+                )
 
-            if self.utils.is_tc_variable(value):  # only matches playbook variables
-                value = self.resolve_variable(variable=value)
-            elif self.ij.model.runtime_level.lower() == 'playbook':
-                if isinstance(value, list):
-                    # list could contain playbook variables, try to resolve the value
-                    updated_value_array = []
-                    for v in value:
-                        if isinstance(v, str):
-                            v = registry.playbook.read.variable(v)
-                        # TODO: [high] does resolve variable need to be added here
-                        updated_value_array.append(v)
-                    value = updated_value_array
-                elif self.utils.is_playbook_variable(value):  # only matches playbook variables
-                    # when using Union[Bytes, String] in App input model the value
-                    # can be coerced to the wrong type. the BinaryVariable and
-                    # StringVariable custom types allows for the validator in Binary
-                    # and String types to raise a value error.
-                    value = registry.playbook.read.variable(value)
-                elif isinstance(value, str):
-                    value = registry.playbook.read._read_embedded(value)
-            else:
-                for match in re.finditer(self.utils.variable_tc_pattern, str(value)):
-                    variable = match.group(0)  # the full variable pattern
-                    if match.group('type').lower() == 'file':
-                        v = '<file>'
-                    else:
-                        v = self.resolve_variable(variable=variable)
-                    value = value.replace(variable, v)
-
-            _inputs[name] = value
+            for name, value in _inputs.items():
+                if name == 'tc_playbook_out_variables':
+                    # for services, this input contains the name of the expected outputs.  If we
+                    # don't skip this, we'll try to resolve the value (e.g.
+                    # #Trigger:334:example.service_input!String), but that 1) won't work for
+                    # services and 2) doesn't make sense.  Service configs will never have
+                    # playbook variables.
+                    continue
+
+                if self.utils.is_tc_variable(value):  # only matches playbook variables
+                    value = self.resolve_variable(variable=value)
+                elif playbook:
+                    if isinstance(value, list):
+                        # list could contain playbook variables, try to resolve the value
+                        updated_value_array = []
+                        for v in value:
+                            if isinstance(v, str):
+                                v = registry.playbook.read.variable(v)
+                            # TODO: [high] does resolve variable need to be added here
+                            updated_value_array.append(v)
+                        value = updated_value_array
+                    elif self.utils.is_playbook_variable(value):  # only matches playbook variables
+                        # when using Union[Bytes, String] in App input model the value
+                        # can be coerced to the wrong type. the BinaryVariable and
+                        # StringVariable custom types allows for the validator in Binary
+                        # and String types to raise a value error.
+                        value = registry.playbook.read.variable(value)
+                    elif isinstance(value, str):
+                        value = registry.playbook.read._read_embedded(value)
+                else:
+                    for match in re.finditer(self.utils.variable_tc_pattern, str(value)):
+                        variable = match.group(0)  # the full variable pattern
+                        if match.group('type').lower() == 'file':
+                            v = '<file>'
+                        else:
+                            v = self.resolve_variable(variable=variable)
+                        value = value.replace(variable, v)
+
+                _inputs[name] = value
+        finally:
+            # the prefetched values must not be returned by later reads, even on error
+            if playbook:
+                registry.playbook.read.prefetch_clear()
 
         # update contents
         self.contents_update(_inputs)
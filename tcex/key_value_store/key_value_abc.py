@@ -1,7 +1,7 @@
 """KeyValueABC class."""
 # standard library
 from abc import ABC
-from typing import Any
+from typing import Any, Dict, List
 
 
 class KeyValueABC(ABC):
@@ -29,3 +29,15 @@ class KeyValueABC(ABC):
         Returns:
             (any): The response data from the  KV store provider.
         """
+
+    def read_many(self, context: str, keys: List[str]) -> Dict[str, Any]:
+        """Read data from KV store for the provided keys.
+
+        Args:
+            context: A specific context for the read.
+            keys: The keys to read in KV store.
+
+        Returns:
+            (dict): The response data from the KV store provider for each key.
+        """
+        return {key: self.read(context, key) for key in keys}
@@ -1,6 +1,6 @@
 """TcEx Framework Key Value Redis Module"""
 # standard library
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 # first-party
 # first party
@@ -73,6 +73,21 @@ class KeyValueRedis(KeyValueABC):
         """
         return self.hget(context, key)
 
+    def read_many(self, context: str, keys: List[str]) -> Dict[str, Optional[bytes]]:
+        """Read data from Redis for the provided keys with a single HMGET.
+
+        Args:
+            context: A specific context for the read.
+            keys: The field names (keys) for the kv pairs in Redis.
+
+        Returns:
+            dict: The response data from Redis for each key.
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        return dict(zip(keys, self.redis_client.hmget(context, keys)))
+
     def hget(self, context: str, key: str) -> Optional[bytes]:
         """Read data from redis for the provided key.
 
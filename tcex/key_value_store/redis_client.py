@@ -38,7 +38,6 @@ class RedisClient:
         """Initialize class properties"""
         pool = redis.ConnectionPool
         if blocking_pool:
-            kwargs.pop('blocking_pool')  # remove blocking_pool key
             pool = redis.BlockingConnectionPool
         self.pool = pool(host=host, port=port, db=db, **kwargs)
 
@@ -46,3 +45,24 @@ class RedisClient:
     def client(self) -> 'redis.Redis':
         """Return an instance of redis.client.Redis."""
         return redis.Redis(connection_pool=self.pool)
+
+    @staticmethod
+    def pool_metrics(pool: 'redis.ConnectionPool') -> dict:
+        """Return the size and usage of the connection pool of a redis client.
+
+        Args:
+            pool: The connection pool (e.g., redis_client.connection_pool).
+        """
+        if isinstance(pool, redis.BlockingConnectionPool):
+            # the queue of a blocking pool is filled with None for connections not yet created
+            created = len(pool._connections)
+            idle = len([c for c in list(pool.pool.queue) if c is not None])
+        else:
+            created = pool._created_connections
+            idle = len(pool._available_connections)
+
+        return {
+            'Redis Pool Max Size': pool.max_connections,
+            'Redis Connections Created': created,
+            'Redis Connections Idle': idle,
+        }
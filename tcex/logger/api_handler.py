@@ -1,30 +1,110 @@
 """API Handler Class"""
 # standard library
+import gzip
+import json
 import logging
+import queue
 import threading
 import time
 
 
 class ApiHandler(logging.Handler):
-    """Logger handler for ThreatConnect Exchange API logging."""
-
-    def __init__(self, session, flush_limit=100):
+    """Logger handler for ThreatConnect Exchange API logging.
+
+    Formatted events are added to a bounded queue and sent to the API by a background thread
+    once flush_limit events are queued, an ERROR event is logged, or flush_interval seconds
+    have passed. When the queue is full the event is dropped, optionally after waiting up to
+    block_timeout seconds for the flusher to free space.
+    """
+
+    def __init__(
+        self,
+        session,
+        flush_limit=100,
+        flush_interval=5.0,
+        queue_size=10_000,
+        block_timeout=0.0,
+        compress=True,
+    ):
         """Initialize Class properties.
 
         Args:
             session (Request.Session): The preconfigured instance of Session for ThreatConnect API.
             flush_limit (int): The limit to flush batch logs to the API.
+            flush_interval (float): The max number of seconds between flushes to the API.
+            queue_size (int): The max number of events waiting to be sent to the API.
+            block_timeout (float): The number of seconds to wait on a full queue before dropping.
+            compress (bool): If True, the log events are gzip compressed when sent to the API.
         """
         super().__init__()
         self.session = session
+        self.block_timeout = block_timeout
+        self.compress = compress
+        self.dropped = 0
+        self.flush_interval = flush_interval
         self.flush_limit = flush_limit
-        self._entries = []
-        self._entries_lock = threading.Lock()
         self.in_token_renewal = False
 
+        # properties
+        self._dropped_reported = 0
+        self._flush_event = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._local = threading.local()
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+
+    def _flusher(self):
+        """Send queued events to the API on size, level, or time thresholds."""
+        while not self._stop_event.is_set():
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+
+            # pause API logging while the token module is renewing the token
+            if not self.in_token_renewal:
+                self.flush()
+
+    def _start_flusher(self):
+        """Start the background flusher thread if not already running."""
+        with self._thread_lock:
+            if self._thread is None and not self._stop_event.is_set():
+                self._thread = threading.Thread(
+                    name='api-log-flusher', target=self._flusher, daemon=True
+                )
+                self._thread.start()
+
+    def close(self):
+        """Stop the flusher thread and send all remaining events to the API."""
+        self._stop_event.set()
+        self._flush_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=max(self.flush_interval, 5.0))
+        self.flush()
+        super().close()
+
     def flush(self):
-        """Close the logger and flush entries."""
-        self.log_to_api(self.entries)  # pragma: no cover
+        """Send all queued entries to the API."""
+        with self._flush_lock:
+            while True:
+                entries = self.entries
+                if self.dropped > self._dropped_reported:
+                    # report events dropped while the queue was full
+                    entries.append(
+                        {
+                            'timestamp': int(time.time() * 1000),
+                            'message': (
+                                f'{self.dropped - self._dropped_reported} log events dropped, '
+                                'the API logging queue was full.'
+                            ),
+                            'level': 'WARNING',
+                        }
+                    )
+                    self._dropped_reported = self.dropped
+                if not entries:
+                    break
+                self.log_to_api(entries)
 
     def emit(self, record):
         """Emit a record.
@@ -32,51 +112,61 @@ class ApiHandler(logging.Handler):
         Args:
             record (obj): The record to be logged.
         """
-        # TODO: [low] switch this after testing
-        # if not threading.current_thread() is threading.main_thread():  # pragma: no cover
-        if threading.current_thread().name != 'MainThread':  # pragma: no cover
+        # ignore events logged while sending events to the API (e.g., session debug logging)
+        if getattr(self._local, 'sending', False) is True:
             return
 
-        # queue log events
-        self._entries.append(self.format(record))
-
-        # flush queue once limit is hit token module is currently renewing token
-        if (
-            len(self._entries) > self.flush_limit or record.levelname == 'ERROR'
-        ) and not self.in_token_renewal:
-            self.log_to_api(self.entries)
-
-    def handle(self, record):
-        """Override base handle method to add logic that prevents threading deadlocks"""
-        # append log entries from child threads to _entries to avoid deadlocks within handle method.
-        # Otherwise, token monitor thread would try to acquire I/O lock within super().handle
-        # when attempting to log messages (meaning token barrier is enabled in tokens.py).
-        # if the main thread currently has the I/O lock from within super().handle and is trying
-        # to retrieve a token from tokens.py to log to API, then a deadlock occurs because the
-        # main thread is waiting for the barrier to be disabled, and the token thread is waiting
-        # for the I/O lock from super().handle.
-        if threading.current_thread().name != 'MainThread':
-            with self._entries_lock:
-                self._entries.append(record)
-        else:
-            super().handle(record)
+        try:
+            entry = self.format(record)
+        except Exception:  # pragma: no cover
+            self.handleError(record)
+            return
+
+        try:
+            if self.block_timeout > 0:
+                self._queue.put(entry, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+            return
+
+        self._start_flusher()
+        if self._queue.qsize() >= self.flush_limit or record.levelno >= logging.ERROR:
+            self._flush_event.set()
 
     @property
     def entries(self):
-        """Return a copy and clear self._entries."""
-        with self._entries_lock:
-            entries = list(self._entries)
-            self._entries = []
-            return entries
+        """Return up to 1,000 queued entries, removing them from the queue."""
+        entries = []
+        while len(entries) < 1_000:
+            try:
+                entries.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return entries
 
     def log_to_api(self, entries):
         """Send log events to the ThreatConnect API"""
         if entries:
+            self._local.sending = True
             try:
                 headers = {'Content-Type': 'application/json'}
+                if self.compress is True:
+                    headers['Content-Encoding'] = 'gzip'
+                    data = gzip.compress(json.dumps(entries).encode())
+                    r = self.session.post('/v2/logs/app', headers=headers, data=data)
+                    if r.status_code not in [400, 415]:
+                        return
+
+                    # the server did not accept the compressed body, send uncompressed events
+                    self.compress = False
+                    headers.pop('Content-Encoding')
                 self.session.post('/v2/logs/app', headers=headers, json=entries)
             except Exception:  # nosec; pragma: no cover
                 pass
+            finally:
+                self._local.sending = False
 
 
 class ApiHandlerFormatter(logging.Formatter):
@@ -100,6 +100,7 @@ class Logger:
         for h in self._logger.handlers:
             if h.get_name() == handler_name:
                 self._logger.removeHandler(h)
+                h.close()
                 break
 
     def replay_cached_events(self, handler_name: Optional[str] = 'cache'):
@@ -121,8 +122,10 @@ class Logger:
         Args:
             handler_name (str): The handler name to remove.
         """
-        for h in self._logger.handlers:
+        for h in list(self._logger.handlers):
             self._logger.removeHandler(h)
+            # send any queued events (e.g., API logging) before releasing the handler
+            h.close()
 
     def update_handler_level(self, level: str):
         """Update all handlers log level.
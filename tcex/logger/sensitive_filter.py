@@ -1,31 +1,155 @@
 """TcEx logging filter module"""
 # standard library
 import logging
+import re
+import threading
+from typing import Optional, Pattern, Tuple
 
 
 class SensitiveFilter(logging.Filter):
-    """Sensitive Log Filter"""
+    """Sensitive Log Filter
+
+    Registered values are masked with a single regex pattern built from a trie of the values,
+    so the cost of masking a record does not grow linearly with the size of the registry.
+    Values added or removed since the pattern was built are tracked separately and the pattern
+    is rebuilt once the pending changes exceed rebuild_threshold or a tenth of the registry,
+    whichever is larger. Pending values are masked before the pattern, and a value that is part
+    of a value in the pattern triggers a rebuild, so overlapping values are always fully masked.
+
+    Registrations are reference counted, a value added more than once (e.g., a token held by an
+    input and by the token map) is masked until it has been removed the same number of times.
+    """
+
+    # the min number of pending adds or removes before the pattern is rebuilt
+    rebuild_threshold = 32
 
     def __init__(self, name=''):
         """Plug in a new filter to an existing formatter"""
         super().__init__(name)
-        self._sensitive_registry = set()
+        self._lock = threading.Lock()
+        # the compiled pattern and the pending values are swapped together for thread safety
+        self._masks: Tuple[Optional[Pattern], tuple] = (None, ())
+        self._pattern_values = frozenset()
+        self._pending = set()
+        self._removed = 0
+        # registered values mapped to the number of times each value was added
+        self._sensitive_registry = {}
+
+    @staticmethod
+    def _dropped(record: logging.LogRecord) -> bool:
+        """Return True if no handler would emit the record."""
+        levels = []
+        logger = logging.getLogger(record.name)
+        while logger:
+            levels.extend([h.level for h in logger.handlers])
+            if not logger.propagate:
+                break
+            logger = logger.parent
+
+        # with no handlers the record is handled by logging.lastResort
+        return bool(levels) and record.levelno < min(levels)
+
+    @staticmethod
+    def _trie_regex(node: dict) -> str:
+        """Return the regex for a trie node, collapsing runs of single child nodes."""
+        alternates = []
+        for char, child in sorted(node.items()):
+            if char == '':
+                continue
+
+            prefix = char
+            while len(child) == 1 and '' not in child:
+                ((char, child),) = child.items()
+                prefix += char
+            alternates.append(re.escape(prefix) + SensitiveFilter._trie_regex(child))
+
+        if not alternates:
+            return ''
+
+        regex = alternates[0] if len(alternates) == 1 else f'(?:{"|".join(alternates)})'
+        if '' in node:
+            # the value ending at this node is masked when no longer value matches
+            regex = f'(?:{regex})?'
+        return regex
+
+    def _update(self, rebuild: Optional[bool] = False):
+        """Update pending values and rebuild the pattern if too many changes are pending."""
+        changes = len(self._pending) + self._removed
+        if rebuild or changes > max(self.rebuild_threshold, len(self._pattern_values) // 10):
+            trie = {}
+            for value in self._sensitive_registry:
+                node = trie
+                for char in value:
+                    node = node.setdefault(char, {})
+                node[''] = True
+
+            pattern = re.compile(self._trie_regex(trie)) if trie else None
+            self._pattern_values = frozenset(self._sensitive_registry)
+            self._pending.clear()
+            self._removed = 0
+            self._masks = (pattern, ())
+            return
+
+        # longer values first so that a value containing another value is fully masked
+        self._masks = (self._masks[0], tuple(sorted(self._pending, key=len, reverse=True)))
 
     def add(self, value: str):
         """Add sensitive value to registry."""
         if value:
             # don't add empty string
-            self._sensitive_registry.add(str(value))
+            value = str(value)
+            with self._lock:
+                if value in self._sensitive_registry:
+                    self._sensitive_registry[value] += 1
+                else:
+                    self._sensitive_registry[value] = 1
+                    rebuild = False
+                    if value in self._pattern_values:
+                        self._removed -= 1
+                    else:
+                        self._pending.add(value)
+                        # the pattern would mask part of the value before the pending value
+                        rebuild = any(value in v for v in self._pattern_values)
+                    self._update(rebuild)
 
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter the record"""
+        if self._dropped(record) is True:
+            # skip formatting the message of a record that will not be emitted
+            return True
+
         # have to sniff the msg and args values of the LogRecord
         record.msg = self.replace(record.getMessage())
         record.args = {}
         return True
 
+    def remove(self, value: str):
+        """Remove a registration of a sensitive value (e.g., when a token is no longer in use).
+
+        The value is removed from the registry once every registration has been removed. Values
+        removed since the pattern was last built continue to be masked until the pattern is
+        rebuilt.
+        """
+        if value:
+            value = str(value)
+            with self._lock:
+                if value not in self._sensitive_registry:
+                    return
+                self._sensitive_registry[value] -= 1
+                if self._sensitive_registry[value] <= 0:
+                    del self._sensitive_registry[value]
+                    if value in self._pending:
+                        self._pending.remove(value)
+                    else:
+                        self._removed += 1
+                    self._update()
+
     def replace(self, obj: str):
         """Replace any sensitive data in the object if its a string"""
-        for replacement in self._sensitive_registry:
+        pattern, pending = self._masks
+        # pending values first so that a pending value containing a pattern value is fully masked
+        for replacement in pending:
             obj = obj.replace(replacement, '***')
+        if pattern is not None:
+            obj = pattern.sub('***', obj)
         return obj
@@ -5,7 +5,7 @@ import json
 import logging
 import re
 from collections import OrderedDict
-from typing import Any, List, Optional, Union
+from typing import Any, Iterable, List, Optional, Set, Union
 
 # first-party
 from tcex.key_value_store import KeyValueApi, KeyValueRedis
@@ -38,6 +38,7 @@ class PlaybookRead:
         self.key_value_store = key_value_store
 
         # properties
+        self._prefetched = {}
         self.log = logger
         self.utils = Utils()
 
@@ -74,9 +75,13 @@ class PlaybookRead:
 
     def _get_data(self, key: str) -> Any:
         """Get the value from Redis if applicable."""
+        key = key.strip()
+        if key in self._prefetched:
+            return self._prefetched[key]
+
         value = None
         try:
-            value = self.key_value_store.read(self.context, key.strip())
+            value = self.key_value_store.read(self.context, key)
         except RuntimeError as e:
             self.log.error(e)
         return value
@@ -318,6 +323,21 @@ class PlaybookRead:
 
         return StringVariable(value)
 
+    def _variable_keys(self, values: Iterable[Any]) -> Set[str]:
+        """Return the playbook variables in the values, including embedded variables."""
+        keys = set()
+        for value in values:
+            if isinstance(value, bytes):
+                value = value.decode('utf-8', errors='replace')
+
+            if isinstance(value, list):
+                keys.update(self._variable_keys(value))
+            elif isinstance(value, str):
+                for match in re.finditer(self.utils.variable_expansion_pattern, value):
+                    if match.group('origin') == '#':  # pb-variable
+                        keys.add(match.group(0))
+        return keys
+
     @staticmethod
     def _to_array(value: Optional[Union[List, str]]) -> List:
         """Return the provided array as a list."""
@@ -474,6 +494,42 @@ class PlaybookRead:
 
         return data
 
+    def prefetch(self, values: Iterable[Any]):
+        """Read all playbook variables referenced in the values with one bulk read per level.
+
+        Variables embedded in the String, KeyValue, and KeyValueArray values that are read are
+        fetched with another bulk read, since these types are resolved with embedded variables.
+        Until prefetch_clear() is called all read methods return the prefetched value for a
+        variable instead of reading it from the key value store.
+
+        Args:
+            values: The values (e.g., App inputs) that could contain playbook variables.
+        """
+        keys = self._variable_keys(values)
+        while keys:
+            try:
+                data = self.key_value_store.read_many(self.context, sorted(keys))
+            except RuntimeError as e:
+                # variables that were not prefetched are read individually
+                self.log.error(e)
+                break
+            self._prefetched.update(data)
+
+            # String, KeyValue, and KeyValueArray values can have embedded variables
+            embedded_values = [
+                v
+                for k, v in data.items()
+                if self.utils.get_playbook_variable_type(k)
+                in ['KeyValue', 'KeyValueArray', 'String']
+            ]
+            keys = self._variable_keys(embedded_values) - set(self._prefetched)
+
+        self.log.debug(f'feature=playbook, event=prefetch, count={len(self._prefetched)}')
+
+    def prefetch_clear(self):
+        """Clear the prefetched values so that variables are read from the key value store."""
+        self._prefetched = {}
+
     def raw(self, key: str) -> Optional[any]:
         """Read method of CRUD operation for raw data.
 
@@ -483,7 +539,11 @@ class PlaybookRead:
         if self._null_key_check(key) is True:
             return None
 
-        return self.key_value_store.read(self.context, key.strip())
+        key = key.strip()
+        if key in self._prefetched:
+            return self._prefetched[key]
+
+        return self.key_value_store.read(self.context, key)
 
     def string(
         self,
@@ -2,6 +2,7 @@
 # flake8: noqa
 # first-party
 from tcex.services.api_service import ApiService
+from tcex.services.command_executor import CommandExecutor
 from tcex.services.common_service_trigger import CommonServiceTrigger
 from tcex.services.mqtt_message_broker import MqttMessageBroker
 from tcex.services.webhook_trigger_service import WebhookTriggerService
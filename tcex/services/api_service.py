@@ -9,7 +9,6 @@ from io import BytesIO
 from typing import Any
 
 # first-party
-from tcex.input.field_types.sensitive import Sensitive
 from tcex.services.common_service import CommonService
 
 
@@ -131,6 +130,33 @@ class ApiService(CommonService):
             self.log.trace(traceback.format_exc())
             self.increment_metric('Errors')
 
+    def process_rejected_command(self, command: str, message: dict, session_id: str):
+        """Respond to a rejected RunService command with a 503 response.
+
+        Args:
+            command: The lowercase command name.
+            message: The message payload from the server topic.
+            session_id: The session id created for the command.
+        """
+        super().process_rejected_command(command, message, session_id)
+        if command != 'runservice':
+            return
+
+        request_key = message.get('requestKey')
+        response = {
+            'command': 'Acknowledged',
+            'headers': [],
+            'requestKey': request_key,
+            'status': 'Service Unavailable',
+            'statusCode': '503',
+            'type': 'RunService',
+        }
+        self.log.warning(
+            'feature=api-service, event=response-sent, status-code=503, '
+            f'request-key={request_key}'
+        )
+        self.message_broker.publish(json.dumps(response), self.args.tc_svc_client_topic)
+
     def process_run_service_command(self, message: dict):
         """Process the RunService command.
 
@@ -155,9 +181,10 @@ class ApiService(CommonService):
         Args:
             message: The message payload from the server topic.
         """
-        # register config apiToken (before any logging)
+        # register config apiToken (before any logging), the token map holds the only registration
+        # of the token with the sensitive log filter so that it is released on unregister
         self.token.register_token(
-            self.thread_name, Sensitive(message.get('apiToken')), message.get('expireSeconds')
+            self.thread_name, message.get('apiToken'), message.get('expireSeconds')
         )
         self.log.info(f'feature=api-service, event=runservice-command, message="{message}"')
 
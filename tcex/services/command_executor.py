@@ -0,0 +1,254 @@
+"""TcEx Framework Service Command Executor module"""
+# standard library
+import logging
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Callable, Dict, Optional
+
+# get tcex logger
+logger = logging.getLogger('tcex')
+
+
+class CommandExecutor:
+    """Bounded worker pool for processing service commands.
+
+    Commands are queued and processed by at most max_workers threads instead of starting a new
+    thread per command. Commands of a type listed in command_limits are never processed by more
+    than the given number of workers at a time, the remaining commands of that type wait in the
+    queue without holding a worker.
+
+    Once max_queue_size commands are waiting, the overflow policy is applied to new commands:
+    * block - wait for room in the queue (backpressure on the caller).
+    * reject - drop the command.
+
+    The policy can be overridden per command, e.g., a caller running on the MQTT network thread
+    must never block.
+    """
+
+    overflow_policies = ['block', 'reject']
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_queue_size: int,
+        overflow: Optional[str] = 'block',
+        command_limits: Optional[Dict[str, int]] = None,
+    ):
+        """Initialize the Class properties.
+
+        Args:
+            max_workers: The max number of worker threads.
+            max_queue_size: The max number of commands waiting to be processed.
+            overflow: The policy applied to new commands when the queue is full.
+            command_limits: The max number of concurrent workers per command type.
+        """
+        if overflow not in self.overflow_policies:
+            raise ValueError(
+                f'Invalid overflow policy ({overflow}), valid values: {self.overflow_policies}.'
+            )
+
+        self.command_limits = command_limits or {}
+        self.log = logger
+        self.max_queue_size = max_queue_size
+        self.max_workers = max_workers
+        self.overflow = overflow
+
+        # properties
+        self._condition = threading.Condition()
+        # commands of a type that is at its limit, waiting for a command of the same type to finish
+        self._deferred: Dict[str, deque] = {}
+        self._idle = 0
+        self._queue = deque()
+        self._queue_size = 0
+        self._running: Dict[str, int] = {}
+        self._shutdown = False
+        self._workers = []
+
+        # metrics
+        self._completed = 0
+        self._duration_total = 0.0
+        self._queue_depth_max = 0
+        self._rejected = 0
+        self._wait_max = 0.0
+        self._wait_total = 0.0
+
+    def _next(self) -> Optional[tuple]:
+        """Return the next command that can be processed, waiting until one is available."""
+        with self._condition:
+            while True:
+                while self._queue:
+                    task = self._queue.popleft()
+                    command = task[0]
+                    if self._running.get(command, 0) >= self.command_limits.get(
+                        command, self.max_workers
+                    ):
+                        # command type at limit, the next finished command of this type picks it up
+                        self._deferred.setdefault(command, deque()).append(task)
+                        continue
+
+                    self._running[command] = self._running.get(command, 0) + 1
+                    self._queue_size -= 1
+                    # notify callers blocked on a full queue
+                    self._condition.notify_all()
+                    return task
+
+                if self._shutdown:
+                    return None
+
+                self._idle += 1
+                self._condition.wait()
+                self._idle -= 1
+
+    def _done(self, command: str, queued: float, started: float):
+        """Record metrics for a processed command and release its command type slot."""
+        finished = time.monotonic()
+        with self._condition:
+            self._running[command] -= 1
+            deferred = self._deferred.get(command)
+            if deferred:
+                # process the oldest waiting command of the same type next
+                self._queue.appendleft(deferred.popleft())
+                self._condition.notify_all()
+
+            self._completed += 1
+            self._duration_total += finished - started
+            self._wait_max = max(self._wait_max, started - queued)
+            self._wait_total += started - queued
+
+    def _worker(self):
+        """Process commands from the queue until shutdown."""
+        thread = threading.current_thread()
+        worker_name = thread.name
+        while True:
+            task = self._next()
+            if task is None:
+                break
+
+            command, name, target, args, kwargs, session_id, trigger_id, queued = task
+
+            # the thread name, session_id, and trigger_id are used by the logger
+            thread.name = name
+            thread.session_id = session_id
+            thread.trigger_id = trigger_id
+            started = time.monotonic()
+            try:
+                target(*args, **kwargs)
+            except Exception:
+                self.log.trace(traceback.format_exc())
+            finally:
+                thread.name = worker_name
+                thread.session_id = None
+                thread.trigger_id = None
+                self._done(command, queued, started)
+
+    @property
+    def metrics(self) -> dict:
+        """Return the queue depth and latency metrics."""
+        with self._condition:
+            completed = self._completed or 1
+            return {
+                'Command Queue Depth': self._queue_size,
+                'Command Queue Depth Max': self._queue_depth_max,
+                'Command Queue Wait Avg (ms)': round(self._wait_total / completed * 1000, 2),
+                'Command Queue Wait Max (ms)': round(self._wait_max * 1000, 2),
+                'Command Duration Avg (ms)': round(self._duration_total / completed * 1000, 2),
+                'Commands Active': sum(self._running.values()),
+                'Commands Completed': self._completed,
+                'Commands Rejected': self._rejected,
+                'Command Workers': len(self._workers),
+            }
+
+    def shutdown(self, wait: Optional[bool] = False):
+        """Stop the workers once the queued commands have been processed.
+
+        Args:
+            wait: If True, wait for the workers to finish.
+        """
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+
+        if wait is True:
+            for worker in self._workers:
+                if worker is not threading.current_thread():
+                    worker.join()
+
+    def submit(
+        self,
+        command: str,
+        name: str,
+        target: Callable[[], bool],
+        args: Optional[tuple] = None,
+        kwargs: Optional[dict] = None,
+        session_id: Optional[str] = None,
+        trigger_id: Optional[int] = None,
+        overflow: Optional[str] = None,
+    ) -> bool:
+        """Queue a command to be processed by a worker.
+
+        Args:
+            command: The command type used for the concurrency limits (e.g., fireevent).
+            name: The thread name while the command is processed.
+            target: The method to call for the command.
+            args: The args to pass to the target method.
+            kwargs: The kwargs to pass to the target method.
+            session_id: The current session id.
+            trigger_id: The current trigger id.
+            overflow: The policy applied if the queue is full, defaults to the executor policy.
+
+        Returns:
+            bool: False if the command was rejected.
+        """
+        overflow = overflow or self.overflow
+        if overflow not in self.overflow_policies:
+            raise ValueError(
+                f'Invalid overflow policy ({overflow}), valid values: {self.overflow_policies}.'
+            )
+
+        task = (
+            command,
+            name,
+            target,
+            args or (),
+            kwargs or {},
+            session_id,
+            trigger_id,
+            time.monotonic(),
+        )
+        with self._condition:
+            if self._shutdown:
+                self.log.warning(
+                    f'feature=service, event=command-rejected, command={command}, '
+                    'reason=executor-shutdown'
+                )
+                return False
+
+            while self._queue_size >= self.max_queue_size:
+                if overflow == 'reject':
+                    self._rejected += 1
+                    self.log.warning(
+                        f'feature=service, event=command-rejected, command={command}, '
+                        f'reason=queue-full, queue-size={self._queue_size}'
+                    )
+                    return False
+                self._condition.wait()
+
+            self._queue.append(task)
+            self._queue_size += 1
+            self._queue_depth_max = max(self._queue_depth_max, self._queue_size)
+
+            # start workers on demand, up to max_workers
+            if self._idle == 0 and len(self._workers) < self.max_workers:
+                worker = threading.Thread(
+                    name=f'command-worker-{len(self._workers) + 1}',
+                    target=self._worker,
+                    daemon=True,
+                )
+                self._workers.append(worker)
+                worker.start()
+            else:
+                # callers blocked on a full queue wait on the same condition
+                self._condition.notify_all()
+        return True
@@ -2,6 +2,7 @@
 # standard library
 import json
 import logging
+import os
 import threading
 import time
 import traceback
@@ -10,7 +11,10 @@ from datetime import datetime
 from typing import Callable, Optional, Union
 
 # first-party
+from tcex.key_value_store import RedisClient
+from tcex.services.command_executor import CommandExecutor
 from tcex.services.mqtt_message_broker import MqttMessageBroker
+from tcex.sessions.shared_pool_adapter import SharedPoolAdapter
 
 # get tcex logger
 logger = logging.getLogger('tcex')
@@ -25,6 +29,10 @@ class CommonService:
     * Webhook Trigger Service
     """
 
+    # commands processed in their own thread instead of the command executor, so that a backlog of
+    # commands does not delay heartbeats or shutdown
+    control_commands = ['acknowledged', 'brokercheck', 'heartbeat', 'loggingchange', 'shutdown']
+
     def __init__(self, tcex: object):
         """Initialize the Class properties.
 
@@ -37,6 +45,15 @@ class CommonService:
         self._ready = False
         self._start_time = datetime.now()
         self.args: object = tcex.inputs.model
+        # bounded worker pool for commands (e.g., fire events, webhook events), the overflow
+        # policy only applies to commands submitted by the App (e.g., fire_event), commands from
+        # the broker are rejected when the queue is full
+        self.command_executor = CommandExecutor(
+            max_workers=int(os.getenv('TC_SVC_COMMAND_WORKERS', '20')),
+            max_queue_size=int(os.getenv('TC_SVC_COMMAND_QUEUE_SIZE', '1000')),
+            overflow=os.getenv('TC_SVC_COMMAND_QUEUE_OVERFLOW', 'block'),
+            command_limits=self._command_limits(os.getenv('TC_SVC_COMMAND_LIMITS')),
+        )
         self.configs = {}
         self.heartbeat_max_misses = 3
         self.heartbeat_sleep_time = 1
@@ -76,6 +93,20 @@ class CommonService:
             thread_key='session_id',
         )
 
+    @staticmethod
+    def _command_limits(limits: Optional[str]) -> dict:
+        """Return the per command concurrency limits (e.g., "fireevent=10,webhookevent=5").
+
+        Args:
+            limits: The comma separated command=limit pairs.
+        """
+        command_limits = {}
+        for limit in (limits or '').split(','):
+            if '=' in limit:
+                command, value = limit.split('=', 1)
+                command_limits[command.strip().lower()] = int(value)
+        return command_limits
+
     def process_acknowledged_command(self, message: dict):  # pylint: disable=unused-argument
         """Process the Acknowledge command.
 
@@ -196,7 +227,13 @@ class CommonService:
         # TODO: move to trigger command and handle API Service
         if self._metrics.get('Active Playbooks') is not None:
             self.update_metric('Active Playbooks', len(self.configs))
-        return self._metrics
+
+        # add the size and usage of the connection pools shared by all threads
+        metrics = dict(self._metrics)
+        metrics.update(self.command_executor.metrics)
+        metrics.update(SharedPoolAdapter.pool_metrics())
+        metrics.update(RedisClient.pool_metrics(self.redis_client.connection_pool))
+        return metrics
 
     @metrics.setter
     def metrics(self, metrics: dict):
@@ -239,14 +276,31 @@ class CommonService:
 
         # get the target method from command_map for the current command
         thread_method = self.command_map.get(command, self.process_invalid_command)
-        self.service_thread(
+        if command in self.control_commands:
+            self.service_thread(
+                # use session_id as thread name to provide easy debugging per thread
+                name=session_id,
+                target=thread_method,
+                args=(m,),
+                session_id=session_id,
+                trigger_id=trigger_id,
+            )
+            return
+
+        # this method runs on the MQTT network thread, blocking on a full queue would stop the
+        # client from processing any message (e.g., heartbeat or shutdown) so reject instead
+        submitted = self.command_executor.submit(
+            command=command,
             # use session_id as thread name to provide easy debugging per thread
             name=session_id,
             target=thread_method,
             args=(m,),
             session_id=session_id,
             trigger_id=trigger_id,
+            overflow='reject',
         )
+        if submitted is False:
+            self.process_rejected_command(command, m, session_id)
 
     def process_broker_check(self, message: dict):
         """Implement parent method to log a broker check message.
@@ -319,6 +373,21 @@ class CommonService:
             f'feature=service, event=invalid-command-received, message="""({message})""".'
         )
 
+    def process_rejected_command(
+        self, command: str, message: dict, session_id: str
+    ):  # pylint: disable=unused-argument
+        """Process a command rejected because the command queue is full.
+
+        Service types with request/response commands (e.g., RunService) override this method to
+        respond with an error, so the server does not wait for the request to time out.
+
+        Args:
+            command: The lowercase command name.
+            message: The message payload from the server topic.
+            session_id: The session id created for the command.
+        """
+        self.increment_metric('Errors')
+
     def process_shutdown_command(self, message: dict):
         """Implement parent method to process the shutdown command.
 
@@ -363,6 +432,9 @@ class CommonService:
         # update shutdown flag
         self.message_broker.shutdown = True
 
+        # stop the command workers once the queued commands are processed
+        self.command_executor.shutdown()
+
         # TODO: [review] this doesn't help if MainThread does not die.
         # # delay shutdown to give App time to cleanup
         # time.sleep(5)
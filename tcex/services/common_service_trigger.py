@@ -19,6 +19,10 @@ class CommonServiceTrigger(CommonService):
     * Webhook Trigger Service
     """
 
+    # configs must always be acknowledged (createconfig) or removed (deleteconfig), so config
+    # commands are never rejected by the command executor
+    control_commands = CommonService.control_commands + ['createconfig', 'deleteconfig']
+
     def __init__(self, tcex: object):
         """Initialize the Class properties.
 
@@ -194,7 +198,8 @@ class CommonServiceTrigger(CommonService):
                 self.log.info(f'feature=trigger-service, event=fire-event, trigger-id={session_id}')
 
                 # current thread has session_id as name
-                self.service_thread(
+                self.command_executor.submit(
+                    command='fireevent',
                     name=session_id,
                     target=self.fire_event_trigger,
                     args=(
@@ -334,6 +334,37 @@ class WebhookTriggerService(CommonServiceTrigger):
         # webhook responses are for providers that require a subscription req/resp.
         self.publish_webhook_event_response(message, response)
 
+    def process_rejected_command(self, command: str, message: dict, session_id: str):
+        """Respond to a rejected WebhookEvent or WebhookMarshallEvent command with a 503 response.
+
+        Args:
+            command: The lowercase command name.
+            message: The message payload from the server topic.
+            session_id: The session id created for the command.
+        """
+        super().process_rejected_command(command, message, session_id)
+        if command not in ['webhookevent', 'webhookmarshallevent']:
+            return
+
+        request_key = message.get('requestKey')
+        self.log.warning(
+            'feature=webhook-trigger-service, event=response-sent, status-code=503, '
+            f'request-key={request_key}'
+        )
+        self.message_broker.publish(
+            json.dumps(
+                {
+                    'sessionId': session_id,  # session/context
+                    'requestKey': request_key,
+                    'command': 'WebhookEventResponse',
+                    'triggerId': message.get('triggerId'),
+                    'headers': [],
+                    'statusCode': 503,
+                }
+            ),
+            self.args.tc_svc_client_topic,
+        )
+
     def publish_webhook_event_acknowledge(self, message: dict):
         """Publish the WebhookEventResponse message.
 
@@ -6,12 +6,13 @@ from typing import Callable, Optional
 
 # third-party
 import urllib3
-from requests import Response, Session, adapters, exceptions
-from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, DEFAULT_RETRIES
+from requests import Response, Session, exceptions
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_RETRIES
 from urllib3.util.retry import Retry
 
 # first-party
 from tcex.sessions.rate_limit_handler import RateLimitHandler
+from tcex.sessions.shared_pool_adapter import SharedPoolAdapter
 from tcex.utils.requests_to_curl import RequestsToCurl
 from tcex.utils.utils import Utils
 
@@ -54,14 +55,14 @@ def default_too_many_requests_handler(response: 'Response') -> float:
     return float(seconds)
 
 
-class CustomAdapter(adapters.HTTPAdapter):
+class CustomAdapter(SharedPoolAdapter):
     """Custom Adapter to properly handle retries."""
 
     def __init__(
         self,
         rate_limit_handler: Optional[RateLimitHandler] = None,
-        pool_connections=DEFAULT_POOLSIZE,
-        pool_maxsize=DEFAULT_POOLSIZE,
+        pool_connections=None,
+        pool_maxsize=None,
         max_retries=DEFAULT_RETRIES,
         pool_block=DEFAULT_POOLBLOCK,
     ):
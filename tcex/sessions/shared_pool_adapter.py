@@ -0,0 +1,87 @@
+"""ThreatConnect Shared Pool Adapter"""
+# standard library
+import os
+import threading
+from typing import Dict, Optional
+
+# third-party
+from requests import adapters
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_RETRIES
+from urllib3 import PoolManager
+
+
+class SharedPoolAdapter(adapters.HTTPAdapter):
+    """HTTP Adapter using process wide connection pools shared by the sessions of all threads.
+
+    A requests Session is not thread safe, so each thread gets its own session, however the
+    urllib3 PoolManager is. Sharing the PoolManager lets the sessions of all threads reuse the
+    same connections (one pool per host) instead of each thread doing a new TLS handshake.
+
+    The pool sizes default to the TC_HTTP_POOL_CONNECTIONS (the number of hosts to keep pools
+    for) and TC_HTTP_POOL_MAXSIZE (the number of connections kept per host) env vars.
+    """
+
+    _lock = threading.Lock()
+    _pool_managers: Dict[tuple, PoolManager] = {}
+    pool_connections = int(os.getenv('TC_HTTP_POOL_CONNECTIONS', '10'))
+    pool_maxsize = int(os.getenv('TC_HTTP_POOL_MAXSIZE', '10'))
+
+    def __init__(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        max_retries=DEFAULT_RETRIES,
+        pool_block=DEFAULT_POOLBLOCK,
+    ):
+        """Initialize the Class properties.
+
+        Args:
+            pool_connections: The number of hosts to keep connection pools for.
+            pool_maxsize: The max number of connections to keep in the pool of a host.
+            max_retries: passed to super
+            pool_block: passed to super
+        """
+        super().__init__(
+            pool_connections or self.pool_connections,
+            pool_maxsize or self.pool_maxsize,
+            max_retries,
+            pool_block,
+        )
+
+    def close(self):
+        """Close the proxy pools of this adapter, leaving the shared pools open for others."""
+        for proxy in self.proxy_manager.values():
+            proxy.clear()
+
+    def init_poolmanager(self, connections, maxsize, block=DEFAULT_POOLBLOCK, **pool_kwargs):
+        """Use the shared PoolManager for the pool settings instead of creating a new one."""
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+
+        key = (connections, maxsize, block, tuple(sorted(pool_kwargs.items())))
+        with self._lock:
+            if key not in self._pool_managers:
+                self._pool_managers[key] = PoolManager(
+                    num_pools=connections, maxsize=maxsize, block=block, **pool_kwargs
+                )
+            self.poolmanager = self._pool_managers[key]
+
+    @classmethod
+    def pool_metrics(cls) -> dict:
+        """Return the size and usage of the shared connection pools."""
+        pools = []
+        with cls._lock:
+            for pool_manager in cls._pool_managers.values():
+                for key in pool_manager.pools.keys():
+                    pool = pool_manager.pools.get(key)
+                    if pool is not None:
+                        pools.append(pool)
+
+        # num_connections is the total number of connections created by the pool
+        return {
+            'HTTP Pools': len(pools),
+            'HTTP Pool Max Size': cls.pool_maxsize,
+            'HTTP Connections Created': sum(p.num_connections for p in pools),
+            'HTTP Connections Idle': sum(p.pool.qsize() for p in pools if p.pool is not None),
+        }
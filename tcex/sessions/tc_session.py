@@ -1,14 +1,15 @@
 """ThreatConnect Requests Session"""
 # standard library
 import logging
-from typing import TYPE_CHECKING, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 # third-party
 import urllib3
-from requests import Session, adapters
+from requests import Session
 from urllib3.util.retry import Retry
 
 # first-party
+from tcex.sessions.shared_pool_adapter import SharedPoolAdapter
 from tcex.utils.requests_to_curl import RequestsToCurl
 from tcex.utils.utils import Utils
 
@@ -85,17 +86,56 @@ class TcSession(Session):
                 except Exception:  # nosec
                     pass  # logging curl command is best effort
 
+    def copy(self) -> 'TcSession':
+        """Return a new session with the same configuration for use by another thread.
+
+        The new session shares the connection pools of this session (SharedPoolAdapter).
+        """
+        session = TcSession(
+            auth=self.auth, base_url=self.base_url, log_curl=self.log_curl, verify=self.verify
+        )
+        session.headers.update(self.headers)
+        session.proxies.update(self.proxies)
+        return session
+
+    @staticmethod
+    def _body_position(data: Any) -> Optional[int]:
+        """Return the position to rewind the body to on retry, -1 if the body can't be replayed.
+
+        Bytes, strings, and form data can be resent as is (None is returned), file objects are
+        rewound to their position before the first send, and iterators (e.g., generators) or
+        non-seekable streams can only be sent once.
+        """
+        if data is None or isinstance(data, (bytes, str, dict, list, tuple)):
+            return None
+        if hasattr(data, 'seek') and hasattr(data, 'tell'):
+            try:
+                return data.tell()
+            except Exception:  # nosec
+                pass  # non-seekable stream (e.g., pipe or socket)
+        return -1
+
     def request(self, method, url, **kwargs):  # pylint: disable=arguments-differ
         """Override request method disabling verify on token renewal if disabled on session."""
+        position = self._body_position(kwargs.get('data'))
         response = super().request(method, self.url(url), **kwargs)
 
         # retry request in case we encountered a race condition with token renewal monitor
-        if response.status_code == 401:
+        if response.status_code == 401 and position == -1:
+            # the body was consumed by the first request, resending it would send an empty body
+            self.log.warning(
+                'feature=tc-session, event=retry-skipped, reason=body-not-replayable, '
+                f'request-url={response.request.url}, status-code={response.status_code}'
+            )
+        elif response.status_code == 401:
             self.log.debug(
                 f'Unexpected response received while attempting to send a request using internal '
                 f'session object. Retrying request. feature=tc-session, '
                 f'request-url={response.request.url}, status-code={response.status_code}'
             )
+            # rewind any file object body (e.g., batch upload) consumed by the first request
+            if position is not None:
+                kwargs['data'].seek(position)
             response = super().request(method, self.url(url), **kwargs)
 
         # optionally log the curl command
@@ -121,8 +161,8 @@ class TcSession(Session):
             backoff_factor=backoff_factor,
             status_forcelist=status_forcelist,
         )
-        # mount all https requests
-        self.mount('https://', adapters.HTTPAdapter(max_retries=retries))
+        # mount all https requests, using the connection pools shared by all sessions
+        self.mount('https://', SharedPoolAdapter(max_retries=retries))
 
     def url(self, url: str) -> str:
         """Return appropriate URL string.
@@ -0,0 +1,40 @@
+"""ThreatConnect Thread Sessions"""
+# standard library
+import threading
+
+# third-party
+from requests import Session
+
+# first-party
+from tcex.sessions.tc_session import TcSession
+
+
+class ThreadSessions:
+    """Per thread copies of a session for use by worker threads.
+
+    A requests Session is not thread safe. The thread that created the instance uses the provided
+    session, any other thread gets its own copy of the TcSession on first use. The copies share
+    the connection pools of the provided session (SharedPoolAdapter). Any other session type
+    (e.g., a mock session in tests) is shared by all threads.
+
+    Args:
+        session: The session to copy for worker threads.
+    """
+
+    def __init__(self, session: Session):
+        """Initialize the Class properties."""
+        self._local = threading.local()
+        self._owner = threading.get_ident()
+        self.session = session
+
+    @property
+    def current(self) -> Session:
+        """Return the session for the current thread."""
+        if threading.get_ident() == self._owner or not isinstance(self.session, TcSession):
+            return self.session
+
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self.session.copy()
+            self._local.session = session
+        return session
@@ -381,14 +381,25 @@ class TcEx:
             proxy_pass=self.inputs.model_unresolved.tc_proxy_password,
         )
 
-    @registry.factory(RedisClient)
-    @scoped_property
+    @registry.factory(RedisClient, singleton=True)
+    @cached_property
     def redis_client(self) -> 'RedisClient':
-        """Return redis client instance configure for Playbook/Service Apps."""
+        """Return redis client instance configure for Playbook/Service Apps.
+
+        The client and its connection pool are shared by all threads. When the
+        TC_REDIS_MAX_CONNECTIONS env var is set the pool is limited to that number of
+        connections and threads wait for a free connection.
+        """
+        kwargs = {}
+        max_connections = os.getenv('TC_REDIS_MAX_CONNECTIONS')
+        if max_connections:
+            kwargs = {'blocking_pool': True, 'max_connections': int(max_connections)}
+
         return self.get_redis_client(
             host=self.inputs.contents.get('tc_kvstore_host'),
             port=self.inputs.contents.get('tc_kvstore_port'),
             db=0,
+            **kwargs,
         )
 
     def results_tc(self, key: str, value: str):
@@ -4,6 +4,7 @@ import logging
 import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 # third-party
@@ -12,7 +13,7 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 # first-party
-from tcex.input.field_types.sensitive import Sensitive
+from tcex.input.field_types.sensitive import Sensitive, filter_sensitive
 from tcex.pleb.threading import ExceptionThread
 from tcex.utils import Utils
 
@@ -63,18 +64,21 @@ class Tokens:
 
         # properties
         #
-        # Threading event that is used as a barrier that determines whether a token can be retrieved
-        # from this module or not (via the token property). The barrier only blocks access to the
-        # token property whenever token renewal is taking place in order to keep from returning
-        # stale tokens.
+        # Threading event that is cleared while a renewal cycle is in progress. The token property
+        # does not wait on this event, only on the renewal event of the key being used.
         self._barrier = threading.Event()
-        # Setting barrier event to True disables barrier, which makes the token property
-        # accessible (default behavior)
         self._barrier.set()
 
+        # threading events per key that are cleared while the token for the key is being renewed,
+        # blocking access to the token via the token property to keep from returning stale tokens.
+        self._renewal_events = {}
+
         # threading event that denotes whether renewal monitor should sleep after a renewal cycle
         self._monitor_sleep_interval = threading.Event()
 
+        # replaced tokens and their expiration, masked in logs until they expire
+        self._replaced_tokens = []
+
         self.log = logger
         self.monitor_thread = None
         # session with retry for token renewal
@@ -87,6 +91,8 @@ class Tokens:
         # amount of time to wait before starting renewal process (after enabling barrier)
         # buffer allows any other threads using a token to possibly finish their work
         self.token_renewal_buffer_time = 5
+        # the max number of tokens renewed concurrently
+        self.token_renewal_workers = 8
         self.token_window = 600  # seconds to pad before token renewal
         self.utils = Utils
 
@@ -104,6 +110,49 @@ class Tokens:
             key: str = self.trigger_id
         return key
 
+    def _renew_key(self, key: str, expired_token: Sensitive):
+        """Renew the token for a key, removing the key if the token could not be renewed."""
+        try:
+            api_token_data = self.renew_token(expired_token)
+            self.token_map[key]['token'] = Sensitive(api_token_data['apiToken'])
+            self.token_map[key]['token_expires'] = int(api_token_data['apiTokenExpires'])
+            self.log.info(
+                f'''feature=token, action=token-renewed, key={key}, '''
+                f'''token={api_token_data['apiToken']}, '''
+                f'''expires={api_token_data['apiTokenExpires']}'''
+            )
+        except RuntimeError as e:
+            self.log.error(e)
+            try:
+                del self.token_map[key]
+                self.log.error(f'feature=token, event=token-removal-failure, key={key}')
+            except KeyError:  # pragma: no cover
+                pass
+        finally:
+            # grant access to the token for this key via token property once again
+            self._renewal_events.pop(key, threading.Event()).set()
+
+    def _release_replaced_tokens(self):
+        """Release replaced tokens once they have expired and can no longer be used."""
+        now = int(time.time())
+        replaced_tokens = []
+        for token, expires in self._replaced_tokens:
+            if expires is None or expires <= now:
+                self._release_token(token)
+            else:
+                replaced_tokens.append((token, expires))
+        self._replaced_tokens = replaced_tokens
+
+    @staticmethod
+    def _release_token(token: Optional[Sensitive]):
+        """Remove the registration of a token in the token map from the sensitive log filter.
+
+        The token is still masked if registered by another key or Sensitive value (e.g., the
+        tc_token input).
+        """
+        if token is not None:
+            filter_sensitive.remove(token.value)
+
     def register_token(self, key: str, token: Sensitive, expires: int):
         """Register a token.
 
@@ -187,17 +236,25 @@ class Tokens:
     @property
     def token(self) -> Optional['Sensitive']:
         """Return token for current thread."""
-        # wait until renewal barrier is set to True (meaning no renewal is in progress). If already
-        # true, then simply proceed.
+        key = self.key
 
         # perform three attempts - safety net in case of heavily overloaded monitor. If we cannot
         # retrieve a token after three attempts, there must be an issue
         for i in range(3):
-            if self._barrier.wait(timeout=self.token_renewal_buffer_time + 10):
-                return self.token_map.get(self.key, {}).get('token')
+            # only wait if the token for this key is being renewed. If there is no renewal event,
+            # then simply proceed.
+            renewal_event = self._renewal_events.get(key)
+            if renewal_event is None or renewal_event.wait(
+                timeout=self.token_renewal_buffer_time + 10
+            ):
+                if self.monitor_thread is not None and not self.monitor_thread.is_alive():
+                    # tokens will not be renewed once the monitor has exited unexpectedly
+                    if self.monitor_thread.exception is not None:
+                        break
+                return self.token_map.get(key, {}).get('token')
 
             self.log.debug(
-                'Timeout expired while waiting for token renewal barrier to be disabled. '
+                'Timeout expired while waiting for token renewal of key to complete. '
                 f'Attempts: {i + 1}'
             )
 
@@ -205,14 +262,12 @@ class Tokens:
                 break
 
         self.log.error(
-            'Could not retrieve TC token. Token renewal monitor did not disable token barrier. '
+            'Could not retrieve TC token. Token renewal monitor did not complete renewal. '
             f'Token renewal monitor thread alive: {self.monitor_thread.is_alive()}'
         )
 
         # timeout expired, monitor likely offline
-        exc = RuntimeError(
-            'Timeout expired while waiting for renewal thread to disable token barrier.'
-        )
+        exc = RuntimeError('Timeout expired while waiting for token renewal to complete.')
         if self.monitor_thread.exception is not None:
             raise exc from self.monitor_thread.exception
 
@@ -241,16 +296,22 @@ class Tokens:
         self.monitor_thread.start()
 
     def token_renewal_monitor(self):
-        """Monitor token expiration and renew when required."""
+        """Monitor token expiration and renew when required.
+
+        Tokens within token_window seconds of expiring are renewed concurrently. Only threads
+        using a token that is being renewed wait for the renewal to complete.
+        """
         self.log.debug('feature=token, event=renewal-monitor-started')
-        self._barrier.set()
         self._monitor_sleep_interval.wait(self.sleep_interval)
         while True:
-            # Clear renewal barrier (setting it to False), which blocks access to token via
-            # the token property.
+            # Clear renewal barrier (setting it to False), which denotes a renewal cycle.
             self._barrier.clear()
-            self.log.debug('Token renewal barrier enabled.')
-            self._monitor_sleep_interval.wait(self.token_renewal_buffer_time)
+            self.log.debug('Token renewal cycle started.')
+
+            # a replaced token is a valid credential until it expires, so it remains masked
+            self._release_replaced_tokens()
+
+            expired = {}
             for key, token_data in dict(self.token_map).items():
                 # calculate the time left to sleep
                 sleep_seconds = (
@@ -267,26 +328,30 @@ class Tokens:
                 if sleep_seconds > 0:
                     continue
 
-                # renew token data
-                try:
-                    api_token_data = self.renew_token(token_data.get('token'))
-                    self.token_map[key]['token'] = Sensitive(api_token_data['apiToken'])
-                    self.token_map[key]['token_expires'] = int(api_token_data['apiTokenExpires'])
-                    self.log.info(
-                        f'''feature=token, action=token-renewed, key={key}, '''
-                        f'''token={api_token_data['apiToken']}, '''
-                        f'''expires={api_token_data['apiTokenExpires']}'''
-                    )
-                except RuntimeError as e:
-                    self.log.error(e)
-                    try:
-                        del self.token_map[key]
-                        self.log.error(f'feature=token, event=token-removal-failure, key={key}')
-                    except KeyError:  # pragma: no cover
-                        pass
-            # renewal loop is finished, grant access to token via token property once again
+                # block access to the token for this key until it is renewed
+                self._renewal_events.setdefault(key, threading.Event()).clear()
+                expired[key] = (token_data.get('token'), token_data.get('token_expires'))
+
+            if expired:
+                # allow any other threads using the expired tokens to possibly finish their work
+                self._monitor_sleep_interval.wait(self.token_renewal_buffer_time)
+
+                with ThreadPoolExecutor(
+                    max_workers=min(len(expired), self.token_renewal_workers),
+                    thread_name_prefix='token-renewal',
+                ) as executor:
+                    futures = [
+                        executor.submit(self._renew_key, k, t) for k, (t, _) in expired.items()
+                    ]
+                # renewed or removed, the expired tokens are released once they expire
+                self._replaced_tokens.extend(expired.values())
+                # raise any unexpected exception in the monitor thread
+                for future in futures:
+                    future.result()
+
+            # renewal cycle is finished
             self._barrier.set()
-            self.log.debug('Token renewal barrier disabled.')
+            self.log.debug('Token renewal cycle finished.')
 
             # if monitor has not been shutdown, renewal monitor will sleep for sleep_interval
             # seconds. If monitor has been shutdown, monitor does not sleep and proceeds to
@@ -314,7 +379,12 @@ class Tokens:
             key: The key used to identify a token.
         """
         try:
-            del self.token_map[key]
+            token_data = self.token_map.pop(key)
             self.log.debug(f'feature=token, action=token-unregister, key={key}')
         except KeyError:
-            pass
+            return
+        finally:
+            self._renewal_events.pop(key, threading.Event()).set()
+
+        # stop masking the token once it is no longer in use
+        self._release_token(token_data.get('token'))
@@ -1,7 +1,9 @@
 """TcEx Utilities Datetime Operations Module"""
 # standard library
+import re
 from datetime import datetime
-from typing import Any, Optional, Tuple, Union
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
 
 # third-party
 import arrow as _arrow
@@ -12,6 +14,11 @@ from dateutil.relativedelta import relativedelta
 class DatetimeOperations:
     """TcEx Utilities Datetime Operations Class"""
 
+    # an epoch timestamp (e.g., 1600000000, 1600000000000, 1600000000.123)
+    _timestamp_pattern = re.compile(r'[+-]?(\d+)(\.\d*)?|[+-]?\.\d+')
+    # a humanized time expression (e.g., now, 2 hours ago, in 3 days)
+    _humanized_pattern = re.compile(r'\s*(now|in\s.*|.*\sago)\s*', re.IGNORECASE)
+
     @classmethod
     def any_to_datetime(cls, datetime_expression: str, tz: Optional[str] = None) -> '_arrow.Arrow':
         """Return a arrow object from datetime expression.
@@ -29,30 +36,48 @@ class DatetimeOperations:
         """
         value = str(datetime_expression)
 
-        # note: order matters. For example, _parse_timestamp could parse inputs that would have
-        # been meant for one of the default parser formats
-        parser_methods = [
-            cls._parse_default_arrow_formats,
-            cls._parse_non_default_arrow_formats,
-            cls._parse_timestamp,
-            cls._parse_humanized_input,
-            cls._parse_date_utils,
-        ]
-
-        for method in parser_methods:
-            try:
-                parsed = method(value)
-            except Exception:  # nosec
-                # value could not be parsed by current method.
-                pass
+        parsed = cls._parse_formats(value)
+        if parsed is None:
+            # humanized and dateutil parsing depend on the current time and are not cached
+            for method in [cls._parse_humanized_input, cls._parse_date_utils]:
+                try:
+                    parsed = method(value)
+                except Exception:  # nosec
+                    # value could not be parsed by current method.
+                    pass
+                else:
+                    break
             else:
-                # convert timezone if tz arg provided, else return parsed object
-                return cls._convert_timezone(parsed, tz) if tz is not None else parsed
+                raise RuntimeError(
+                    f'Value "{value}" of type "{type(datetime_expression)}" '
+                    'could not be parsed as a date time object.'
+                )
 
-        raise RuntimeError(
-            f'Value "{value}" of type "{type(datetime_expression)}" '
-            'could not be parsed as a date time object.'
-        )
+        # convert timezone if tz arg provided, else return parsed object
+        return cls._convert_timezone(parsed, tz) if tz is not None else parsed
+
+    @classmethod
+    def any_to_datetime_many(
+        cls, datetime_expressions: Iterable[str], tz: Optional[str] = None
+    ) -> List['_arrow.Arrow']:
+        """Return a list of arrow objects from a list of datetime expressions.
+
+        Each unique expression is only parsed once, which is faster than calling any_to_datetime
+        for each value when parsing a feed with many repeated dates (e.g., a date only field).
+
+        Args:
+            datetime_expressions: The datetime expressions to parse into Arrow datetime objects.
+            tz: If provided, the parsed Arrow datetime objects will be converted to the timezone
+                resulting from this timezone expression (see any_to_datetime).
+        """
+        parsed = {}
+        results = []
+        for datetime_expression in datetime_expressions:
+            key = (type(datetime_expression), str(datetime_expression))
+            if key not in parsed:
+                parsed[key] = cls.any_to_datetime(datetime_expression, tz)
+            results.append(parsed[key])
+        return results
 
     @property
     def arrow(self):
@@ -164,6 +189,46 @@ class DatetimeOperations:
                 f'Could not convert datetime to timezone "{tz}". Please verify timezone input.'
             ) from ex
 
+    @classmethod
+    def _format_parsers(cls, value: str) -> List[Callable[[str], '_arrow.Arrow']]:
+        """Return the arrow and timestamp parsers that could parse the value, in order.
+
+        Parsers that can not parse a value of the same shape are skipped instead of raising an
+        exception for each value. The order of the remaining parsers is unchanged.
+        """
+        parsers = [
+            cls._parse_default_arrow_formats,
+            cls._parse_non_default_arrow_formats,
+            cls._parse_timestamp,
+        ]
+
+        timestamp = cls._timestamp_pattern.fullmatch(value)
+        if timestamp is not None:
+            # the YYYY, YYYY.MM, YYYYDDDD, and YYYYMMDD formats can also be parsed as a timestamp
+            if value[0] in '+-' or len(timestamp.group(1) or '') not in [4, 7, 8]:
+                parsers = [cls._parse_timestamp]
+        elif cls._humanized_pattern.fullmatch(value) is not None:
+            parsers = []
+        elif value[:1].isalpha():
+            # default arrow formats always start with the year
+            parsers = parsers[1:]
+        return parsers
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_formats(value: str) -> Optional['_arrow.Arrow']:
+        """Return the value parsed by the arrow and timestamp parsers or None if not parsed.
+
+        Results are cached as these parsers do not depend on the current time.
+        """
+        for method in DatetimeOperations._format_parsers(value):
+            try:
+                return method(value)
+            except Exception:  # nosec
+                # value could not be parsed by current method.
+                pass
+        return None
+
     @staticmethod
     def _parse_default_arrow_formats(value: Any) -> '_arrow.Arrow':
         """Attempt to parse value using default Arrow formats.
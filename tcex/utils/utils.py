@@ -1,13 +1,15 @@
 """TcEx Utilities Module"""
 # standard library
 import ast
+import functools
 import ipaddress
 import re
-from typing import Any, List, Optional, Pattern, Union
+from typing import Any, Callable, Iterable, List, Optional, Pattern, Union
 
 # third-party
 import astunparse
 import jmespath
+from jmespath.exceptions import JMESPathError
 
 # first-party
 from tcex.utils.aes_operations import AesOperations
@@ -19,6 +21,72 @@ from tcex.utils.variables import Variables
 class Utils(AesOperations, DatetimeOperations, StringOperations, Variables):
     """TcEx Utilities Class"""
 
+    @staticmethod
+    def compile_mapping(mapping: dict) -> Callable[[Any], dict]:
+        """Return a function that maps a single record using the provided mapping.
+
+        The mapping is parsed once, so the returned function can be applied to a stream of
+        records without walking the mapping or compiling jmespath expressions for each record.
+        String values starting with "@" are jmespath expressions searched against the record,
+        dicts and lists are mapped recursively, and any other value is returned as is.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            mapping = {'name': '@.summary', 'tags': ['feed', '@.category'], 'type': 'Host'}
+            map_record = tcex.utils.compile_mapping(mapping)
+            for record in records:
+                batch.save(map_record(record))
+
+        Args:
+            mapping: The mapping of output keys to jmespath expressions or constant values.
+        """
+
+        def _compile(value: Any) -> Callable[[Any], Any]:
+            """Return a function that maps a single value of the mapping."""
+            if isinstance(value, dict):
+                fields = [(k, _compile(v)) for k, v in value.items()]
+                return lambda record: {k: map_field(record) for k, map_field in fields}
+
+            if isinstance(value, list):
+                items = [_compile(v) for v in value]
+                return lambda record: [map_item(record) for map_item in items]
+
+            if isinstance(value, str) and value.startswith('@'):
+                try:
+                    expression = jmespath.compile(value)
+                except JMESPathError as ex:
+                    raise RuntimeError(f'Invalid mapping expression "{value}" ({ex}).') from ex
+
+                # expressions that only select fields (e.g., "@.a.b") skip the jmespath interpreter
+                nodes = expression.parsed.get('children') or []
+                if expression.parsed.get('type') == 'current':
+                    return lambda record: record
+                if (
+                    expression.parsed.get('type') == 'subexpression'
+                    and nodes[0].get('type') == 'current'
+                    and all(n.get('type') == 'field' for n in nodes[1:])
+                ):
+                    return functools.partial(Utils._search_fields, [n['value'] for n in nodes[1:]])
+
+                def _search(record: Any) -> Any:
+                    try:
+                        return expression.search(record)
+                    except JMESPathError as ex:
+                        raise RuntimeError(
+                            f'Failed to search mapping expression "{value}" ({ex}).'
+                        ) from ex
+
+                return _search
+
+            # constant value
+            return lambda record: value
+
+        if not isinstance(mapping, dict):
+            raise RuntimeError(f'Invalid mapping type "{type(mapping).__name__}" (expected dict).')
+        return _compile(mapping)
+
     @staticmethod
     def find_line_in_code(
         needle: str,
@@ -101,39 +169,20 @@ class Utils(AesOperations, DatetimeOperations, StringOperations, Variables):
         else:
             return True
 
-    def mapper(self, data: Union[list, dict], mapping: dict):
-        """Yield something ..."""
-        # TODO [high] - @bpurdy - update docstring with description of what this is?
+    def mapper(self, data: Union[Iterable[Any], dict], mapping: dict):
+        """Yield each record of data mapped using the provided mapping.
+
+        Args:
+            data: A single record or an iterable of records.
+            mapping: The mapping of output keys to jmespath expressions or constant values
+                (see compile_mapping).
+        """
         if isinstance(data, dict):
             data = [data]
-        try:
-            for d in data:
-                mapped_obj = mapping.copy()
-                for key, value in mapping.items():
-                    if isinstance(value, list):
-                        new_list = []
-                        for item in value:
-                            if isinstance(item, dict):
-                                new_list.append(list(self.mapper(d, item))[0])
-                            else:
-                                if not item.startswith('@'):
-                                    new_list.append(item)
-                                else:
-                                    new_list.append(
-                                        jmespath.search(f'{item}', jmespath.search('@', d))
-                                    )
-
-                        mapped_obj[key] = new_list
-                    elif isinstance(value, dict):
-                        mapped_obj[key] = list(self.mapper(d, mapped_obj[key]))[0]
-                    else:
-                        if not value.startswith('@'):
-                            mapped_obj[key] = value
-                        else:
-                            mapped_obj[key] = jmespath.search(f'{value}', jmespath.search('@', d))
-                yield mapped_obj
-        except Exception:  # nosec
-            pass
+
+        map_record = self.compile_mapping(mapping)
+        for d in data:
+            yield map_record(d)
 
     @staticmethod
     def printable_cred(
@@ -156,6 +205,18 @@ class Utils(AesOperations, DatetimeOperations, StringOperations, Variables):
                 cred = f'{cred[:visible]}{mask_char * mask_char_count}{cred[-visible:]}'
         return cred
 
+    @staticmethod
+    def _search_fields(fields: List[str], record: Any) -> Any:
+        """Return the value of the fields path in the record, the same as a jmespath search."""
+        for field in fields:
+            try:
+                record = record.get(field)
+            except AttributeError:
+                return None
+            if record is None:
+                return None
+        return record
+
     @staticmethod
     def standardize_asn(asn: str) -> str:
         """Return the ASN formatted for ThreatConnect.
@@ -1,8 +1,20 @@
 """Test the TcEx Batch Module."""
 # standard library
+import io
+import itertools
+import json
 import os
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.v2.batch.batch_submit import BatchSubmit
 
 if TYPE_CHECKING:
     # first-party
@@ -124,3 +136,281 @@ class TestBatch:
             'b40930bbcf80744c86c46a12bc9da056641d722716c378f5659b9e555ef833e1'
         )
         assert batch._indicator_values(indicator_data) == indicator_data.split(' : ')
+
+    @staticmethod
+    def test_batch_data_chunk(request, tcex: 'TcEx'):
+        """Test batch data is returned in chunks with associations kept together."""
+        batch = tcex.v2.batch(owner=os.getenv('TC_OWNER'))
+        batch._batch_max_chunk = 10
+
+        group_1 = batch.adversary(
+            name=f'{request.node.name}-1', xid=batch.generate_xid(['pytest', 'adversary', 1])
+        )
+        group_2 = batch.adversary(
+            name=f'{request.node.name}-2', xid=batch.generate_xid(['pytest', 'adversary', 2])
+        )
+        group_1.association(group_2.xid)
+        for i in range(25):
+            batch.address(ip=f'1.1.1.{i}', xid=batch.generate_xid(['pytest', 'address', i]))
+
+        chunks = []
+        while True:
+            content = batch.data
+            if not content.get('group') and not content.get('indicator'):
+                break
+            chunks.append((len(content.get('group')), len(content.get('indicator'))))
+
+        assert chunks == [(2, 8), (0, 10), (0, 7)]
+        assert len(batch) == 0
+
+    @staticmethod
+    def test_batch_submit_all_pipelined(monkeypatch, tcex: 'TcEx'):
+        """Test pipelined submit returns results in submission order and halts on failure."""
+        batch = tcex.v2.batch(owner=os.getenv('TC_OWNER'))
+        batch._batch_max_chunk = 10
+        for i in range(55):
+            batch.address(ip=f'1.1.1.{i}', xid=batch.generate_xid(['pytest', 'address', i]))
+
+        batch_ids = itertools.count(1)
+
+        def submit_create_and_upload(**kwargs):  # pylint: disable=unused-argument
+            return {'data': {'batchStatus': {'id': next(batch_ids)}}}
+
+        def poll(batch_id, **kwargs):  # pylint: disable=unused-argument
+            # first job is the slowest to ensure results are returned in submission order
+            time.sleep(0.5 if batch_id == 1 else 0.1)
+            return {'data': {'batchStatus': {'id': batch_id, 'errorCount': int(batch_id == 4)}}}
+
+        def errors(batch_id, halt_on_error=True):  # pylint: disable=unused-argument
+            return [{'errorReason': 'would exceed the number of allowed indicators'}]
+
+        monkeypatch.setattr(batch, 'submit_create_and_upload', submit_create_and_upload)
+        monkeypatch.setattr(batch, 'poll', poll)
+        monkeypatch.setattr(batch, 'errors', errors)
+
+        results = batch.submit_all_pipelined(max_in_flight=3, halt_on_error=False)
+        assert [r.get('id') for r in results] == list(range(1, len(results) + 1))
+        # submission stops once the critical failure in batch 4 is found
+        assert len(results) < 6
+        assert len(batch) > 0
+
+    @staticmethod
+    def test_batch_submit_all_pipelined_associations(monkeypatch, tcex: 'TcEx'):
+        """Test pipelined chunks are held until the groups they are associated with exist."""
+        batch = tcex.v2.batch(owner=os.getenv('TC_OWNER'))
+        batch._batch_max_chunk = 5
+        groups = [batch.adversary(name=f'pytest-{i}', xid=f'pytest-g{i}') for i in range(4)]
+        for i in range(16):
+            address = batch.address(ip=f'1.1.1.{i}', xid=f'pytest-address-{i}')
+            address.association(groups[i % 3].xid)
+
+        batch_ids = itertools.count(1)
+        created = set()
+        jobs = {}
+        lock = threading.Lock()
+
+        def submit_create_and_upload(content, **kwargs):  # pylint: disable=unused-argument
+            data = json.loads(content.json_body().read())
+            associations = {
+                a.get('groupXid')
+                for i in data.get('indicator', [])
+                for a in i.get('associatedGroups', [])
+            }
+            with lock:
+                batch_id = next(batch_ids)
+                # groups associated with the chunk must be created by a completed chunk
+                jobs[batch_id] = (
+                    [g.get('xid') for g in data.get('group', [])],
+                    associations - created - {g.get('xid') for g in data.get('group', [])},
+                )
+            return {'data': {'batchStatus': {'id': batch_id}}}
+
+        def poll(batch_id, **kwargs):  # pylint: disable=unused-argument
+            # the job that creates the groups is the slowest
+            time.sleep(0.3 if batch_id == 1 else 0.01)
+            with lock:
+                created.update(jobs[batch_id][0])
+            return {'data': {'batchStatus': {'id': batch_id, 'errorCount': 0}}}
+
+        monkeypatch.setattr(batch, 'submit_create_and_upload', submit_create_and_upload)
+        monkeypatch.setattr(batch, 'poll', poll)
+
+        results = batch.submit_all_pipelined(max_in_flight=3, halt_on_error=False)
+        assert len(results) == 4
+        assert jobs[1][0] == [g.xid for g in groups]
+        assert all(not missing for _, missing in jobs.values())
+
+    @staticmethod
+    def test_batch_submit_retry_failed(monkeypatch, tcex: 'TcEx'):
+        """Test only entities that failed with a transient error are resubmitted."""
+        batch = tcex.v2.batch(owner=os.getenv('TC_OWNER'))
+        batch.retry_failed = 2
+        for i in range(10):
+            batch.address(ip=f'1.1.1.{i}', xid=f'pytest-retry-{i}')
+
+        batch_ids = itertools.count(1)
+        submitted = {}
+
+        def submit_create_and_upload(content, **kwargs):  # pylint: disable=unused-argument
+            batch_id = next(batch_ids)
+            submitted[batch_id] = [
+                i.get('xid') for i in json.loads(content.json_body().read()).get('indicator')
+            ]
+            return {'data': {'batchStatus': {'id': batch_id}}}
+
+        def poll(batch_id, **kwargs):  # pylint: disable=unused-argument
+            return {'data': {'batchStatus': {'id': batch_id, 'errorCount': int(batch_id < 3)}}}
+
+        def errors_stream(batch_id):
+            if batch_id == 1:
+                yield {'errorReason': 'pytest-retry-1 0x1004 Internal Error', 'errorSource': ''}
+                yield {'errorReason': 'pytest-retry-2 0x1005 Invalid Indicator', 'errorSource': ''}
+                yield {
+                    'errorReason': 'Lock wait timeout exceeded',
+                    'errorSource': json.dumps({'summary': '1.1.1.3', 'xid': 'pytest-retry-3'}),
+                }
+            elif batch_id == 2:
+                yield {'errorReason': 'pytest-retry-1 0x1004 Internal Error', 'errorSource': ''}
+
+        monkeypatch.setattr(batch, 'submit_create_and_upload', submit_create_and_upload)
+        monkeypatch.setattr(batch, 'poll', poll)
+        monkeypatch.setattr(batch, 'errors_stream', errors_stream)
+
+        results = batch.submit_all(errors=False, process_files=False)
+        assert len(results) == 1
+        assert submitted[2] == ['pytest-retry-1', 'pytest-retry-3']
+        assert submitted[3] == ['pytest-retry-1']
+        assert results[0].get('retry').get('id') == 2
+        assert results[0].get('retry').get('retry').get('id') == 3
+
+    @staticmethod
+    def test_batch_submit_retry_errors_failed(monkeypatch, tcex: 'TcEx'):
+        """Test a failure reading the batch errors does not raise when halt_on_error is False."""
+        batch = tcex.v2.batch(owner=os.getenv('TC_OWNER'))
+        batch.retry_failed = 1
+        batch.address(ip='1.1.1.1', xid='pytest-retry-1')
+
+        def submit_create_and_upload(content, **kwargs):  # pylint: disable=unused-argument
+            return {'data': {'batchStatus': {'id': 1}}}
+
+        def poll(batch_id, **kwargs):  # pylint: disable=unused-argument
+            return {'data': {'batchStatus': {'id': batch_id, 'errorCount': 1}}}
+
+        def errors_stream(batch_id):  # pylint: disable=unused-argument
+            yield from BatchSubmit._json_array_stream([b'[{"errorReason": "pytest'])
+
+        monkeypatch.setattr(batch, 'submit_create_and_upload', submit_create_and_upload)
+        monkeypatch.setattr(batch, 'poll', poll)
+        monkeypatch.setattr(batch, 'errors_stream', errors_stream)
+
+        results = batch.submit_all(errors=False, process_files=False, halt_on_error=False)
+        assert results[0].get('retry') is None
+
+        batch.address(ip='1.1.1.1', xid='pytest-retry-1')
+        with pytest.raises(RuntimeError):
+            batch.submit_all(errors=False, process_files=False, halt_on_error=True)
+
+    @staticmethod
+    def test_batch_process_files(tmp_path, tcex: 'TcEx'):
+        """Test file content of any supported type is written to disk by process_files."""
+        batch = tcex.v2.batch(owner=os.getenv('TC_OWNER'))
+        batch.debug_path_files = str(tmp_path)
+
+        contents = {
+            'pytest-bytes': b'bytes',
+            'pytest-file': lambda xid: io.BytesIO(b'file'),
+            'pytest-iterable': lambda xid: iter([b'iter', 'able']),
+            'pytest-str': 'str \u00e9',
+            'pytest-text-file': lambda xid: io.StringIO('text file'),
+        }
+        file_data = {
+            xid: {'fileContent': content, 'fileName': f'{xid}.txt', 'type': 'Document'}
+            for xid, content in contents.items()
+        }
+        batch.process_files(file_data)
+
+        assert not file_data
+        written = {f.name.split('--')[1]: f.read_bytes() for f in tmp_path.iterdir()}
+        assert written == {
+            'pytest-bytes': b'bytes',
+            'pytest-file': b'file',
+            'pytest-iterable': b'iterable',
+            'pytest-str': 'str \u00e9'.encode('utf-8'),
+            'pytest-text-file': b'text file',
+        }
+
+    @staticmethod
+    def test_batch_submit_files_pool(monkeypatch, tcex: 'TcEx'):
+        """Test files are uploaded by a bounded pool with failed uploads retried."""
+        batch = tcex.v2.batch(owner=os.getenv('TC_OWNER'))
+        batch.file_upload_retries = 1
+        batch.file_upload_workers = 2
+
+        active = {'count': 0, 'max': 0}
+        attempts = {}
+        lock = threading.Lock()
+        sessions = set()
+
+        def request(session, method, url, data=None, **kwargs):  # pylint: disable=unused-argument
+            xid = url.split('/')[-2]
+            with lock:
+                active['count'] += 1
+                active['max'] = max(active['max'], active['count'])
+                attempts.setdefault(xid, []).append((method, data.read()))
+                sessions.add(session)
+            time.sleep(0.05)
+            with lock:
+                active['count'] -= 1
+
+            r = MagicMock()
+            r.ok = not (xid == 'pytest-file-0' and len(attempts[xid]) == 1)
+            r.status_code = 200 if r.ok else 503
+            return r
+
+        monkeypatch.setattr(type(batch.session_tc), 'request', request)
+
+        file_data = {
+            f'pytest-file-{i}': {
+                'fileContent': io.BytesIO(f'content {i}'.encode()),
+                'fileName': f'pytest-{i}.txt',
+                'type': 'Document',
+            }
+            for i in range(6)
+        }
+        upload_status = batch.submit_files(file_data, halt_on_error=True)
+        assert all(s.get('uploaded') for s in upload_status)
+        assert active['max'] <= 2
+        # each upload worker uses its own session
+        assert batch.session_tc not in sessions
+        assert 1 <= len(sessions) <= 2
+        # the file object is rewound on retry
+        assert attempts['pytest-file-0'] == [('POST', b'content 0'), ('POST', b'content 0')]
+        assert batch.file_upload_status.get('uploaded') == 6
+        assert not file_data
+
+    @staticmethod
+    def test_batch_submit_file_401_not_replayable(monkeypatch, tcex: 'TcEx'):
+        """Test a 401 from POST only switches to PUT if the file content can be read again."""
+        batch = tcex.v2.batch(owner=os.getenv('TC_OWNER'))
+
+        attempts = []
+
+        def submit_file_content(method, url, content, *args):  # pylint: disable=unused-argument
+            attempts.append((method, b''.join(content)))
+            r = MagicMock()
+            r.ok = method == 'PUT'
+            r.status_code = 200 if r.ok else 401
+            return r
+
+        monkeypatch.setattr(batch, 'submit_file_content', submit_file_content)
+
+        content_data = {'fileContent': iter([b'content']), 'fileName': 'pytest.txt'}
+        status = batch.submit_file('pytest-file-0', content_data, halt_on_error=False)
+        assert status.get('uploaded') is False
+        assert attempts == [('POST', b'content')]
+
+        attempts.clear()
+        content_data = {'fileContent': lambda xid: iter([b'content']), 'fileName': 'pytest.txt'}
+        status = batch.submit_file('pytest-file-1', content_data, halt_on_error=False)
+        assert status.get('uploaded') is True
+        assert attempts == [('POST', b'content'), ('PUT', b'content')]
@@ -0,0 +1,91 @@
+"""Test the TcEx Batch Dedup Index Module."""
+# first-party
+from tcex.api.tc.v2.batch.batch_dedup_index import BatchDedupIndex
+from tcex.api.tc.v2.batch.group import Adversary, Document
+from tcex.api.tc.v2.batch.indicator import Address, File
+
+
+class TestBatchDedupIndex:
+    """Test the TcEx Batch Dedup Index Module."""
+
+    @staticmethod
+    def test_batch_dedup_index_keys():
+        """Test indicator summaries and group names are normalized."""
+        index = BatchDedupIndex()
+        assert index.indicator_key(File(md5='A' * 32, sha1='B' * 40)) == index.indicator_key(
+            {'summary': f''' {'a' * 32} : {'b' * 40}''', 'type': 'File'}
+        )
+        assert index.indicator_key({'summary': 'Case', 'type': 'URL'}) != index.indicator_key(
+            {'summary': 'case', 'type': 'URL'}
+        )
+        assert index.group_key(Adversary(' Bad  Actor ')) == ('Adversary', 'Bad Actor')
+
+        assert index.xid(('Address', '1.1.1.1'), 'xid-1') == 'xid-1'
+        assert index.xid(('Address', '1.1.1.1'), 'xid-2') == 'xid-1'
+        assert index.aliases == {'xid-2': 'xid-1'}
+
+        # once collected for submission the key is registered again
+        index.discard(('Address', '1.1.1.1'), 'xid-1')
+        assert index.xid(('Address', '1.1.1.1'), 'xid-3') == 'xid-3'
+
+    @staticmethod
+    def test_batch_dedup_index_merge():
+        """Test attributes, associations, labels, and tags are merged into a single entity."""
+        index = BatchDedupIndex()
+
+        address = Address('1.1.1.1', rating=3, xid='xid-1')
+        address.attribute('Description', 'first')
+        address.tag('One')
+        duplicate = Address('1.1.1.1', confidence=50, rating=5, xid='xid-2')
+        duplicate.attribute('Description', 'first')
+        duplicate.attribute('Description', 'second')
+        duplicate.association('group-xid-2')
+        duplicate.security_label('TLP:RED')
+        duplicate.tag('One')
+        duplicate.tag('Two')
+
+        data = index.merge(address, duplicate).data
+        assert data.get('xid') == 'xid-1'
+        assert data.get('rating') == 3
+        assert data.get('confidence') == 50
+        assert [a.get('value') for a in data.get('attribute')] == ['first', 'second']
+        assert [t.get('name') for t in data.get('tag')] == ['One', 'Two']
+        assert [label.get('name') for label in data.get('securityLabel')] == ['TLP:RED']
+
+        # merge a dict duplicate into a dict entity
+        data = index.merge(
+            {'summary': '1.1.1.2', 'type': 'Address', 'tag': [{'name': 'One'}]},
+            {'summary': '1.1.1.2', 'type': 'Address', 'tag': [{'name': 'One'}, {'name': 'Two'}]},
+        )
+        assert data.get('tag') == [{'name': 'One'}, {'name': 'Two'}]
+
+        # associations to a duplicate group xid are rewritten to the merged group xid
+        index.xid(('Adversary', 'Bad Actor'), 'group-xid-1')
+        index.xid(('Adversary', 'Bad Actor'), 'group-xid-2')
+        data = index.resolve(address.data)
+        assert data.get('associatedGroups') == [{'groupXid': 'group-xid-1'}]
+
+    @staticmethod
+    def test_batch_dedup_index_file_groups():
+        """Test Documents and Reports with the same name are not merged."""
+        index = BatchDedupIndex()
+        document_1 = Document('Report', 'report-1.pdf', xid='document-xid-1')
+        document_2 = Document('Report', 'report-2.pdf', xid='document-xid-2')
+        assert index.group_key(document_1) is None
+        assert index.xid(index.group_key(document_1), document_1.xid) == 'document-xid-1'
+        assert index.xid(index.group_key(document_2), document_2.xid) == 'document-xid-2'
+        assert index.aliases == {}
+
+    @staticmethod
+    def test_batch_dedup_index_merge_discarded(caplog):
+        """Test a warning is logged when a differing field value of a duplicate is discarded."""
+        index = BatchDedupIndex()
+        index.merge(
+            Address('1.1.1.1', rating=3, xid='xid-1'),
+            Address(' 1.1.1.1 ', confidence=50, rating=5, xid='xid-2'),
+        )
+        warnings = [r.getMessage() for r in caplog.records if r.levelname == 'WARNING']
+        assert warnings == [
+            'feature=batch, event=dedup-value-discarded, xid=xid-1, duplicate-xid=xid-2, '
+            'field=rating'
+        ]
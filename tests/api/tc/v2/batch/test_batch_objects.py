@@ -0,0 +1,170 @@
+"""Test the TcEx Batch Indicator, Group, Attribute, Label, and Tag Objects."""
+# standard library
+import tracemalloc
+
+# first-party
+from tcex.api.tc.v2.batch.attribute import Attribute
+from tcex.api.tc.v2.batch.group import Adversary, Document
+from tcex.api.tc.v2.batch.indicator import Address, File, Indicator
+from tcex.api.tc.v2.batch.tag import Tag
+
+
+class TestBatchObjects:
+    """Test the TcEx Batch Indicator, Group, Attribute, Label, and Tag Objects."""
+
+    @staticmethod
+    def test_batch_objects_group_data():
+        """Test the group data matches the batch JSON shape."""
+        group = Adversary('Bad Actor', xid='group-xid-1', first_seen='2021-01-01T00:00:00Z')
+        group.association('group-xid-2')
+        group.attribute('Description', 'first', unique='Type')
+        group.attribute('Description', 'second', unique='Type')
+        group.security_label('TLP:RED')
+        group.tag('One')
+        assert group.data == {
+            'associatedGroupXid': ['group-xid-2'],
+            'attribute': [{'type': 'Description', 'value': 'second'}],
+            'firstSeen': '2021-01-01T00:00:00Z',
+            'name': 'Bad Actor',
+            'securityLabel': [{'name': 'TLP:RED'}],
+            'tag': [{'name': 'One'}],
+            'type': 'Adversary',
+            'xid': 'group-xid-1',
+        }
+
+        document = Document(
+            'Report', 'report.pdf', file_content='content', malware=True, xid='group-xid-3'
+        )
+        assert document.data == {
+            'fileName': 'report.pdf',
+            'malware': True,
+            'name': 'Report',
+            'type': 'Document',
+            'xid': 'group-xid-3',
+        }
+
+    @staticmethod
+    def test_batch_objects_indicator_data():
+        """Test the indicator data matches the batch JSON shape."""
+        address = Address(
+            '1.1.1.1',
+            confidence='50',
+            date_added='2021-01-01T00:00:00Z',
+            private_flag=True,
+            rating='3',
+            xid='xid-1',
+        )
+        address.association('group-xid-1')
+        address.association('group-xid-2')
+        address.attribute('Description', 'first', displayed=True, source='pytest')
+        address.attribute('Description', 'first')
+        address.attribute('Source', 'second', unique=False)
+        address.security_label('TLP:RED', 'Red', 'ffc0cb')
+        address.security_label('TLP:RED')
+        address.tag('One')
+        address.tag('One')
+        address.tag('Two')
+        assert address.data == {
+            'associatedGroups': [{'groupXid': 'group-xid-1'}, {'groupXid': 'group-xid-2'}],
+            'attribute': [
+                {'displayed': True, 'source': 'pytest', 'type': 'Description', 'value': 'first'},
+                {'type': 'Source', 'value': 'second'},
+            ],
+            'confidence': 50,
+            'dateAdded': '2021-01-01T00:00:00Z',
+            'privateFlag': True,
+            'rating': 3.0,
+            'securityLabel': [{'color': 'ffc0cb', 'description': 'Red', 'name': 'TLP:RED'}],
+            'summary': '1.1.1.1',
+            'tag': [{'name': 'One'}, {'name': 'Two'}],
+            'type': 'Address',
+            'xid': 'xid-1',
+        }
+
+        # the data is built on access, changes to the returned dict are not stored
+        address.data['rating'] = 5.0
+        assert address.data.get('rating') == 3.0
+        address.rating = 5
+        assert address.data.get('rating') == 5.0
+
+    @staticmethod
+    def test_batch_objects_file_actions():
+        """Test file actions and occurrences of a File indicator."""
+        file = File(md5='a' * 32, sha1='b' * 40, size=1024, xid='xid-2')
+        action = file.action('traffic')
+        action.action('nested')
+        file.occurrence('file.exe', '/tmp', '2021-01-01T00:00:00Z')
+
+        # the data is the same on each access
+        assert file.data == file.data
+        data = file.data
+        assert data.get('summary') == f'''{'a' * 32} : {'b' * 40}'''
+        assert data.get('intValue1') == 1024
+        assert data.get('fileOccurrence') == [
+            {'date': '2021-01-01T00:00:00Z', 'fileName': 'file.exe', 'path': '/tmp'}
+        ]
+
+        children = data.get('fileAction').get('children')
+        assert len(children) == 1
+        assert children[0].get('parentIndicatorXid') == 'xid-2'
+        assert children[0].get('relationship') == 'traffic'
+        nested = children[0].get('children')
+        assert len(nested) == 1
+        assert nested[0].get('parentIndicatorXid') == action.xid
+        assert nested[0].get('relationship') == 'nested'
+
+        # occurrences are only supported on File indicators
+        assert Address('1.1.1.1').occurrence('file.exe') is None
+        assert 'fileOccurrence' not in Address('1.1.1.1').data
+
+    @staticmethod
+    def test_batch_objects_memory():
+        """Test the memory used per indicator, including the summary and xid strings.
+
+        The indicators previously used 785 bytes without and 2,226 bytes with two attributes,
+        two tags, an association, rating, and confidence (Python 3.11).
+        """
+
+        def measure(full: bool) -> float:
+            indicators = []
+            tracemalloc.start()
+            try:
+                snapshot = tracemalloc.take_snapshot()
+                for i in range(2_000):
+                    indicator = Address(f'10.0.{i // 256}.{i % 256}')
+                    if full is True:
+                        indicator.rating = 3
+                        indicator.confidence = 50
+                        indicator.attribute('Description', f'description {i}')
+                        indicator.attribute('Source', 'source')
+                        indicator.tag('One')
+                        indicator.tag('Two')
+                        indicator.association('group-xid')
+                    indicators.append(indicator)
+                stats = tracemalloc.take_snapshot().compare_to(snapshot, 'filename')
+            finally:
+                tracemalloc.stop()
+            return sum(s.size_diff for s in stats) / len(indicators)
+
+        assert measure(False) < 785 / 3
+        assert measure(True) < 2_226 / 3
+
+    @staticmethod
+    def test_batch_objects_valid():
+        """Test attributes and tags without a value are not added to the data."""
+        assert Attribute('Description', 'value').valid is True
+        assert Attribute('Description', '').valid is False
+        assert Attribute('Description', None).valid is False
+        assert Tag('One').valid is True
+        assert Tag('').valid is False
+
+        indicator = Indicator('Address', '2.2.2.2', xid='xid-3')
+        indicator.attribute('Description', '')
+        indicator.tag('')
+        assert indicator.data == {
+            'attribute': [],
+            'summary': '2.2.2.2',
+            'tag': [],
+            'type': 'Address',
+            'xid': 'xid-3',
+        }
@@ -0,0 +1,123 @@
+"""Test the TcEx Batch Poll Scheduler Module."""
+# standard library
+import threading
+from unittest.mock import MagicMock
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.v2.batch.batch_poll_scheduler import BatchPollScheduler
+from tcex.sessions.tc_session import TcSession
+
+
+class MockSession:
+    """Mock session returning "Completed" after a number of polls for each batch id."""
+
+    def __init__(self, polls_to_complete: dict):
+        """Initialize class properties."""
+        self.lock = threading.Lock()
+        self.polls = {}
+        self.polls_to_complete = polls_to_complete
+
+    def get(self, url: str, **kwargs):  # pylint: disable=unused-argument
+        """Return a mock batch status response."""
+        batch_id = int(url.split('/')[-1])
+        with self.lock:
+            self.polls[batch_id] = self.polls.get(batch_id, 0) + 1
+            status = 'Running'
+            if self.polls[batch_id] >= self.polls_to_complete.get(batch_id, 1):
+                status = 'Completed'
+
+        r = MagicMock()
+        r.ok = True
+        r.headers = {'content-type': 'application/json'}
+        r.json.return_value = {
+            'status': 'Success',
+            'data': {'batchStatus': {'id': batch_id, 'status': status}},
+        }
+        return r
+
+
+class TestBatchPollScheduler:
+    """Test the TcEx Batch Poll Scheduler Module."""
+
+    @staticmethod
+    def test_batch_poll_scheduler_concurrent():
+        """Test multiple outstanding jobs are polled by a single scheduler."""
+        session = MockSession({1: 1, 2: 2, 3: 1})
+        scheduler = BatchPollScheduler(session, min_interval=0.01)
+        # seed the learned throughput to keep the test fast
+        scheduler.throughput = 10_000
+
+        results = {}
+
+        def poll(batch_id: int):
+            results[batch_id] = scheduler.poll(batch_id, count=1_000, retry_seconds=0, back_off=0.1)
+
+        threads = [threading.Thread(target=poll, args=(i,)) for i in [1, 2, 3]]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+
+        for batch_id in [1, 2, 3]:
+            status = results[batch_id].get('data').get('batchStatus')
+            assert status.get('id') == batch_id
+            assert status.get('status') == 'Completed'
+        assert scheduler.poll_count == 4
+        assert scheduler.throughput is not None
+
+    @staticmethod
+    def test_batch_poll_scheduler_timeout():
+        """Test poll raises once the timeout is reached."""
+        session = MockSession({1: 1_000})
+        scheduler = BatchPollScheduler(session, min_interval=0.01)
+        scheduler.throughput = 10_000
+
+        with pytest.raises(RuntimeError) as exc_info:
+            scheduler.poll(1, count=10, timeout=1, retry_seconds=0, back_off=0.1)
+        assert exc_info.value.args[0] == 550
+
+    @staticmethod
+    def test_batch_poll_scheduler_thread_session(monkeypatch):
+        """Test the timer thread polls with its own copy of the session."""
+        session = TcSession(auth=None, base_url='https://localhost')
+        mock_session = MockSession({1: 1})
+        sessions = []
+
+        def get(self, url: str, **kwargs):
+            sessions.append((self, threading.current_thread().name))
+            return mock_session.get(url, **kwargs)
+
+        monkeypatch.setattr(TcSession, 'get', get)
+        scheduler = BatchPollScheduler(session, min_interval=0.01)
+        scheduler.throughput = 10_000
+        scheduler.poll(1, count=10, retry_seconds=0, back_off=0.1)
+
+        thread_session, thread_name = sessions[0]
+        assert thread_name == 'batch-poll-scheduler'
+        assert isinstance(thread_session, TcSession)
+        assert thread_session is not session
+        assert scheduler.session_tc is session
+
+    @staticmethod
+    def test_batch_poll_scheduler_thread_failure(monkeypatch):
+        """Test outstanding jobs fail and the timer thread restarts after an unexpected error."""
+        session = MockSession({1: 1, 2: 1})
+        scheduler = BatchPollScheduler(session, min_interval=0.01)
+        scheduler.throughput = 10_000
+
+        def poll_job(job: dict):  # pylint: disable=unused-argument
+            raise ValueError('poll job failed')
+
+        monkeypatch.setattr(scheduler, '_poll_job', poll_job)
+        with pytest.raises(RuntimeError) as exc_info:
+            scheduler.poll(1, count=10, timeout=5, retry_seconds=0, back_off=0.1)
+        assert exc_info.value.args[0] == 540
+        assert scheduler._thread is None
+
+        # the next poll starts a new timer thread
+        monkeypatch.undo()
+        status = scheduler.poll(2, count=10, timeout=5, retry_seconds=0, back_off=0.1)
+        assert status.get('data').get('batchStatus').get('status') == 'Completed'
@@ -0,0 +1,112 @@
+"""Test the TcEx Batch Serializer Module."""
+# standard library
+import gzip
+import io
+import json
+
+# third-party
+from requests import Request
+
+# first-party
+from tcex.api.tc.v2.batch.batch_serializer import BatchSerializer
+
+
+class TestBatchSerializer:
+    """Test the TcEx Batch Serializer Module."""
+
+    @staticmethod
+    def _serializer(count: int) -> BatchSerializer:
+        """Return a serializer with a single group and count indicators."""
+        # use a small max_size to ensure data is spooled to disk
+        serializer = BatchSerializer(max_size=100)
+        serializer['group'].append({'name': 'pytest', 'type': 'Adversary', 'xid': 'pytest-1'})
+        for i in range(count):
+            serializer['indicator'].append(
+                {'summary': f'1.1.1.{i}', 'type': 'Address', 'xid': f'pytest-address-{i}'}
+            )
+        return serializer
+
+    def test_batch_serializer_json(self):
+        """Test the streamed JSON document matches the appended data."""
+        serializer = self._serializer(50)
+        assert len(serializer.get('group')) == 1
+        assert len(serializer.get('indicator')) == 50
+
+        content = json.loads(b''.join(serializer.iter_bytes(chunk_size=7)))
+        assert content['group'][0]['xid'] == 'pytest-1'
+        assert [i['summary'] for i in content['indicator']] == [f'1.1.1.{i}' for i in range(50)]
+
+        # write to gzip the same way the batch debug writer does
+        fh = io.BytesIO()
+        with gzip.open(fh, mode='wb') as gz:
+            serializer.write(gz)
+        assert json.loads(gzip.decompress(fh.getvalue())) == content
+        serializer.close()
+
+    @staticmethod
+    def test_batch_serializer_empty():
+        """Test the streamed JSON document for an empty batch."""
+        serializer = BatchSerializer()
+        assert json.loads(serializer.json_body().read()) == {'group': [], 'indicator': []}
+
+    def test_batch_serializer_multipart(self):
+        """Test the streamed multipart body matches the body created by requests."""
+        serializer = self._serializer(10)
+        config = {'action': 'Create', 'version': 'V2'}
+        content = b''.join(serializer.iter_bytes()).decode()
+
+        body, content_type = serializer.multipart_body(config)
+        boundary = content_type.split('boundary=')[1].encode()
+
+        r = Request(
+            'POST',
+            'https://localhost',
+            files=(('config', json.dumps(config)), ('content', content)),
+        ).prepare()
+        r_boundary = r.headers['Content-Type'].split('boundary=')[1].encode()
+
+        assert body.read().replace(boundary, b'') == r.body.replace(r_boundary, b'')
+
+    @staticmethod
+    def test_batch_serializer_track_entities():
+        """Test serialized entities can be read back by xid when tracking is enabled."""
+        serializer = BatchSerializer(max_size=100, track_entities=True)
+        serializer['group'].append({'name': 'pytest', 'type': 'Adversary', 'xid': 'pytest-1'})
+        for i in range(10):
+            serializer['indicator'].append(
+                {'summary': f'1.1.1.{i}', 'type': 'Address', 'xid': f'pytest-address-{i}'}
+            )
+        assert 'pytest-address-5' in serializer.entity_xids
+        assert serializer.entity('pytest-address-5') == (
+            'indicator',
+            {'summary': '1.1.1.5', 'type': 'Address', 'xid': 'pytest-address-5'},
+        )
+        assert serializer.entity('pytest-1')[0] == 'group'
+        assert serializer.entity('pytest-unknown') == (None, None)
+
+        # appending after reading an entity does not corrupt the document
+        entity = {'summary': '1.1.1.10', 'type': 'Address', 'xid': 'x'}
+        assert serializer['indicator'].append(entity) == len(json.dumps(entity).encode())
+        content = json.loads(b''.join(serializer.iter_bytes()))
+        assert len(content['indicator']) == 11
+        serializer.close()
+
+    @staticmethod
+    def test_batch_serializer_association_xids():
+        """Test the groups associated with, but not part of, the chunk are returned."""
+        serializer = BatchSerializer()
+        serializer['group'].append(
+            {'associatedGroupXid': ['g2', 'g3'], 'name': 'pytest', 'type': 'Adversary', 'xid': 'g1'}
+        )
+        serializer['group'].append({'name': 'pytest', 'type': 'Adversary', 'xid': 'g2'})
+        serializer['indicator'].append(
+            {
+                'associatedGroups': [{'groupXid': 'g1'}, {'groupXid': 'g4'}],
+                'summary': '1.1.1.1',
+                'type': 'Address',
+                'xid': 'i1',
+            }
+        )
+        assert serializer.group_xids == {'g1', 'g2'}
+        assert serializer.association_xids == {'g3', 'g4'}
+        serializer.close()
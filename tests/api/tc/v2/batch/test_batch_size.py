@@ -0,0 +1,122 @@
+"""Test the TcEx Batch Size Module."""
+# standard library
+import json
+import pickle
+
+# first-party
+from tcex.api.tc.v2.batch.batch_size import BatchSize, json_size
+from tcex.api.tc.v2.batch.group import Adversary, Document
+from tcex.api.tc.v2.batch.indicator import Address, File
+
+
+class TestBatchSize:
+    """Test the TcEx Batch Size Module."""
+
+    @staticmethod
+    def assert_size(entity):
+        """Assert the estimated size is within 10% of the serialized size."""
+        size = len(json.dumps(entity.data))
+        assert abs(entity.data_size - size) <= size * 0.1, f'{entity.data_size} != {size}'
+
+    def test_batch_size_group(self):
+        """Test the estimated size of a group is tracked as data is added."""
+        adversary = Adversary('Bad Actor', xid='group-xid-1')
+        self.assert_size(adversary)
+
+        for i in range(5):
+            adversary.attribute('Description', f'description {i}', displayed=True, unique='Type')
+        adversary.security_label('TLP:RED', color='ffc0cb', description='Red label')
+        adversary.tag('One')
+        adversary.tag('Two')
+        self.assert_size(adversary)
+
+        document = Document('Report', 'report.pdf', file_content='content', malware=True)
+        document.attribute('Description', 'document')
+        self.assert_size(document)
+
+    def test_batch_size_indicator(self):
+        """Test the estimated size of an indicator is tracked as data is added."""
+        address = Address('1.1.1.1', confidence=50, rating=3, xid='xid-1')
+        self.assert_size(address)
+
+        address.association('group-xid-1')
+        address.association('group-xid-2')
+        for i in range(5):
+            address.attribute('Description', f'description {i}', source='source')
+        address.security_label('TLP:RED')
+        address.tag('One')
+        address.tag('Two')
+        self.assert_size(address)
+
+        file = File(md5='a' * 32, sha1='b' * 40, size=1024)
+        file.action('traffic')
+        file.occurrence('file.exe', '/tmp', '2021-01-01T00:00:00Z')
+        self.assert_size(file)
+
+    @staticmethod
+    def test_batch_size_json_size():
+        """Test the estimated size of dict data matches the serialized size."""
+        data = {
+            'attribute': [{'type': 'Description', 'value': 'description', 'displayed': True}],
+            'confidence': 50,
+            'rating': 3.5,
+            'summary': '1.1.1.1',
+            'tag': [{'name': 'One'}, {'name': 'Two'}],
+            'type': 'Address',
+            'xid': None,
+        }
+        size = len(json.dumps(data))
+        assert abs(json_size(data) - size) <= size * 0.1
+
+    def test_batch_size_counter_group(self):
+        """Test changes to a stored group are added to the batch size counter."""
+        adversary = Adversary('Bad Actor', xid='group-xid-1')
+        counter = BatchSize()
+        counter.value = adversary.data_size
+        adversary._batch_size = counter  # pylint: disable=protected-access
+
+        adversary.association('group-xid-2')
+        adversary.association('group-xid-3')
+        for i in range(5):
+            adversary.attribute('Description', f'description {i}', displayed=True, unique='Type')
+        adversary.security_label('TLP:RED', color='ffc0cb', description='Red label')
+        adversary.tag('One')
+        adversary.tag('Two')
+        adversary.add_key_value('first_seen', '2021-01-01T00:00:00Z')
+        assert counter.value == adversary.data_size
+        self.assert_size(adversary)
+
+    def test_batch_size_counter_indicator(self):
+        """Test changes to a stored indicator are added to the batch size counter."""
+        file = File(md5='a' * 32, xid='xid-1')
+        counter = BatchSize()
+        counter.value = file.data_size
+        file._batch_size = counter  # pylint: disable=protected-access
+
+        file.association('group-xid-1')
+        file.association('group-xid-2')
+        for i in range(5):
+            file.attribute('Description', f'description {i}', source='source')
+        file.security_label('TLP:RED')
+        file.tag('One')
+        file.tag('Two')
+        file.confidence = 50
+        file.rating = 3
+        file.sha1 = 'b' * 40
+        file.size = 1024
+        file.action('traffic')
+        file.action('archive')
+        file.occurrence('file.exe', '/tmp', '2021-01-01T00:00:00Z')
+        assert counter.value == file.data_size
+        self.assert_size(file)
+
+    @staticmethod
+    def test_batch_size_counter_pickle():
+        """Test an unpickled entity does not add changes to the original batch size counter."""
+        address = Address('1.1.1.1', xid='xid-1')
+        counter = BatchSize()
+        address._batch_size = counter  # pylint: disable=protected-access
+
+        address = pickle.loads(pickle.dumps(address))
+        address.tag('One')
+        assert counter.value == 0
@@ -0,0 +1,53 @@
+"""Test the TcEx Batch Spill Store Module."""
+# standard library
+import os
+
+# first-party
+from tcex.api.tc.v2.batch.batch_spill_store import BatchSpillStore
+
+
+class TestBatchSpillStore:
+    """Test the TcEx Batch Spill Store Module."""
+
+    @staticmethod
+    def test_batch_spill_store():
+        """Test set, get, update, and delete of records."""
+        store = BatchSpillStore('spill-store')
+        assert store.get('xid-1') is None
+        assert not os.path.isfile('spill-store'), 'log file should only be created on write'
+
+        store['xid-1'] = {'summary': '1.1.1.1', 'type': 'Address'}
+        store['xid-2'] = {'summary': '1.1.1.2', 'type': 'Address'}
+        store['xid-3'] = {'summary': '1.1.1.3', 'type': 'Address'}
+        store['xid-1'] = {'summary': '1.1.1.1', 'type': 'Address', 'rating': 5}
+        del store['xid-2']
+
+        assert 'xid-2' not in store
+        assert len(store) == 2
+        assert list(store.keys()) == ['xid-1', 'xid-3']
+        assert store['xid-1'].get('rating') == 5
+        store.close()
+
+    @staticmethod
+    def test_batch_spill_store_replay():
+        """Test the index is rebuilt from an existing log file, honoring tombstones."""
+        store = BatchSpillStore('spill-store-replay')
+        for i in range(10):
+            store[f'xid-{i}'] = {'summary': f'1.1.1.{i}', 'type': 'Address'}
+        del store['xid-5']
+        store['xid-0'] = {'summary': '1.1.1.0', 'type': 'Address', 'rating': 1}
+        store.close()
+
+        store = BatchSpillStore('spill-store-replay')
+        assert list(store.keys()) == [f'xid-{i}' for i in range(10) if i != 5]
+        assert store['xid-0'].get('rating') == 1
+        assert store['xid-9'].get('summary') == '1.1.1.9'
+
+        # drain in insertion order, the log file is truncated once empty
+        drained = []
+        for xid in list(store.keys()):
+            drained.append(store[xid].get('summary'))
+            del store[xid]
+        assert drained == [f'1.1.1.{i}' for i in range(10) if i != 5]
+        assert os.path.getsize('spill-store-replay') == 0
+        store.close()
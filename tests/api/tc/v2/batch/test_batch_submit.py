@@ -0,0 +1,33 @@
+"""Test the TcEx Batch Submit Module."""
+# standard library
+import json
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.v2.batch.batch_submit import BatchSubmit
+
+
+class TestBatchSubmit:
+    """Test the TcEx Batch Submit Module."""
+
+    @staticmethod
+    def test_batch_submit_json_array_stream():
+        """Test the items of a JSON array are decoded from chunks split at any position."""
+        errors = [
+            {'errorReason': f'pytest-{i} 0x1004 Internal Error ✓', 'errorSource': ''}
+            for i in range(100)
+        ]
+        content = f' \n{json.dumps(errors, indent=2)}\n'.encode()
+        for chunk_size in [1, 7, 1_000, len(content)]:
+            chunks = (content[i : i + chunk_size] for i in range(0, len(content), chunk_size))
+            assert list(BatchSubmit._json_array_stream(chunks)) == errors
+
+        assert not list(BatchSubmit._json_array_stream([b'[', b' ]']))
+
+        with pytest.raises(ValueError):
+            list(BatchSubmit._json_array_stream([b'{"errorReason": "pytest"}']))
+
+        with pytest.raises(ValueError):
+            list(BatchSubmit._json_array_stream([b'[{"errorReason": "pytest"}, {"error']))
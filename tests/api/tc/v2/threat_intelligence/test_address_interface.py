@@ -118,6 +118,34 @@ class TestAddressIndicators(TestThreatIntelligence):
 
         assert found, 'Expected Indicator not returned on dateAdded filter.'
 
+    def tests_ti_indicators_parallel_pages(self):
+        """Testing TI module"""
+        rand_ips = [self.ti_helper.rand_ip() for _ in range(5)]
+        for rand_ip in rand_ips:
+            indicator = self.ti.indicator('address', self.owner, ip=rand_ip)
+            indicator.create()
+        today = datetime.strftime(datetime.utcnow(), '%Y-%m-%d')
+        filters = self.tcex.v2.ti.filters()
+        filters.add_filter('dateAdded', '>', today)
+
+        # sequential pages
+        indicators = self.tcex.v2.ti.indicator()
+        indicators.tc_requests.result_limit = 2
+        expected = [i.get('summary') for i in indicators.many(filters=filters)]
+
+        # ordered parallel pages return the same results in the same order
+        indicators = self.tcex.v2.ti.indicator()
+        indicators.tc_requests.result_limit = 2
+        indicators.tc_requests.parallel_pages = 4
+        summaries = [i.get('summary') for i in indicators.many(filters=filters)]
+        assert summaries == expected
+
+        # unordered parallel pages return the same results
+        indicators.tc_requests.parallel_ordered = False
+        summaries = [i.get('summary') for i in indicators.many(filters=filters)]
+        assert sorted(summaries) == sorted(expected)
+        assert set(rand_ips).issubset(summaries), 'Expected Indicators not returned.'
+
     def tests_ti_indicators_active_and_inactive_filter(self):
         """Testing TI module"""
         rand_ip_1 = self.ti_helper.rand_ip()
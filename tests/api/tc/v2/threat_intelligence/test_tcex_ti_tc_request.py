@@ -0,0 +1,29 @@
+"""Test the TcEx Threat Intel TC Request Module."""
+# standard library
+from unittest.mock import MagicMock
+
+# first-party
+from tcex.api.tc.v2.threat_intelligence.tcex_ti_tc_request import TiTcRequest
+
+
+class TestTiTcRequest:
+    """Test the TcEx Threat Intel TC Request Module."""
+
+    @staticmethod
+    def test_ti_tc_request_parallel_pages_added_results(monkeypatch):
+        """Test sequential paging continues after the last parallel page when results are added."""
+        tc_requests = TiTcRequest(MagicMock())
+        tc_requests.result_limit = 2
+        tc_requests.parallel_pages = 2
+
+        # the first page reports 5 results, 2 more results are added while iterating
+        results = [{'summary': f'1.1.1.{i}'} for i in range(7)]
+
+        def iterate_page(
+            url, params, api_entity, result_start, session=None
+        ):  # pylint: disable=unused-argument
+            return results[result_start : result_start + tc_requests.result_limit], 5
+
+        monkeypatch.setattr(tc_requests, '_iterate_page', iterate_page)
+        data = list(tc_requests._iterate('/v2/indicators', {}, 'indicator'))
+        assert data == results
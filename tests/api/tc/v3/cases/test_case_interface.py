@@ -48,6 +48,52 @@ class TestCases(TestV3):
         """Test properties."""
         super().obj_properties_extra()
 
+    def test_case_bulk(self, request: 'pytest.FixtureRequest'):
+        """Test bulk create, update, and delete of cases."""
+        case_count = 10
+        cases = [
+            self.v3.case(
+                name=f'{request.node.name}-{i}',
+                severity='Low',
+                status='Open',
+                tags={'data': [{'name': request.node.name}]},
+            )
+            for i in range(case_count)
+        ]
+        # an invalid case should not stop the remaining cases from being created
+        cases.append(self.v3.case(name=request.node.name, severity='Invalid', status='Open'))
+
+        results = self.v3.bulk(max_workers=4).create(cases)
+        assert len(results) == case_count + 1
+        assert all(r.get('success') for r in results[:case_count])
+        assert results[-1].get('success') is False
+        assert all(c.model.id for c in cases[:case_count])
+
+        # [Update Testing] the model is refreshed from the response
+        for case in cases[:case_count]:
+            case.model.description = 'bulk updated'
+        results = self.v3.bulk(max_workers=4).update(cases[:case_count])
+        assert all(r.get('object').model.description == 'bulk updated' for r in results)
+
+        # [Delete Testing]
+        results = self.v3.bulk(max_workers=4).delete(cases[:case_count])
+        assert all(r.get('success') for r in results)
+
+    def test_case_model_properties(self):
+        """Test the cached model properties match the model schema."""
+        model = self.v3.case().model
+        schema = model.schema(by_alias=False)
+        schema_properties = schema.get('properties') or schema.get('definitions').get(
+            'CaseModel'
+        ).get('properties')
+        for name, property_ in model._properties().items():
+            assert property_.get('title') == schema_properties[name].get('title')
+            assert property_.get('read_only') == schema_properties[name].get('read_only')
+            assert property_.get('methods') == schema_properties[name].get('methods', [])
+
+        # properties are built once per model class
+        assert model._properties() is type(model)._properties()
+
     @pytest.mark.xfail(reason='Verify TC Version running against.')
     def test_indicator_associations(self):
         """Test Case -> Indicator Associations"""
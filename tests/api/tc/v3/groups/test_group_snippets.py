@@ -1,6 +1,7 @@
 """Test the TcEx API Snippets."""
 # standard library
 import base64
+import io
 import time
 
 # first-party
@@ -394,3 +395,25 @@ class TestGroupSnippets(TestV3):
         if not group.request.ok:
             print(f'The download failed: {group.request.reason}')
         # End Snippet
+
+    def test_document_download_stream(self, tmp_path):
+        """Test snippet"""
+        group = self.v3_helper.create_group(
+            file_name='example.pdf',
+            name='MyDocument',
+            type_='Document',
+        )
+        file_content = base64.b64decode(self.example_pdf)
+        with io.BytesIO(file_content) as fh:
+            _ = group.upload(fh)  # file objects are streamed to the API
+
+        # provide it enough time to upload the file.
+        time.sleep(1)
+
+        # Begin Snippet
+        group = self.tcex.v3.group(id=group.model.id)
+        # content is written to the file in chunks
+        _ = group.download(output=str(tmp_path / 'example.pdf'))
+        # End Snippet
+        assert (tmp_path / 'example.pdf').read_bytes() == file_content
+        assert b''.join(group.download_stream(chunk_size=1_024)) == file_content
@@ -248,6 +248,45 @@ class TestIndicators(TestV3):
         assert indicators_counts == indicator_count
         assert not indicator_ids, 'Not all indicators were returned.'
 
+    def test_indicator_get_many_prefetch(self, request: 'pytest.FixtureRequest'):
+        """Test Indicators Get Many with prefetched pages"""
+        indicator_count = 5
+        indicator_ids = []
+        for _ in range(0, indicator_count):
+            indicator = self.v3_helper.create_indicator(type='Address')
+            indicator_ids.append(indicator.model.id)
+
+        # [Retrieve Testing] fetch the following pages while each page is consumed
+        indicators = self.v3.indicators()
+        indicators.filter.tag(TqlOperator.EQ, request.node.name)
+        indicators.page_size = 2
+        indicators.prefetch = 2
+        for indicator in indicators:
+            assert indicator.model.id in indicator_ids
+            indicator_ids.remove(indicator.model.id)
+
+        assert not indicator_ids, 'Not all indicators were returned.'
+        # the response of the last consumed page is stored by the consuming thread
+        assert 'next' not in indicators.request.json()
+
+    def test_indicator_get_many_lazy(self, request: 'pytest.FixtureRequest'):
+        """Test Indicators Get Many with lazy model validation"""
+        indicator = self.v3_helper.create_indicator(type='Address')
+
+        indicators = self.v3.indicators()
+        indicators.filter.tag(TqlOperator.EQ, request.node.name)
+        indicators.lazy = True
+        lazy_indicators = list(indicators)
+        assert len(lazy_indicators) == 1
+
+        lazy_indicator = lazy_indicators[0]
+        assert lazy_indicator.model.id == indicator.model.id
+        assert lazy_indicator.model.summary == indicator.model.summary
+        assert lazy_indicator.model.updated is False
+
+        lazy_indicator.model.rating = 5
+        assert lazy_indicator.model.updated is True
+
     def test_indicator_in_operator(self, request: 'pytest.FixtureRequest'):
         """Test Indicators Get Many"""
         # [Pre-Requisite] - create case
@@ -11,6 +11,7 @@ from deepdiff import DeepDiff
 
 # first-party
 from tcex.app_config.install_json import InstallJson
+from tcex.app_config.models import InstallJsonModel
 
 
 class TestInstallJson:
@@ -361,6 +362,60 @@ class TestInstallJson:
                 # cleanup temp file
                 ij.fqfn.unlink()
 
+    def test_model_cache(self):
+        """Test the model is cached until the file changes."""
+        ij = self.ij_bad(app_type='tcpb')
+        try:
+            model = ij.model
+            assert ij.model is model
+            # other instances for the same file share the model
+            assert InstallJson(filename=ij.fqfn.name, path=ij.fqfn.parent).model is model
+            assert ij.model.get_param('boolean_optional').name == 'boolean_optional'
+
+            # the model is reloaded after the updated file is written
+            ij.update.multiple(migrate=True)
+            assert ij.model is not model
+            assert ij.model.program_main == 'run'
+
+            # the model is reloaded when the file is changed on disk
+            model = ij.model
+            contents = json.loads(ij.fqfn.read_text())
+            contents['programVersion'] = '2.0.0'
+            ij.fqfn.write_text(json.dumps(contents))
+            assert str(ij.model.program_version) == '2.0.0'
+        finally:
+            # cleanup temp file
+            ij.fqfn.unlink()
+
+    def test_model_cache_parsed_once(self, monkeypatch, tmp_path: Path):
+        """Test the model is parsed once for App startup and not changed by updates."""
+        fqfn = tmp_path / 'install.json'
+        shutil.copy(self.ij(app_type='tcpb').fqfn, fqfn)
+
+        count = {'models': 0}
+        model_init = InstallJsonModel.__init__
+
+        def counted_init(model: InstallJsonModel, **kwargs):
+            count['models'] += 1
+            model_init(model, **kwargs)
+
+        monkeypatch.setattr(InstallJsonModel, '__init__', counted_init)
+
+        # tcex creates several InstallJson instances that each access the model repeatedly
+        for _ in range(5):
+            ij = InstallJson(filename=fqfn.name, path=fqfn.parent)
+            for _ in range(20):
+                assert ij.model.get_param('username').name == 'username'
+        assert count['models'] == 1
+
+        # changes made by an update are not visible in the shared model until written
+        update = ij.update
+        update.model.program_main = 'pytest'
+        assert ij.model.program_main == 'run'
+        ij.write(update.model)
+        assert ij.model.program_main == 'pytest'
+        assert count['models'] == 2
+
     def test_validate(self):
         """Test method"""
         ij = self.ij_bad(app_type='tcpb')
@@ -7,6 +7,7 @@ from random import randint
 from typing import TYPE_CHECKING
 
 # third-party
+import pytest
 from pydantic import BaseModel, Extra
 
 # first-party
@@ -129,6 +130,27 @@ class TestInputsConfig:
         # cleanup config
         config_file.unlink()
 
+    @staticmethod
+    def test_contents_resolved_prefetch_clear(playbook_app: 'MockApp', monkeypatch):
+        """Test the prefetched playbook variables are cleared when resolving an input fails."""
+        variable = '#App:1234:my_input!String'
+        tcex = playbook_app(config_data={'my_input': variable}).tcex
+        read = registry.playbook.read
+
+        def prefetch(values):  # pylint: disable=unused-argument
+            read._prefetched = {variable: b'one'}
+
+        def read_variable(key, *args, **kwargs):  # pylint: disable=unused-argument
+            raise RuntimeError(f'pytest {key}')
+
+        monkeypatch.setattr(read, 'prefetch', prefetch)
+        monkeypatch.setattr(read, 'variable', read_variable)
+        tcex.inputs.__dict__.pop('contents_resolved', None)
+
+        with pytest.raises(RuntimeError):
+            _ = tcex.inputs.contents_resolved
+        assert read._prefetched == {}
+
     @staticmethod
     def test_input_token(tcex):
         """Test default values (e.g., token) are in args.
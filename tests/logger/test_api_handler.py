@@ -1,10 +1,18 @@
 """Test Module"""
 # standard library
+import gzip
+import json
+import logging
+import threading
 from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
 
 # third-party
 import pytest
 
+# first-party
+from tcex.logger.api_handler import ApiHandler, ApiHandlerFormatter
+
 if TYPE_CHECKING:
     # first-party
     from tests.mock_app import MockApp
@@ -25,3 +33,64 @@ class TestApiHandler:
             tcex.log.info('INFO LOGGING')
             tcex.log.warning('WARNING LOGGING')
             tcex.log.error('ERROR LOGGING')
+
+    @staticmethod
+    def test_api_handler_background_flush():
+        """Test events from all threads are sent by the flusher thread in compressed batches."""
+        posted = []
+        sent = threading.Event()
+
+        def post(url, headers=None, data=None, **kwargs):  # pylint: disable=unused-argument
+            assert headers.get('Content-Encoding') == 'gzip'
+            posted.extend(json.loads(gzip.decompress(data)))
+            if len(posted) >= 10:
+                sent.set()
+            return MagicMock(status_code=201)
+
+        session = MagicMock()
+        session.post.side_effect = post
+        handler = ApiHandler(session, flush_limit=10, flush_interval=60)
+        handler.setFormatter(ApiHandlerFormatter())
+        logger = logging.getLogger('tcex-test-api-handler')
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+
+        for i in range(5):
+            logger.info(f'main {i}')
+        thread = threading.Thread(target=lambda: [logger.info(f'child {i}') for i in range(5)])
+        thread.start()
+        thread.join()
+
+        # the flush limit was hit, the events are sent without waiting for the interval
+        assert sent.wait(timeout=10)
+        assert sorted(e.get('message') for e in posted) == sorted(
+            [f'main {i}' for i in range(5)] + [f'child {i}' for i in range(5)]
+        )
+
+        # remaining events are sent when the handler is closed
+        logger.info('final')
+        logger.removeHandler(handler)
+        handler.close()
+        assert posted[-1].get('message') == 'final'
+
+    @staticmethod
+    def test_api_handler_queue_full():
+        """Test events are dropped when the queue is full and the drop count is reported."""
+        session = MagicMock()
+        handler = ApiHandler(session, flush_limit=100, flush_interval=60, queue_size=5)
+        handler.setFormatter(ApiHandlerFormatter())
+        # prevent the flusher thread from being started
+        handler._thread = threading.current_thread()
+
+        for i in range(8):
+            handler.handle(
+                logging.makeLogRecord({'msg': f'event {i}', 'levelname': 'INFO', 'levelno': 20})
+            )
+        assert handler.dropped == 3
+
+        handler._thread = None
+        handler.compress = False
+        handler.flush()
+        entries = session.post.call_args.kwargs.get('json')
+        assert [e.get('message') for e in entries[:5]] == [f'event {i}' for i in range(5)]
+        assert entries[-1].get('message').startswith('3 log events dropped')
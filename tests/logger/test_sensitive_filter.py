@@ -0,0 +1,100 @@
+"""Test Module"""
+# standard library
+import logging
+
+# first-party
+from tcex.logger.sensitive_filter import SensitiveFilter
+
+
+class TestSensitiveFilter:
+    """Test Module"""
+
+    @staticmethod
+    def test_sensitive_filter_replace():
+        """Test values are masked before and after the pattern is rebuilt."""
+        sensitive_filter = SensitiveFilter(name='test_sensitive_filter')
+        sensitive_filter.rebuild_threshold = 4
+
+        sensitive_filter.add('pass')
+        sensitive_filter.add('password')
+        # pending values are masked before the pattern is built
+        assert sensitive_filter.replace('pass password') == '*** ***'
+
+        secrets = [f'secret-{i:03}' for i in range(100)]
+        for secret in secrets:
+            sensitive_filter.add(secret)
+        assert sensitive_filter.replace('pass password') == '*** ***'
+        assert sensitive_filter.replace(f'a {secrets[0]} b {secrets[-1]}.') == 'a *** b ***.'
+        assert sensitive_filter.replace('secret-0990') == '***0'
+        assert sensitive_filter.replace('no secrets') == 'no secrets'
+
+        # removed values are no longer masked once the pattern is rebuilt
+        for secret in secrets:
+            sensitive_filter.remove(secret)
+        assert sensitive_filter.replace(secrets[0]) == secrets[0]
+        assert sensitive_filter.replace('pass password') == '*** ***'
+
+    @staticmethod
+    def test_sensitive_filter_replace_overlapping():
+        """Test pending values that overlap values in the pattern are fully masked."""
+        sensitive_filter = SensitiveFilter(name='test_sensitive_filter')
+        sensitive_filter.rebuild_threshold = 0
+
+        sensitive_filter.add('token')
+        assert sensitive_filter._masks[0] is not None  # pylint: disable=protected-access
+
+        sensitive_filter.rebuild_threshold = 32
+        # a pending value containing a pattern value
+        sensitive_filter.add('my-token-value')
+        assert sensitive_filter._masks[1] == ('my-token-value',)  # pylint: disable=protected-access
+        assert sensitive_filter.replace('key=my-token-value') == 'key=***'
+        assert sensitive_filter.replace('key=token') == 'key=***'
+
+        # a pending value contained in a pattern value triggers a rebuild
+        sensitive_filter.add('oke')
+        assert sensitive_filter._masks[1] == ()  # pylint: disable=protected-access
+        assert sensitive_filter.replace('key=my-token-value') == 'key=***'
+        assert sensitive_filter.replace('key=token oke') == 'key=*** ***'
+
+    @staticmethod
+    def test_sensitive_filter_remove_registrations():
+        """Test a value added more than once is masked until every registration is removed."""
+        sensitive_filter = SensitiveFilter(name='test_sensitive_filter')
+        sensitive_filter.rebuild_threshold = 0
+
+        sensitive_filter.add('token')
+        sensitive_filter.add('token')
+        sensitive_filter.remove('token')
+        assert sensitive_filter.replace('key=token') == 'key=***'
+
+        sensitive_filter.remove('token')
+        assert sensitive_filter.replace('key=token') == 'key=token'
+
+        # removing a value that is not registered does not affect later registrations
+        sensitive_filter.remove('token')
+        sensitive_filter.add('token')
+        assert sensitive_filter.replace('key=token') == 'key=***'
+
+    @staticmethod
+    def test_sensitive_filter_record():
+        """Test record message is masked and records below the handler level are skipped."""
+        log = logging.getLogger('test_sensitive_filter')
+        log.propagate = False
+        handler = logging.NullHandler()
+        handler.setLevel(logging.INFO)
+        log.addHandler(handler)
+
+        sensitive_filter = SensitiveFilter(name='test_sensitive_filter')
+        sensitive_filter.add('secret')
+
+        try:
+            record = log.makeRecord(log.name, logging.INFO, '', 0, 'key=%s', ('secret',), None)
+            assert sensitive_filter.filter(record) is True
+            assert record.msg == 'key=***'
+
+            # the message of a record that will not be emitted is not formatted
+            record = log.makeRecord(log.name, logging.DEBUG, '', 0, 'key=%s', ('secret',), None)
+            assert sensitive_filter.filter(record) is True
+            assert record.msg == 'key=%s'
+        finally:
+            log.removeHandler(handler)
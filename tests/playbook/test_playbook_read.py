@@ -1,10 +1,17 @@
 """Test the TcEx Batch Module."""
 # standard library
+import json
 from typing import TYPE_CHECKING, Union
+from unittest.mock import MagicMock
 
 # third-party
+import fakeredis
 import pytest
 
+# first-party
+from tcex.key_value_store import KeyValueRedis
+from tcex.playbook.playbook_read import PlaybookRead
+
 if TYPE_CHECKING:
     # first-party
     from tcex import TcEx
@@ -86,3 +93,45 @@ class TestUtils:
     def test_playbook_read_decode_binary(self, data: bytes, expected: str, playbook: 'Playbook'):
         """Test playbook variables."""
         assert playbook.read._decode_binary(data) == expected
+
+    @staticmethod
+    def test_playbook_read_prefetch():
+        """Test variables and embedded variables are read with one HMGET per nesting level."""
+        context = 'prefetch-context'
+        redis_client = MagicMock(wraps=fakeredis.FakeRedis())
+        redis_client.hset(context, '#App:0001:s1!String', json.dumps('one'))
+        redis_client.hset(context, '#App:0001:s2!String', json.dumps('two #App:0001:s3!String'))
+        redis_client.hset(context, '#App:0001:s3!String', json.dumps('three'))
+        redis_client.hset(
+            context,
+            '#App:0001:kva1!KeyValueArray',
+            json.dumps(
+                [{'key': 'k1', 'value': '#App:0001:s1!String'}, {'key': 'k2', 'value': 'v'}]
+            ),
+        )
+        read = PlaybookRead(context, KeyValueRedis(redis_client))
+
+        read.prefetch(
+            [
+                '#App:0001:s2!String',
+                'embedded #App:0001:s1!String',
+                ['#App:0001:kva1!KeyValueArray', 'literal'],
+                '#App:0001:missing!String',
+            ]
+        )
+        # the embedded variable in s2 is read by a second HMGET
+        assert redis_client.hmget.call_count == 2
+
+        assert read.variable('#App:0001:s2!String') == 'two three'
+        assert read.variable('embedded #App:0001:s1!String') == 'embedded one'
+        assert read.variable('#App:0001:kva1!KeyValueArray') == [
+            {'key': 'k1', 'value': 'one'},
+            {'key': 'k2', 'value': 'v'},
+        ]
+        assert read.variable('#App:0001:missing!String') is None
+        redis_client.hget.assert_not_called()
+
+        # once cleared variables are read from the key value store
+        read.prefetch_clear()
+        assert read.variable('#App:0001:s1!String') == 'one'
+        assert redis_client.hget.call_count == 1
@@ -0,0 +1,207 @@
+"""Test the TcEx Service Command Executor Module."""
+# standard library
+import json
+import logging
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# third-party
+import pytest
+
+# first-party
+from tcex.services.api_service import ApiService
+from tcex.services.command_executor import CommandExecutor
+from tcex.services.common_service import CommonService
+from tcex.services.common_service_trigger import CommonServiceTrigger
+from tcex.services.webhook_trigger_service import WebhookTriggerService
+
+
+class MockService(CommonService):
+    """Service with a command executor and no message broker."""
+
+    def __init__(self, executor: CommandExecutor):  # pylint: disable=super-init-not-called
+        """Initialize the Class properties."""
+        self._metrics = {'Errors': 0}
+        self.command_executor = executor
+        self.log = logging.getLogger('tcex')
+        self.processed = []
+        self.processed_lock = threading.Lock()
+        self.max_threads = 0
+        self.rejected = []
+
+    @property
+    def command_map(self) -> dict:
+        """Return the command map for the current Service type."""
+        command_map = super().command_map
+        command_map.update(
+            {'heartbeat': self.process_command, 'webhookevent': self.process_command}
+        )
+        return command_map
+
+    def process_command(self, message: dict):
+        """Process a command."""
+        time.sleep(0.001)
+        with self.processed_lock:
+            self.processed.append((message['command'], self.session_id))
+            self.max_threads = max(self.max_threads, threading.active_count())
+
+    def process_rejected_command(self, command: str, message: dict, session_id: str):
+        """Process a command rejected because the command queue is full."""
+        super().process_rejected_command(command, message, session_id)
+        self.rejected.append(command)
+
+
+class TestCommandExecutor:
+    """Test the TcEx Service Command Executor Module."""
+
+    @staticmethod
+    def test_command_limits():
+        """Test the per command concurrency limits."""
+        executor = CommandExecutor(max_workers=4, max_queue_size=100, command_limits={'slow': 1})
+        lock = threading.Lock()
+        running = {'slow': 0, 'fast': 0}
+        max_running = {'slow': 0, 'fast': 0}
+
+        def target(command):
+            with lock:
+                running[command] += 1
+                max_running[command] = max(max_running[command], running[command])
+            time.sleep(0.01)
+            with lock:
+                running[command] -= 1
+
+        for i in range(20):
+            command = 'slow' if i % 2 == 0 else 'fast'
+            assert executor.submit(command, f'command-{i}', target, args=(command,))
+        executor.shutdown(wait=True)
+
+        assert max_running['slow'] == 1
+        assert max_running['fast'] > 1
+        assert executor.metrics['Commands Completed'] == 20
+        assert executor.metrics['Command Workers'] <= 4
+
+    @staticmethod
+    def test_overflow_policy():
+        """Test commands are rejected or block the caller when the queue is full."""
+        release = threading.Event()
+        executor = CommandExecutor(max_workers=1, max_queue_size=2, overflow='reject')
+        for i in range(2):
+            assert executor.submit('command', f'command-{i}', release.wait)
+        assert executor.submit('command', 'command-2', release.wait) is False
+        assert executor.metrics['Commands Rejected'] == 1
+        assert executor.metrics['Command Queue Depth Max'] == 2
+        release.set()
+        executor.shutdown(wait=True)
+
+        release.clear()
+        executor = CommandExecutor(max_workers=1, max_queue_size=1)
+        assert executor.submit('command', 'command-0', release.wait)
+        # the worker has taken the first command, so the next fills the queue
+        while executor.metrics['Commands Active'] == 0:
+            time.sleep(0.01)
+        assert executor.submit('command', 'command-1', release.wait)
+
+        blocked = threading.Thread(target=executor.submit, args=('command', 'command-2', len))
+        blocked.start()
+        blocked.join(timeout=0.2)
+        assert blocked.is_alive()
+        release.set()
+        blocked.join(timeout=5)
+        assert not blocked.is_alive()
+        executor.shutdown(wait=True)
+        assert executor.metrics['Commands Completed'] == 3
+
+        with pytest.raises(ValueError):
+            CommandExecutor(max_workers=1, max_queue_size=1, overflow='invalid')
+
+    @staticmethod
+    def test_on_message_handler_load():
+        """Test a burst of broker messages is processed by a bounded number of threads."""
+        count = 400
+        executor = CommandExecutor(max_workers=8, max_queue_size=count)
+        service = MockService(executor)
+
+        threads_before = threading.active_count()
+        for i in range(count):
+            command = 'Heartbeat' if i % 100 == 0 else 'WebhookEvent'
+            message = SimpleNamespace(payload=json.dumps({'command': command}).encode())
+            service.on_message_handler(None, None, message)
+        executor.shutdown(wait=True)
+        # control commands are processed in their own thread
+        time.sleep(0.1)
+
+        assert len(service.processed) == count
+        # each command has its own session id
+        assert len({session_id for _, session_id in service.processed}) == count
+        assert service.max_threads <= threads_before + 8 + 4
+
+        metrics = executor.metrics
+        assert metrics['Commands Completed'] == count - 4
+        assert metrics['Command Queue Depth'] == 0
+        assert metrics['Command Queue Depth Max'] <= count
+        assert metrics['Command Queue Wait Avg (ms)'] > 0
+
+    @staticmethod
+    def test_on_message_handler_queue_full():
+        """Test broker messages are rejected instead of blocking the MQTT thread."""
+        release = threading.Event()
+        executor = CommandExecutor(max_workers=1, max_queue_size=1, overflow='block')
+        service = MockService(executor)
+        assert executor.submit('command', 'command-0', release.wait)
+        while executor.metrics['Commands Active'] == 0:
+            time.sleep(0.01)
+        assert executor.submit('command', 'command-1', release.wait)
+
+        # the queue is full, the message is rejected even though the policy is block
+        message = SimpleNamespace(payload=json.dumps({'command': 'WebhookEvent'}).encode())
+        handler = threading.Thread(target=service.on_message_handler, args=(None, None, message))
+        handler.start()
+        handler.join(timeout=5)
+        assert not handler.is_alive()
+        assert executor.metrics['Commands Rejected'] == 1
+        assert service.rejected == ['webhookevent']
+        assert service._metrics['Errors'] == 1
+
+        release.set()
+        executor.shutdown(wait=True)
+        assert executor.metrics['Commands Completed'] == 2
+        assert not service.processed
+
+        with pytest.raises(ValueError):
+            executor.submit('command', 'command-2', len, overflow='invalid')
+
+    @staticmethod
+    def test_rejected_command_response():
+        """Test rejected request/response commands are answered with a 503 response."""
+        # config commands are never rejected by the command executor
+        assert 'createconfig' in CommonServiceTrigger.control_commands
+        assert 'deleteconfig' in CommonServiceTrigger.control_commands
+        assert 'createconfig' not in CommonService.control_commands
+
+        message = {'command': 'RunService', 'requestKey': 'request-key', 'triggerId': 1}
+        for service_class, command, response_command in [
+            (ApiService, 'runservice', 'Acknowledged'),
+            (WebhookTriggerService, 'webhookevent', 'WebhookEventResponse'),
+            (WebhookTriggerService, 'webhookmarshallevent', 'WebhookEventResponse'),
+        ]:
+            service = service_class.__new__(service_class)
+            service._metrics = {'Errors': 0}
+            service.args = SimpleNamespace(tc_svc_client_topic='client-topic')
+            service.log = logging.getLogger('tcex')
+            service.message_broker = MagicMock()
+            service.process_rejected_command(command, message, 'session-id')
+
+            response, topic = service.message_broker.publish.call_args[0]
+            response = json.loads(response)
+            assert topic == 'client-topic'
+            assert response['command'] == response_command
+            assert response['requestKey'] == 'request-key'
+            assert int(response['statusCode']) == 503
+            assert service._metrics['Errors'] == 1
+
+            # other commands have no response
+            service.message_broker.reset_mock()
+            service.process_rejected_command('heartbeat', message, 'session-id')
+            assert not service.message_broker.publish.called
@@ -0,0 +1,75 @@
+"""Test the shared connection pools"""
+# standard library
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# first-party
+from tcex.key_value_store import RedisClient
+from tcex.sessions.external_session import ExternalSession
+from tcex.sessions.shared_pool_adapter import SharedPoolAdapter
+from tcex.sessions.tc_session import TcSession
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Return an empty 200 response for all GET requests."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Handle GET request."""
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Do not log requests."""
+
+
+class TestConnectionPools:
+    """Test the shared connection pools"""
+
+    @staticmethod
+    def test_shared_pool_adapter():
+        """Test sessions created in different threads reuse the same connection pool."""
+        server = ThreadingHTTPServer(('127.0.0.1', 0), MockHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f'http://127.0.0.1:{server.server_port}'
+
+        sessions = []
+
+        def request():
+            session = TcSession(auth=None, base_url=url)
+            # the mock server does not support TLS
+            session.mount('http://', session.get_adapter('https://'))
+            assert session.get('/').status_code == 200
+            sessions.append(session)
+
+        try:
+            for _ in range(3):
+                t = threading.Thread(target=request)
+                t.start()
+                t.join()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        pool_managers = {id(s.get_adapter('https://').poolmanager) for s in sessions}
+        assert len(pool_managers) == 1
+        assert isinstance(ExternalSession().get_adapter('https://'), SharedPoolAdapter)
+
+        # closing a session does not close the pool shared by other sessions
+        sessions[0].close()
+        metrics = SharedPoolAdapter.pool_metrics()
+        assert metrics.get('HTTP Pool Max Size') == SharedPoolAdapter.pool_maxsize
+        assert metrics.get('HTTP Connections Created') >= 1
+        assert metrics.get('HTTP Connections Idle') >= 1
+
+    @staticmethod
+    def test_redis_pool_metrics():
+        """Test the redis pool metrics for a blocking pool with a max number of connections."""
+        pool = RedisClient(blocking_pool=True, max_connections=5).pool
+        assert RedisClient.pool_metrics(pool) == {
+            'Redis Pool Max Size': 5,
+            'Redis Connections Created': 0,
+            'Redis Connections Idle': 0,
+        }
@@ -1,6 +1,14 @@
 """Test the TcEx Session Module."""
 # standard library
+import io
 from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+# third-party
+from requests import Session
+
+# first-party
+from tcex.sessions.tc_session import TcSession
 
 # from tcex.sessions.auth.token_auth import TokenAuth
 
@@ -45,3 +53,30 @@ class TestUtils:
         r = tcex_proxy.session_tc.get('/v3/security/owners')
 
         assert r.status_code == 200
+
+    @staticmethod
+    def test_session_tc_401_retry_body(monkeypatch):
+        """Test a 401 is retried with a rewound file object, but not with a consumed iterator."""
+        bodies = []
+
+        def request(self, method, url, **kwargs):  # pylint: disable=unused-argument
+            data = kwargs.get('data')
+            bodies.append(data.read() if hasattr(data, 'read') else b''.join(data))
+            response = MagicMock()
+            response.status_code = 401
+            response.request.url = url
+            return response
+
+        monkeypatch.setattr(Session, 'request', request)
+        session = TcSession(auth=None, base_url='https://localhost')
+
+        # the file object is rewound to the position before the first send
+        fh = io.BytesIO(b'header-content')
+        fh.seek(7)
+        assert session.post('/upload', data=fh).status_code == 401
+        assert bodies == [b'content', b'content']
+
+        # an iterator can only be sent once, so the 401 is not retried
+        bodies.clear()
+        assert session.post('/upload', data=iter([b'one', b'two'])).status_code == 401
+        assert bodies == [b'onetwo']
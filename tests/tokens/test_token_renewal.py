@@ -0,0 +1,111 @@
+"""Test the TcEx Tokens Module."""
+# standard library
+import threading
+import time
+
+# first-party
+from tcex.input.field_types.sensitive import Sensitive, filter_sensitive
+from tcex.tokens import Tokens
+
+
+class TestTokenRenewal:
+    """Test the TcEx Tokens Module."""
+
+    @staticmethod
+    def test_token_renewal_per_key(monkeypatch):
+        """Test expired tokens are renewed concurrently without blocking other keys."""
+        monkeypatch.setenv('TC_TOKEN_SLEEP_INTERVAL', '1')
+
+        renewal_started = threading.Event()
+        renewal_release = threading.Event()
+        renewed = []
+
+        def renew_token(token):
+            renewed.append(token.value)
+            if len(renewed) == 2:
+                renewal_started.set()
+            renewal_release.wait(timeout=10)
+            return {'apiToken': f'{token.value}-renewed', 'apiTokenExpires': time.time() + 3600}
+
+        tokens = Tokens('https://localhost/api')
+        tokens.token_renewal_buffer_time = 0
+        monkeypatch.setattr(tokens, 'renew_token', renew_token)
+
+        results = {}
+
+        def read_token(key):
+            threading.current_thread().name = key
+            results[key] = tokens.token.value
+
+        try:
+            tokens.register_token('expired-1', 'token-1', int(time.time()) - 999)
+            tokens.register_token('expired-2', 'token-2', int(time.time()) - 999)
+            tokens.register_token('valid', 'token-3', int(time.time()) + 3600)
+
+            # both expired tokens are renewed at the same time
+            assert renewal_started.wait(timeout=10)
+
+            # a key that is not being renewed does not wait on the renewal
+            reader = threading.Thread(target=read_token, args=('valid',))
+            reader.start()
+            reader.join(timeout=5)
+            assert results == {'valid': 'token-3'}
+
+            # a key that is being renewed waits for the renewed token
+            reader = threading.Thread(target=read_token, args=('expired-1',))
+            reader.start()
+            time.sleep(0.2)
+            assert reader.is_alive()
+            renewal_release.set()
+            reader.join(timeout=5)
+            assert results['expired-1'] == 'token-1-renewed'
+            assert sorted(renewed) == ['token-1', 'token-2']
+        finally:
+            renewal_release.set()
+            tokens.shutdown = True
+            tokens.monitor_thread.join(timeout=10)
+
+    @staticmethod
+    def test_token_release(monkeypatch):
+        """Test replaced tokens stay masked until they expire and shared tokens stay masked."""
+        monkeypatch.setenv('TC_TOKEN_SLEEP_INTERVAL', '1')
+        registry = filter_sensitive._sensitive_registry  # pylint: disable=protected-access
+
+        renewed = threading.Event()
+
+        def renew_token(token):
+            renewed.set()
+            return {'apiToken': f'{token.value}-renewed', 'apiTokenExpires': time.time() + 3600}
+
+        tokens = Tokens('https://localhost/api')
+        tokens.token_renewal_buffer_time = 0
+        monkeypatch.setattr(tokens, 'renew_token', renew_token)
+
+        try:
+            # the token is within the renewal window, but still valid
+            tokens.register_token('release', 'pytest-release-token', int(time.time()) + 60)
+            assert renewed.wait(timeout=10)
+            tokens.shutdown = True
+            tokens.monitor_thread.join(timeout=10)
+            assert tokens.token_map['release']['token'].value == 'pytest-release-token-renewed'
+
+            # the replaced token is released once it expires
+            assert 'pytest-release-token' in registry
+            tokens._release_replaced_tokens()  # pylint: disable=protected-access
+            assert 'pytest-release-token' in registry
+            tokens._replaced_tokens = [  # pylint: disable=protected-access
+                (token, expires - 3600) for token, expires in tokens._replaced_tokens
+            ]
+            tokens._release_replaced_tokens()  # pylint: disable=protected-access
+            assert 'pytest-release-token' not in registry
+
+            # a token also held by another Sensitive value (e.g., tc_token input) stays masked
+            tc_token = Sensitive('pytest-shared-token')
+            tokens.register_token('shared', tc_token, int(time.time()) + 3600)
+            tokens.unregister_token('shared')
+            assert 'pytest-shared-token' in registry
+            tokens.unregister_token('release')
+            assert 'pytest-release-token-renewed' not in registry
+        finally:
+            tokens.shutdown = True
+            tokens.monitor_thread.join(timeout=10)
@@ -0,0 +1,141 @@
+"""Test the TcEx Utils Module."""
+# third-party
+import pytest
+
+# first-party
+from tcex.utils import Utils
+from tcex.utils.datetime_operations import DatetimeOperations
+
+# common timestamp formats found in threat intel feeds
+FEED_TIMESTAMPS = [
+    '1600000000',
+    '1600000000000',
+    '1600000000.123',
+    '2020-09-13T12:26:40Z',
+    '2020-09-13T12:26:40.123456+00:00',
+    '2020-09-13 12:26:40',
+    'Sun, 13 Sep 2020 12:26:40 +0000',
+    'Sunday, 13-Sep-20 12:26:40 UTC',
+    '09/13/2020',
+    'Sep 13 2020 12:26:40',
+]
+
+
+class TestDatetimeOperations:
+    """Test the TcEx Utils Module."""
+
+    @staticmethod
+    def _any_to_datetime_sequential(value: str):
+        """Return the value parsed by trying each parser in order (original implementation)."""
+        for method in [
+            Utils._parse_default_arrow_formats,
+            Utils._parse_non_default_arrow_formats,
+            Utils._parse_timestamp,
+            Utils._parse_humanized_input,
+            Utils._parse_date_utils,
+        ]:
+            try:
+                return method(value)
+            except Exception:  # nosec
+                pass
+        raise RuntimeError(f'Could not parse {value}.')
+
+    @pytest.mark.parametrize(
+        'value',
+        FEED_TIMESTAMPS
+        + ['-5', '0', '.5', '1e9', '2020', '2020.05', '2020123', '20200101', '22222222', '202001'],
+    )
+    def test_any_to_datetime(self, value: str):
+        """Test the format fast path returns the same datetime as trying each parser in order."""
+        assert Utils.any_to_datetime(value) == self._any_to_datetime_sequential(value)
+
+    @staticmethod
+    def test_any_to_datetime_humanized():
+        """Test humanized values are not cached."""
+        now = Utils.any_to_datetime('now')
+        assert Utils.any_to_datetime('1 hour ago') < now
+        assert Utils.any_to_datetime('in 2 days') > now
+        assert Utils.any_to_datetime('now') >= now
+
+    @staticmethod
+    def test_any_to_datetime_invalid():
+        """Test an invalid value raises."""
+        with pytest.raises(RuntimeError):
+            Utils.any_to_datetime('not a date')
+
+    @staticmethod
+    def test_any_to_datetime_many():
+        """Test parsing a list of values with repeated values and a timezone."""
+        values = ['1600000000', '2020-09-13T12:26:40Z', '1600000000', 1600000000]
+        results = Utils.any_to_datetime_many(values, tz='US/Eastern')
+        assert len(results) == 4
+        assert len({r.isoformat() for r in results}) == 1
+        assert results[0].isoformat() == '2020-09-13T08:26:40-04:00'
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        'value,parsers',
+        [
+            ('1600000000', ['_parse_timestamp']),
+            ('1600000000.123', ['_parse_timestamp']),
+            ('-5', ['_parse_timestamp']),
+            (
+                '2020',
+                [
+                    '_parse_default_arrow_formats',
+                    '_parse_non_default_arrow_formats',
+                    '_parse_timestamp',
+                ],
+            ),
+            (
+                '2020-09-13T12:26:40Z',
+                [
+                    '_parse_default_arrow_formats',
+                    '_parse_non_default_arrow_formats',
+                    '_parse_timestamp',
+                ],
+            ),
+            (
+                'Sun, 13 Sep 2020 12:26:40 +0000',
+                ['_parse_non_default_arrow_formats', '_parse_timestamp'],
+            ),
+            ('1 hour ago', []),
+            ('now', []),
+        ],
+    )
+    def test_any_to_datetime_format_parsers(value: str, parsers: list):
+        """Test parsers that can not parse the shape of the value are skipped."""
+        assert [p.__name__ for p in Utils._format_parsers(value)] == parsers
+
+    @staticmethod
+    def test_any_to_datetime_skipped_parsers(monkeypatch):
+        """Test a timestamp is parsed without calling the arrow format parsers."""
+        calls = []
+
+        def _parser(value: str):
+            calls.append(value)
+            raise ValueError(value)
+
+        monkeypatch.setattr(
+            DatetimeOperations, '_parse_default_arrow_formats', staticmethod(_parser)
+        )
+        monkeypatch.setattr(
+            DatetimeOperations, '_parse_non_default_arrow_formats', staticmethod(_parser)
+        )
+        Utils._parse_formats.cache_clear()
+        try:
+            assert Utils.any_to_datetime('1600000000').int_timestamp == 1600000000
+            assert not calls
+        finally:
+            Utils._parse_formats.cache_clear()
+
+    @staticmethod
+    def test_any_to_datetime_cached():
+        """Test repeated values are only parsed once."""
+        Utils._parse_formats.cache_clear()
+        Utils.any_to_datetime_many(FEED_TIMESTAMPS + FEED_TIMESTAMPS)
+        for value in FEED_TIMESTAMPS:
+            Utils.any_to_datetime(value)
+        cache_info = Utils._parse_formats.cache_info()
+        assert cache_info.misses == len(FEED_TIMESTAMPS)
+        assert cache_info.hits == len(FEED_TIMESTAMPS)
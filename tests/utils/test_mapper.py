@@ -0,0 +1,68 @@
+"""Test the TcEx Utils Module."""
+# third-party
+import pytest
+
+# first-party
+from tcex.utils import Utils
+
+
+class TestMapper:
+    """Test the TcEx Utils Module."""
+
+    mapping = {
+        'name': '@.summary',
+        'type': 'Host',
+        'rating': 3,
+        'first_tag': '@.tags[0]',
+        'tags': ['feed', '@.category', {'name': '@.source.name'}],
+        'source': {'name': '@.source.name', 'missing': '@.source.missing.value'},
+    }
+
+    def test_compile_mapping(self):
+        """Test a compiled mapping applied to a stream of records."""
+        map_record = Utils.compile_mapping(self.mapping)
+        records = [
+            {
+                'summary': f'bad{i}.com',
+                'category': 'malware',
+                'source': {'name': 'feed'},
+                'tags': ['one'],
+            }
+            for i in range(3)
+        ]
+        results = [map_record(r) for r in records]
+        assert results[2] == {
+            'name': 'bad2.com',
+            'type': 'Host',
+            'rating': 3,
+            'first_tag': 'one',
+            'tags': ['feed', 'malware', {'name': 'feed'}],
+            'source': {'name': 'feed', 'missing': None},
+        }
+
+        # each record is mapped into new objects
+        assert results[0]['tags'] is not results[1]['tags']
+
+        # field paths on a value that is not an object return None, the same as jmespath
+        assert map_record({'source': 'feed'})['source'] == {'name': None, 'missing': None}
+
+    def test_mapper(self):
+        """Test mapper with a single record and a list of records."""
+        assert list(Utils().mapper({'summary': 'bad.com'}, {'name': '@.summary'})) == [
+            {'name': 'bad.com'}
+        ]
+        results = list(Utils().mapper([{'summary': 'a'}, {'summary': 'b'}], self.mapping))
+        assert [r['name'] for r in results] == ['a', 'b']
+
+    @staticmethod
+    def test_mapper_invalid():
+        """Test invalid expressions and search failures raise."""
+        with pytest.raises(RuntimeError):
+            Utils.compile_mapping({'name': '@.['})
+
+        map_record = Utils.compile_mapping({'value': '@ | abs(@)'})
+        with pytest.raises(RuntimeError):
+            map_record({'value': 'not a number'})
+
+        with pytest.raises(RuntimeError):
+            list(Utils().mapper({'summary': 'bad.com'}, {'value': '@.summary | abs(@)'}))